@@ -0,0 +1,44 @@
+"""Compares CollectionField of IntField with ArrayField (batch normalisation
+into array), then dumps of loaded values (list vs buffer).
+
+    python -m benchmarks.bench_array_field
+"""
+from python_schema import field
+
+from benchmarks.harness import per_op, show, show_speedup
+
+
+ROUNDS = 20
+
+PAYLOAD = [str(idx) for idx in range(10000)]
+
+
+def load(schema):
+    instance = schema.make_new()
+    instance.loads(PAYLOAD)
+
+    return instance.as_python()
+
+
+def main():
+    collection = field.CollectionField('samples', field.IntField)
+    array_ = field.ArrayField('samples')
+
+    assert load(collection) == load(array_)
+
+    slow = per_op(lambda: load(collection), ROUNDS)
+    fast = per_op(lambda: load(array_), ROUNDS)
+
+    show('CollectionField', slow, 'ms/op')
+    show('ArrayField', fast, 'ms/op')
+    show_speedup(slow, fast)
+
+    loaded = array_.make_new()
+    loaded.loads(PAYLOAD)
+
+    show('as_python', per_op(loaded.as_python, ROUNDS), 'us/op')
+    show('as_buffer', per_op(loaded.as_buffer, ROUNDS), 'us/op')
+
+
+if __name__ == '__main__':
+    main()
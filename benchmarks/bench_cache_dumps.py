@@ -0,0 +1,49 @@
+"""Compares repeated `as_json` of loaded schema with and without
+`cache_dumps` (the same schema dumped for logging, response and audit).
+
+    python -m benchmarks.bench_cache_dumps
+"""
+from python_schema import field
+
+from benchmarks.harness import per_op, show, show_speedup
+from benchmarks.schemas import Record, records
+
+
+ROUNDS = 20
+
+# how many times the same loaded schema is dumped
+DUMPS = 3
+
+
+class Export(field.SchemaField):
+    fields = [
+        field.StrField('name'),
+        field.CollectionField('records', Record),
+    ]
+
+
+def main():
+    payload = {'name': 'export', 'records': records(1000)}
+
+    timings = {}
+
+    for cache_dumps in (False, True):
+        instance = Export(cache_dumps=cache_dumps)
+        instance.loads(payload)
+
+        def dumps(instance=instance):
+            # a change invalidates the cache, every round starts cold
+            instance['name'].value = 'export'
+
+            for _ in range(DUMPS):
+                instance.as_json()
+
+        timings[cache_dumps] = per_op(dumps, ROUNDS)
+
+    show(f'as_json x {DUMPS}', timings[False], 'ms')
+    show('cached', timings[True], 'ms')
+    show_speedup(timings[False], timings[True])
+
+
+if __name__ == '__main__':
+    main()
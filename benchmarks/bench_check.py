@@ -0,0 +1,28 @@
+"""Compares `.load` (result tree is thrown away) with validate-only `.check`.
+
+    python -m benchmarks.bench_check
+"""
+from benchmarks.harness import peak, per_op, show, show_speedup
+from benchmarks.schemas import BLOG, Blog
+
+
+ROUNDS = 200
+
+
+def main():
+    schema = Blog()
+
+    assert schema.check(BLOG) is None
+
+    load = per_op(lambda: schema.load(BLOG), ROUNDS)
+    check = per_op(lambda: schema.check(BLOG), ROUNDS)
+
+    show('load', load, 'us/op')
+    show('check', check, 'us/op')
+    show_speedup(load, check)
+    show('peak load', peak(lambda: schema.load(BLOG)), 'B')
+    show('peak check', peak(lambda: schema.check(BLOG)), 'B')
+
+
+if __name__ == '__main__':
+    main()
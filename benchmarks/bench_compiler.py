@@ -0,0 +1,37 @@
+"""Compares interpreted loads of wide, flat schema with compiled loader.
+
+    python -m benchmarks.bench_compiler
+"""
+from python_schema import compiler
+
+from benchmarks.harness import per_op, show, show_speedup
+from benchmarks.schemas import Wide, wide_payload
+
+
+ROUNDS = 500
+
+PAYLOAD = wide_payload()
+
+
+def interpreted():
+    schema = Wide()
+    schema.loads(PAYLOAD)
+
+    return schema.as_python()
+
+
+def main():
+    loader = compiler.compile_loader(Wide)
+
+    assert loader(PAYLOAD) == interpreted()
+
+    slow = per_op(interpreted, ROUNDS)
+    fast = per_op(lambda: loader(PAYLOAD), ROUNDS)
+
+    show('interpreted', slow, 'us/op')
+    show('compiled', fast, 'us/op')
+    show_speedup(slow, fast)
+
+
+if __name__ == '__main__':
+    main()
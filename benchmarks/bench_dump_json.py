@@ -0,0 +1,45 @@
+"""Compares `json.dumps(field.as_json())` of large collection with
+`.dump_json(fp)` (JSON written in chunks, nothing is built as a whole).
+
+    python -m benchmarks.bench_dump_json
+"""
+import json
+
+from python_schema import field
+
+from benchmarks.harness import peak, per_op, show
+from benchmarks.schemas import Record, records
+
+
+ROUNDS = 5
+
+
+class Sink:
+    """File-like object that drops everything, only serialisation is
+    measured.
+    """
+
+    def write(self, chunk):
+        pass
+
+
+def main():
+    instance = field.CollectionField('records', Record)
+    instance.loads(records(20000))
+
+    assert ''.join(instance.iter_json()) == json.dumps(instance.as_json())
+
+    def whole():
+        Sink().write(json.dumps(instance.as_json()))
+
+    def streamed():
+        instance.dump_json(Sink())
+
+    show('json.dumps(as_json)', per_op(whole, ROUNDS), 'ms/op')
+    show('dump_json', per_op(streamed, ROUNDS), 'ms/op')
+    show('peak as_json', peak(whole), 'MB')
+    show('peak dump_json', peak(streamed), 'MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Compares loading of a payload full of big invalid values with rendering
+of messages of its errors (which used to happen while loading).
+
+    python -m benchmarks.bench_errors
+"""
+from python_schema import exception, field
+
+from benchmarks.harness import per_op, show
+
+
+ROUNDS = 20
+
+
+def main():
+    # every element is a big value that isn't a number
+    payload = ['x' * 100_000] * 1000
+
+    numbers = field.CollectionField('numbers', field.IntField)
+
+    def load():
+        try:
+            numbers.loads(payload)
+        except exception.PayloadError as err:
+            return err
+
+        raise AssertionError('payload should not load')
+
+    err = load()
+
+    def render():
+        return str(err)
+
+    show('load', per_op(load, ROUNDS), 'ms')
+    show('render messages', per_op(render, ROUNDS), 'ms')
+
+
+if __name__ == '__main__':
+    main()
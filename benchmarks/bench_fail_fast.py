@@ -0,0 +1,38 @@
+"""Compares rejection of corrupt payload with and without fail_fast.
+
+    python -m benchmarks.bench_fail_fast
+"""
+from python_schema import exception, field
+
+from benchmarks.harness import per_op, show, show_speedup
+
+
+ROUNDS = 5
+
+# every element is invalid
+PAYLOAD = [f'corrupt {idx}' for idx in range(100000)]
+
+
+def reject(schema):
+    try:
+        schema.make_new().loads(PAYLOAD)
+    except exception.PayloadError:
+        return
+
+    raise AssertionError('Payload should be rejected')
+
+
+def main():
+    full = field.CollectionField('ids', field.IntField)
+    fast = field.CollectionField('ids', field.IntField, fail_fast=True)
+
+    slow = per_op(lambda: reject(full), ROUNDS)
+    quick = per_op(lambda: reject(fast), ROUNDS)
+
+    show('every error', slow, 'ms/op')
+    show('fail_fast', quick, 'ms/op')
+    show_speedup(slow, quick)
+
+
+if __name__ == '__main__':
+    main()
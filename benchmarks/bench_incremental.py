@@ -0,0 +1,73 @@
+"""Compares `json.loads` followed by `.load_python` of large JSON document
+with `.loads_json` (parsed and validated incrementally). Documents are
+written to temporary files, peak memory includes reading of the file.
+
+    python -m benchmarks.bench_incremental
+"""
+import json
+import tempfile
+
+from python_schema import field
+
+from benchmarks.harness import peak, show, timed
+
+
+TOTAL = 50000
+
+WIDTH = 24
+
+
+class Record(field.SchemaField):
+    fields = [
+        field.IntField('id'),
+        field.StrField('name'),
+        field.CollectionField('tags', field.StrField),
+    ]
+
+
+def document():
+    return json.dumps([{
+        'id': str(idx),
+        'name': f'John {idx}',
+        'tags': ['a', 'b'],
+        # ignored by schema, kept by json.loads
+        'comment': 'Lorem ipsum dolor sit amet ' * 4,
+    } for idx in range(TOTAL)])
+
+
+def main():
+    schema = field.CollectionField(
+        'records', Record(exception_on_unknown=False))
+
+    with tempfile.NamedTemporaryFile('w', suffix='.json') as fp:
+        fp.write(document())
+        fp.flush()
+
+        def whole():
+            with open(fp.name, 'rb') as source:
+                return schema.load_python(json.load(source))
+
+        def incremental():
+            with open(fp.name, 'rb') as source:
+                return schema.loads_json(source)
+
+        # warm-up, loaders are compiled once
+        schema.load_python([])
+        schema.loads_json('[]')
+
+        expected, slow = timed(whole)
+        result, fast = timed(incremental)
+
+        slow_peak = peak(whole)
+        fast_peak = peak(incremental)
+
+    assert result == expected
+
+    show('json.load + load_python', slow, 'ms', WIDTH)
+    show('loads_json', fast, 'ms', WIDTH)
+    show('peak json.load', slow_peak, 'MB', WIDTH)
+    show('peak loads_json', fast_peak, 'MB', WIDTH)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Compares eager and lazy SchemaField when only top-level keys are read.
+
+    python -m benchmarks.bench_lazy_schema
+"""
+from python_schema import field
+
+from benchmarks.harness import per_op, show, show_speedup
+
+
+ROUNDS = 200
+
+
+class Item(field.SchemaField):
+    fields = [
+        field.IntField('id'),
+        field.StrField('name'),
+    ]
+
+
+class Document(field.SchemaField):
+    fields = [
+        field.IntField('id'),
+        field.StrField('title'),
+        field.CollectionField('items', Item),
+        field.CollectionField('related', Item),
+    ]
+
+
+PAYLOAD = {
+    'id': 1,
+    'title': 'Document',
+    'items': [{'id': idx, 'name': f'Item {idx}'} for idx in range(100)],
+    'related': [{'id': idx, 'name': f'Item {idx}'} for idx in range(100)],
+}
+
+
+def read(schema):
+    document = schema.make_new()
+    document.loads(PAYLOAD)
+
+    return document['title'].value
+
+
+def main():
+    eager = Document()
+    lazy = Document(lazy=True)
+
+    assert read(eager) == read(lazy)
+
+    slow = per_op(lambda: read(eager), ROUNDS)
+    fast = per_op(lambda: read(lazy), ROUNDS)
+
+    show('eager', slow, 'us/op')
+    show('lazy', fast, 'us/op')
+    show_speedup(slow, fast)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""Compares `.loads` followed by `.as_python` of nested schema with
+`.load_python` (no tree of field instances).
+
+    python -m benchmarks.bench_load_python
+"""
+from benchmarks.harness import peak, per_op, show, show_speedup
+from benchmarks.schemas import BLOG, Blog
+
+
+ROUNDS = 200
+
+
+def interpreted():
+    schema = Blog()
+    schema.loads(BLOG)
+
+    return schema.as_python()
+
+
+def main():
+    schema = Blog()
+
+    assert schema.load_python(BLOG) == interpreted()
+
+    slow = per_op(interpreted, ROUNDS)
+    fast = per_op(lambda: schema.load_python(BLOG), ROUNDS)
+
+    show('loads + as_python', slow, 'us/op')
+    show('load_python', fast, 'us/op')
+    show_speedup(slow, fast)
+    show('peak loads', peak(interpreted), 'B')
+    show('peak load_python', peak(lambda: schema.load_python(BLOG)), 'B')
+
+
+if __name__ == '__main__':
+    main()
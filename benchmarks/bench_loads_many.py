@@ -0,0 +1,64 @@
+"""Compares `loads_many` with naive loop calling `.loads` per record.
+
+    python -m benchmarks.bench_loads_many
+"""
+from python_schema import exception, field
+
+from benchmarks.harness import per_op, show, show_speedup
+
+
+RECORDS = 10000
+
+
+class User(field.SchemaField):
+    fields = [
+        field.StrField('name'),
+        field.StrField('last_name'),
+        field.IntField('age'),
+        field.CollectionField('tags', field.StrField),
+    ]
+
+
+PAYLOADS = [{
+    'name': f'John {idx}',
+    'last_name': 'Doe',
+    # every 10th record is invalid
+    'age': 'unknown' if idx % 10 == 0 else str(idx % 100),
+    'tags': ['a', 'b'],
+} for idx in range(RECORDS)]
+
+
+def naive():
+    loaded = {}
+    errors = {}
+
+    for idx, payload in enumerate(PAYLOADS):
+        user = User()
+
+        try:
+            user.loads(payload)
+        except exception.PayloadError:
+            errors[idx] = user.error_records
+
+            continue
+
+        loaded[idx] = user
+
+    return loaded, errors
+
+
+def batch():
+    return User().loads_many(PAYLOADS)
+
+
+def main():
+    slow = per_op(naive, 1, repeat=5)
+    fast = per_op(batch, 1, repeat=5)
+
+    show('naive loop', slow / RECORDS, 'us/record')
+    show('loads_many', fast / RECORDS, 'us/record')
+    show_speedup(slow, fast)
+
+
+if __name__ == '__main__':
+    main()
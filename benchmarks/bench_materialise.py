@@ -0,0 +1,66 @@
+"""Measures cost of materialisation of recursive Book/Author schemas.
+
+Cold run forgets all compiled plans before every iteration (that is what each
+instance used to pay), warm run reuses plans compiled during warm-up.
+
+    python -m benchmarks.bench_materialise
+"""
+from python_schema import plan
+
+from benchmarks.harness import per_op, show
+from benchmarks.schemas import Author, Book
+
+
+ROUNDS = 2000
+
+PAYLOAD = {
+    'title': 'Chapter I',
+    'author': {
+        'name': 'drachenfels',
+        'books': [{'title': f'Chapter {idx}'} for idx in range(20)],
+        'home_address': {
+            'postcode': 'aaa1',
+            'street': 'st. James',
+        },
+        'publisher_address': {
+            'postcode': 'ccc1',
+            'street': 'st. George',
+        },
+    },
+}
+
+
+def materialise_cold():
+    plan.clear()
+
+    Book().materialise()
+    Author().materialise()
+
+
+def materialise_warm():
+    Book().materialise()
+    Author().materialise()
+
+
+def loads_cold():
+    plan.clear()
+
+    Book().loads(PAYLOAD)
+
+
+def loads_warm():
+    Book().loads(PAYLOAD)
+
+
+def main():
+    # warm-up, compiles plans for all the schemas in use
+    loads_warm()
+
+    show('materialise cold', per_op(materialise_cold, ROUNDS), 'us/op')
+    show('materialise warm', per_op(materialise_warm, ROUNDS), 'us/op')
+    show('loads cold', per_op(loads_cold, ROUNDS), 'us/op')
+    show('loads warm', per_op(loads_warm, ROUNDS), 'us/op')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Compares `load_python` of rows repeating the same sub-document with and
+without memoisation of the sub-document (then rows that never repeat).
+
+    python -m benchmarks.bench_memo
+"""
+from python_schema import field, memo
+
+from benchmarks.harness import per_op, show, show_speedup
+
+
+ROUNDS = 20
+
+
+@memo.pure
+def is_iban(value):
+    """Checksum of IBAN (mod 97), it's what makes loading expensive.
+    """
+    value = value.replace(' ', '')
+    digits = ''.join(
+        str(int(char, 36)) for char in value[4:] + value[:4])
+
+    return True if int(digits) % 97 == 1 else f'Invalid IBAN: {value}'
+
+
+def address(cache):
+    return field.SchemaField('address', fields=[
+        field.StrField('street'),
+        field.StrField('city'),
+        field.StrField('iban', validators=[is_iban]),
+        field.CollectionField('lines', field.StrField),
+    ], memo=cache)
+
+
+def rows(cache):
+    return field.CollectionField('rows', field.SchemaField('row', fields=[
+        field.IntField('id'),
+        address(cache),
+    ]))
+
+
+# 10 distinct addresses shared by 2000 rows
+PAYLOAD = [{
+    'id': idx,
+    'address': {
+        'street': f'{idx % 10} Baker st.',
+        'city': 'London',
+        'iban': 'GB82 WEST 1234 5698 7654 32',
+        'lines': ['Flat 1', 'Floor 2'],
+    },
+} for idx in range(2000)]
+
+
+def main():
+    cache = memo.Cache(maxsize=100)
+
+    plain = rows(None)
+    memoised = rows(cache)
+
+    assert plain.load_python(PAYLOAD) == memoised.load_python(PAYLOAD)
+
+    slow = per_op(lambda: plain.load_python(PAYLOAD), ROUNDS)
+    fast = per_op(lambda: memoised.load_python(PAYLOAD), ROUNDS)
+
+    show('no memo', slow, 'ms/op')
+    show('memo', fast, 'ms/op')
+    show_speedup(slow, fast)
+    print(f'{"cache":<20} {cache.stats()}')
+
+    # distinct payloads only pay for the lookup
+    distinct = [dict(row, address=dict(row['address'], street=str(idx)))
+                for idx, row in enumerate(PAYLOAD)]
+
+    cache.clear()
+
+    show('no memo, distinct', per_op(
+        lambda: plain.load_python(distinct), ROUNDS), 'ms/op')
+    show('memo, distinct', per_op(
+        lambda: memoised.load_python(distinct), ROUNDS), 'ms/op')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Measures memory allocated per loaded record of CollectionField.
+
+    python -m benchmarks.bench_memory
+"""
+from python_schema import field
+
+from benchmarks.harness import retained, show
+
+
+RECORDS = 10000
+
+
+ROW = field.SchemaField('row', fields=[
+    field.IntField('id'),
+    field.StrField('name'),
+    field.StrField('email'),
+    field.IntField('age'),
+    field.CollectionField('tags', field.StrField),
+])
+
+
+PAYLOAD = [{
+    'id': idx,
+    'name': f'John {idx}',
+    'email': f'john.{idx}@example.com',
+    'age': idx % 100,
+    'tags': ['a', 'b'],
+} for idx in range(RECORDS)]
+
+
+def main():
+    schema = field.CollectionField('rows', ROW)
+
+    # warm-up, plans and prototypes are not part of the measurement
+    schema.loads(PAYLOAD[:1])
+
+    current = retained(lambda: schema.loads(PAYLOAD))
+
+    print(f'{"records":<20} {RECORDS:10}')
+    show('per record', current / RECORDS, 'B')
+
+
+if __name__ == '__main__':
+    main()
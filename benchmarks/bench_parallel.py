@@ -0,0 +1,47 @@
+"""Compares single process `loads_many` with `parallel.loads_many`.
+
+    python -m benchmarks.bench_parallel
+"""
+import os
+
+from python_schema import field, parallel
+
+from benchmarks.harness import show, show_speedup, timed
+
+
+RECORDS = 100000
+
+WIDTH = 30
+
+
+class User(field.SchemaField):
+    fields = [
+        field.StrField('name'),
+        field.StrField('last_name'),
+        field.IntField('age'),
+        field.CollectionField('scores', field.IntField),
+    ]
+
+
+PAYLOADS = [{
+    'name': f'John {idx}',
+    'last_name': 'Doe',
+    'age': str(idx % 100),
+    'scores': list(range(10)),
+} for idx in range(RECORDS)]
+
+
+def main():
+    workers = os.cpu_count() or 1
+
+    _, single = timed(lambda: User().loads_many(PAYLOADS))
+    _, multi = timed(lambda: parallel.loads_many(
+        User, PAYLOADS, max_workers=workers))
+
+    show('loads_many', single, 's', WIDTH)
+    show(f'parallel ({workers} workers)', multi, 's', WIDTH)
+    show_speedup(single, multi, WIDTH)
+
+
+if __name__ == '__main__':
+    main()
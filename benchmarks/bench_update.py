@@ -0,0 +1,70 @@
+"""Compares full reload of large document with partial `.update`.
+
+    python -m benchmarks.bench_update
+"""
+from python_schema import field
+
+from benchmarks.harness import per_op, show, show_speedup
+
+
+ROUNDS = 50
+
+
+class Item(field.SchemaField):
+    fields = [
+        field.IntField('id'),
+        field.StrField('name'),
+    ]
+
+
+class Document(field.SchemaField):
+    # required by update
+    keep_payload = True
+
+    fields = [
+        field.StrField('title'),
+        field.SchemaField('owner', fields=[
+            field.StrField('name'),
+            field.StrField('email'),
+        ]),
+        field.CollectionField('items', Item),
+    ]
+
+
+PAYLOAD = {
+    'title': 'Document',
+    'owner': {'name': 'John', 'email': 'john@example.com'},
+    'items': [{'id': idx, 'name': f'Item {idx}'} for idx in range(500)],
+}
+
+PARTIAL = {'title': 'Other', 'owner': {'email': 'doe@example.com'}}
+
+
+def reload(document):
+    merged = dict(PAYLOAD, title=PARTIAL['title'], owner=dict(
+        PAYLOAD['owner'], **PARTIAL['owner']))
+
+    document.loads(merged)
+
+
+def main():
+    document = Document()
+    document.loads(PAYLOAD)
+
+    document.update(PARTIAL)
+
+    expected = Document()
+    reload(expected)
+
+    assert document.as_python() == expected.as_python()
+
+    slow = per_op(lambda: reload(document), ROUNDS)
+    fast = per_op(lambda: document.update(PARTIAL), ROUNDS)
+
+    show('full reload', slow, 'us/op')
+    show('update', fast, 'us/op')
+    show_speedup(slow, fast)
+
+
+if __name__ == '__main__':
+    main()
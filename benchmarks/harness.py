@@ -0,0 +1,74 @@
+"""Measurements shared by benchmarks: time per operation, peak (or
+retained) memory and printing of results in common format.
+"""
+import time
+import timeit
+import tracemalloc
+
+
+# results are given in seconds (or bytes), they are printed in unit of the
+# line (only the part before `/` counts, `us/op` is scaled as `us`)
+SCALES = {'s': 1, 'ms': 1e3, 'us': 1e6, 'B': 1, 'MB': 2 ** -20}
+
+WIDTH = 20
+
+
+def per_op(function, number, repeat=1):
+    """Returns seconds per call of function, the best of `repeat` runs of
+    `number` calls (the least disturbed by other processes).
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def timed(function):
+    """Returns result of the function and how long (in seconds) single call
+    took, meant for runs too long to be repeated.
+    """
+    started = time.perf_counter()
+
+    result = function()
+
+    return result, time.perf_counter() - started
+
+
+def peak(function):
+    """Returns peak of memory (in bytes) allocated while function runs, it's
+    traced separately from timing (tracing slows everything down).
+    """
+    tracemalloc.start()
+
+    try:
+        function()
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def retained(function):
+    """Returns memory (in bytes) allocated by function and still in use once
+    it returns.
+    """
+    tracemalloc.start()
+
+    try:
+        function()
+
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def show(label, value, unit, width=WIDTH):
+    """Prints one line of results scaled to the unit (`ms/op`, `us/record`,
+    `MB`, ...), `B` are printed without decimals.
+    """
+    value *= SCALES.get(unit.split('/')[0], 1)
+
+    precision = 0 if unit == 'B' else 2
+
+    print(f'{label:<{width}} {value:10.{precision}f} {unit}')
+
+
+def show_speedup(slow, fast, width=WIDTH):
+    show('speedup', slow / fast, 'x', width)
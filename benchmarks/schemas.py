@@ -0,0 +1,112 @@
+"""Schemas shared by benchmarks (and payloads generated for them).
+"""
+from python_schema import field
+
+
+class Address(field.SchemaField):
+    fields = [
+        field.StrField('postcode'),
+        field.StrField('street'),
+    ]
+
+
+class BusinessAddress(Address):
+    fields = [
+        field.StrField('letterbox'),
+    ]
+
+
+class Book(field.SchemaField):
+    fields = [
+        field.StrField('title'),
+        field.SchemaField('author', 'benchmarks.schemas.Author'),
+    ]
+
+
+class Author(field.SchemaField):
+    fields = [
+        field.StrField('name'),
+        field.CollectionField(
+            'books', field.SchemaField('book', 'benchmarks.schemas.Book')),
+        field.SchemaField('home_address', Address),
+        field.SchemaField('secret_address', Address()),
+        field.SchemaField(
+            'office_address', 'benchmarks.schemas.BusinessAddress'),
+        BusinessAddress('publisher_address'),
+    ]
+
+
+# number of fields of each type in Wide
+WIDTH = 50
+
+
+class Wide(field.SchemaField):
+    fields = [
+        field.IntField(f'int_{idx}') for idx in range(WIDTH)
+    ] + [
+        field.StrField(f'str_{idx}') for idx in range(WIDTH)
+    ]
+
+
+def wide_payload():
+    return dict(
+        [(f'int_{idx}', str(idx)) for idx in range(WIDTH)] +
+        [(f'str_{idx}', idx) for idx in range(WIDTH)]
+    )
+
+
+class Record(field.SchemaField):
+    fields = [
+        field.IntField('id'),
+        field.StrField('name'),
+        field.StrField('email'),
+        field.CollectionField('tags', field.StrField),
+    ]
+
+
+def records(total):
+    return [{
+        'id': str(idx),
+        'name': f'John {idx}',
+        'email': f'john.{idx}@example.com',
+        'tags': ['a', 'b'],
+    } for idx in range(total)]
+
+
+class Comment(field.SchemaField):
+    fields = [
+        field.StrField('author'),
+        field.StrField('body'),
+        field.IntField('likes'),
+    ]
+
+
+class Post(field.SchemaField):
+    fields = [
+        field.IntField('id'),
+        field.StrField('title'),
+        field.CollectionField('tags', field.StrField),
+        field.CollectionField('comments', Comment),
+    ]
+
+
+class Blog(field.SchemaField):
+    fields = [
+        field.StrField('name'),
+        field.CollectionField('posts', Post),
+    ]
+
+
+BLOG = {
+    'name': 'Blog',
+    'posts': [{
+        'id': str(idx),
+        'title': f'Post {idx}',
+        'tags': ['a', 'b', 'c'],
+        'comments': [{
+            'author': f'User {num}',
+            'body': 'Lorem ipsum',
+            'likes': num,
+        } for num in range(5)],
+    } for idx in range(20)],
+}
@@ -0,0 +1,233 @@
+"""Benchmark suite of core load/dump hot paths.
+
+Every case is timed a few times, the best time per operation is reported
+(the least disturbed by other processes). Results are printed as JSON and can
+be compared with stored baseline:
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json
+
+With baseline, comparison is printed to stderr and exit code is 1 if any case
+got slower than tolerance allows. See also `make benchmarks`.
+"""
+import argparse
+import json
+import platform
+import sys
+
+from python_schema import exception, field
+
+from benchmarks.harness import per_op
+from benchmarks.schemas import Book, Record, Wide, records, wide_payload
+
+
+# default allowed slowdown compared to baseline (0.3 means 30% slower)
+TOLERANCE = 0.3
+
+REPEAT = 10
+
+
+def deep_schema(depth):
+    schema = field.SchemaField('level', fields=[field.IntField('value')])
+
+    for _ in range(depth):
+        schema = field.SchemaField('level', fields=[
+            field.IntField('value'),
+            schema,
+        ])
+
+    return schema
+
+
+def deep_payload(depth):
+    payload = {'value': depth}
+
+    for idx in reversed(range(depth)):
+        payload = {'value': idx, 'level': payload}
+
+    return payload
+
+
+def loads(schema, payload):
+    def run():
+        instance = schema.make_new()
+        instance.loads(payload)
+
+    return run
+
+
+def rejects(schema, payload):
+    def run():
+        try:
+            schema.make_new().loads(payload)
+        except exception.PayloadError:
+            return
+
+        raise AssertionError('Payload should be rejected')
+
+    return run
+
+
+def loaded(schema, payload):
+    instance = schema.make_new()
+    instance.loads(payload)
+
+    return instance
+
+
+def flat_wide():
+    return loads(Wide(), wide_payload()), 200
+
+
+def deep_nesting():
+    return loads(deep_schema(30), deep_payload(30)), 200
+
+
+def large_collection():
+    schema = field.CollectionField('records', Record)
+
+    return loads(schema, records(2000)), 2
+
+
+def recursive_schemas():
+    payload = {
+        'title': 'Chapter I',
+        'author': {
+            'name': 'drachenfels',
+            'books': [{'title': f'Chapter {idx}'} for idx in range(20)],
+            'home_address': {'postcode': 'aaa1', 'street': 'st. James'},
+            'publisher_address': {'postcode': 'ccc1', 'letterbox': '12'},
+        },
+    }
+
+    return loads(Book(), payload), 100
+
+
+def error_heavy():
+    schema = field.CollectionField('records', Record)
+
+    payload = [{'id': f'id {idx}', 'tags': 12} for idx in range(2000)]
+
+    return rejects(schema, payload), 2
+
+
+def dump_as_json():
+    instance = loaded(field.CollectionField('records', Record), records(2000))
+
+    return instance.as_json, 5
+
+
+def dump_as_python():
+    instance = loaded(field.CollectionField('records', Record), records(2000))
+
+    return instance.as_python, 5
+
+
+CASES = {
+    'flat_wide': flat_wide,
+    'deep_nesting': deep_nesting,
+    'large_collection': large_collection,
+    'recursive_schemas': recursive_schemas,
+    'error_heavy': error_heavy,
+    'dump_as_json': dump_as_json,
+    'dump_as_python': dump_as_python,
+}
+
+
+def measure(case):
+    function, number = CASES[case]()
+
+    # warm-up, plans and prototypes are compiled once
+    function()
+
+    return {
+        'seconds_per_op': per_op(function, number, repeat=REPEAT),
+        'number': number,
+        'repeat': REPEAT,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Returns list of lines describing results relative to the baseline and
+    names of cases that are slower than tolerance allows.
+    """
+    lines = []
+    regressions = []
+
+    for case, result in results['cases'].items():
+        try:
+            expected = baseline['cases'][case]['seconds_per_op']
+        except KeyError:
+            lines.append(f'{case:<20} {"no baseline":>10}')
+
+            continue
+
+        ratio = result['seconds_per_op'] / expected
+
+        if ratio > 1 + tolerance:
+            regressions.append(case)
+
+        lines.append(f'{case:<20} {ratio:10.2f} x baseline')
+
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'cases', nargs='*', metavar='case',
+        help='cases to run, one of: {} (default: all)'.format(
+            ', '.join(CASES)))
+    parser.add_argument('--output', help='write JSON results to a file')
+    parser.add_argument('--baseline', help='JSON results to compare with')
+    parser.add_argument(
+        '--tolerance', type=float, default=TOLERANCE,
+        help='allowed slowdown compared to baseline (default: %(default)s)')
+
+    args = parser.parse_args(argv)
+
+    unknown = set(args.cases).difference(CASES)
+
+    if unknown:
+        parser.error('unknown case(s): {}'.format(', '.join(sorted(unknown))))
+
+    results = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'cases': {
+            case: measure(case) for case in (args.cases or CASES)
+        },
+    }
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            fp.write(output + '\n')
+    else:
+        print(output)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)
+
+    lines, regressions = compare(results, baseline, args.tolerance)
+
+    for line in lines:
+        print(line, file=sys.stderr)
+
+    if regressions:
+        print(
+            'Slower than baseline: {}'.format(', '.join(regressions)),
+            file=sys.stderr)
+
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
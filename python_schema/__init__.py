@@ -1,3 +1,11 @@
 from . import misc  # NOQA
+from . import plan  # NOQA
+from . import registry  # NOQA
 from . import exception  # NOQA
 from . import field  # NOQA
+from . import instrument  # NOQA
+from . import memo  # NOQA
+from . import compiler  # NOQA
+from . import incremental  # NOQA
+from . import stream  # NOQA
+from . import parallel  # NOQA
@@ -0,0 +1,555 @@
+"""Compiler of SchemaField into specialised (generated) python function.
+
+Generated loader does exactly what `schema.loads(payload)` followed by
+`schema.as_python()` would do, but in straight-line code, without creating
+field instance for every key and every element of collection. Exceptions
+(types and messages) are the same as in the interpreted path, thus loader can
+be swapped in transparently:
+
+    load_user = compiler.compile_loader(User)
+
+    data = load_user(payload)
+
+Fields which behaviour was customised (any of the loading/dumping methods was
+overridden) are not inlined, generated code falls back to the interpreted path
+for them. Lazy collections and lazy schemas are loaded eagerly, loader
+returns complete data anyway.
+"""
+import inspect
+
+from python_schema import exception, memo, misc
+from python_schema.field import (
+    BaseField, CollectionField, IntField, SchemaField, StrField)
+
+
+# methods that define how field loads and dumps data, if subclass overrides
+# any of them it has to be loaded via interpreted path
+_METHODS = (
+    'loads', '_loads', 'normalise', 'validate', 'reset_state',
+    'insist_not_none_or_none_allowed', 'materialise', 'make_new', 'clone',
+    'update_defaults', 'as_python', 'value',
+)
+
+_KINDS = (SchemaField, CollectionField, IntField, StrField, BaseField)
+
+
+def _validate(validators, value, errors):
+    """Mirror of BaseField.validate working on given list of errors.
+    """
+    for validate in validators:
+        try:
+            return_value = validate(value)
+
+            if return_value is True:
+                continue
+
+            if inspect.isawaitable(return_value):
+                misc.reject_awaitable(validate, return_value)
+
+            errors.append(return_value)
+        except exception.ValidationError as err:
+            errors.append(str(err))
+
+            raise exception.ValidationError(
+                exception.Error('validation_failed', errors))
+
+    if errors:
+        raise exception.ValidationError(
+            exception.Error('validation_failed', errors))
+
+
+def _fallback(field, value, errors, max_errors=None):
+    """Loads value via interpreted path, used for customised fields.
+    """
+    instance = field.make_new()
+
+    if max_errors is not None:
+        instance.limit_errors(max_errors)
+
+    try:
+        instance.loads(value)
+    except exception.PayloadError:
+        errors.extend(instance.error_records)
+
+        raise
+
+    return instance.as_python()
+
+
+def _missing(field):
+    """Output of field that was not present in payload.
+    """
+    return field.make_new().as_python()
+
+
+def get_kind(field):
+    """Returns one of the builtin field classes if field behaves exactly like
+    one of them, None otherwise.
+    """
+    for kind in _KINDS:
+        if isinstance(field, kind):
+            break
+    else:
+        return None
+
+    for name in _METHODS:
+        if getattr(type(field), name) is not getattr(kind, name):
+            return None
+
+    return kind
+
+
+class LoaderCompiler:
+    """Generates source code of loader, one function per SchemaField and
+    CollectionField (leaf fields are inlined).
+
+    check - generated code only normalises and validates payload, nothing is
+        collected and functions return None
+    """
+
+    def __init__(self, check=False):
+        self.check = check
+        self.namespace = {
+            'NotSet': misc.NotSet,
+            'NormalisationError': exception.NormalisationError,
+            'NoneNotAllowedError': exception.NoneNotAllowedError,
+            'UnknownFieldError': exception.UnknownFieldError,
+            'ValidationError': exception.ValidationError,
+            'PayloadError': exception.PayloadError,
+            'Error': exception.Error,
+            'MAPPING_TYPES': misc.mapping_types,
+            'relocate': exception.relocate,
+            'locate_errors': exception.locate_errors,
+            '_validate': _validate,
+            '_fallback': _fallback,
+            '_missing': _missing,
+        }
+        self.functions = {}
+        self.memoised = []
+        self.sources = []
+        self.counter = 0
+
+    def constant(self, value):
+        self.counter += 1
+
+        name = f'C{self.counter}'
+
+        self.namespace[name] = value
+
+        return name
+
+    def function_for(self, field, max_errors=None):
+        """Returns name of function that loads given SchemaField or
+        CollectionField, generates it if it doesn't exist yet.
+
+        max_errors - limit of errors inherited from the parent
+        """
+        if field.max_errors is not None:
+            max_errors = field.max_errors
+
+        key = (id(field), max_errors)
+
+        try:
+            return self.functions[key][0]
+        except KeyError:
+            pass
+
+        self.counter += 1
+
+        name = f'load_{self.counter}'
+
+        # field is kept so that its id won't be reused
+        self.functions[key] = (name, field)
+
+        if not field.is_materialised:
+            field.materialise()
+
+        if isinstance(field, SchemaField):
+            lines = self.schema_function(field, max_errors)
+
+            if field.memo is not None:
+                self.memoise(name, field, max_errors)
+        else:
+            lines = self.collection_function(field, max_errors)
+
+        self.sources.append('\n'.join(
+            [f'def {name}(value, errors):'] + [
+                '    ' + line for line in lines
+            ]
+        ))
+
+        return name
+
+    def memoise(self, name, field, max_errors):
+        """Function of given name is going to be wrapped with cache of the
+        field (see memo).
+        """
+        # pylint: disable=protected-access
+        memo.insist_pure(field)
+
+        # everything that affects outcome of loading
+        token = (
+            field._plan, field.allow_none, field.exception_on_unknown,
+            tuple(field.validators), max_errors, self.check,
+        )
+
+        self.memoised.append((name, field.memo, token))
+
+    def none_check(self, field, src, dst, errors):
+        """Code of BaseField.normalise for None, assigns None to dst if None is
+        allowed.
+        """
+        lines = [f'if {src} is None:']
+
+        if field.allow_none is True:
+            lines.append('    pass' if src == dst else f'    {dst} = None')
+        else:
+            message = self.constant(exception.Error('none_not_allowed'))
+
+            if errors:
+                lines.append(f'    {errors}.append({message})')
+
+            lines.append(f'    raise NoneNotAllowedError({message})')
+
+        return lines
+
+    def validation(self, field, dst, errors):
+        if not field.validators:
+            return []
+
+        validators = self.constant(field.validators)
+
+        return [f'_validate({validators}, {dst}, {errors or "[]"})']
+
+    def field_code(self, field, src, dst, errors, max_errors=None):
+        """Code that loads value from `src` into `dst` according to given
+        field, `errors` is name of list that collects errors of the field (or
+        None if nobody is going to read them), `max_errors` is the limit of
+        errors inherited from the parent.
+        """
+        kind = get_kind(field)
+
+        if kind is None:
+            return [
+                f'{dst} = _fallback({self.constant(field)}, {src}, '
+                f'{errors or "[]"}, {max_errors})'
+            ]
+
+        if kind in (SchemaField, CollectionField):
+            function = self.function_for(field, max_errors)
+
+            return [f'{dst} = {function}({src}, {errors or "[]"})']
+
+        lines = self.none_check(field, src, dst, errors)
+
+        lines.append('else:')
+
+        if kind is BaseField:
+            lines.append('    pass' if src == dst else f'    {dst} = {src}')
+        else:
+            cast = 'int(str({}))' if kind is IntField else 'str({})'
+            code = 'int_invalid' if kind is IntField else 'str_invalid'
+
+            lines.extend([
+                '    try:',
+                f'        {dst} = {cast.format(src)}',
+                '    except (TypeError, ValueError):',
+                f'        message = Error({code!r}, {src})',
+            ])
+
+            if errors:
+                lines.append(f'        {errors}.append(message)')
+
+            lines.append('        raise NormalisationError(message)')
+
+        lines.extend(self.validation(field, dst, errors))
+
+        return lines
+
+    def schema_function(self, field, max_errors):
+        # pylint: disable=protected-access
+        lines = self.none_check(field, 'value', 'value', 'errors')
+
+        lines.extend([
+            'elif not isinstance(value, MAPPING_TYPES):',
+            '    message = Error("not_mapping", value)',
+            '    errors.append(message)',
+            '    raise NormalisationError(message)',
+        ])
+
+        if field.exception_on_unknown:
+            plan = self.constant(field._plan)
+
+            lines.extend([
+                'else:',
+                f'    unknown_keys = {plan}.unknown_keys(value.keys())',
+                '    if unknown_keys:',
+                '        message = Error("unknown_keys", unknown_keys)',
+                '        errors.append(message)',
+                '        raise UnknownFieldError(message)',
+            ])
+
+        lines.extend(self.validation(field, 'value', 'errors'))
+        lines.extend([
+            'if value is None:',
+            '    return None',
+        ])
+
+        if not self.check:
+            lines.append('output = {}')
+
+        for key, child in field._computed_fields.items():
+            key_literal = repr(key)
+
+            lines.append(f'if {key_literal} in value:')
+            lines.append(f'    item = value[{key_literal}]')
+            lines.append('    try:')
+            lines.extend(
+                '        ' + line for line in self.field_code(
+                    child, 'item', 'item', None, max_errors))
+            lines.extend([
+                '    except PayloadError as err:',
+                f'        relocate(err, {key_literal})',
+                '        raise',
+            ])
+
+            if self.check:
+                continue
+
+            lines.append(f'    output[{key_literal}] = item')
+
+            if child.default_value is misc.NotSet:
+                continue
+
+            if get_kind(child) in (IntField, StrField, BaseField):
+                default = self.constant(child.default_value)
+            else:
+                default = f'_missing({self.constant(child)})'
+
+            lines.append('else:')
+            lines.append(f'    output[{key_literal}] = {default}')
+
+        lines.append('return None' if self.check else 'return output')
+
+        return lines
+
+    def collection_function(self, field, max_errors):
+        # pylint: disable=protected-access
+        element = field._computed_type
+
+        if not element.is_materialised:
+            element.materialise()
+
+        lines = self.none_check(field, 'value', 'value', 'errors')
+
+        lines.extend([
+            'else:',
+            '    try:',
+            '        iterator = iter(value)',
+            '        if iterator is value:',
+            '            value = list(iterator)',
+            '    except (TypeError, ValueError):',
+            '        message = Error("not_iterable", value)',
+            '        errors.append(message)',
+            '        raise NormalisationError(message)',
+        ])
+        lines.extend(self.validation(field, 'value', 'errors'))
+        lines.extend([
+            'if value is None:',
+            '    return None',
+            'collection = None' if self.check else 'collection = []',
+            'normalisation_errors = {}',
+            'validation_errors = {}',
+            'for idx, val in enumerate(value):',
+            '    element_errors = []',
+            '    try:',
+        ])
+        lines.extend(
+            '        ' + line for line in self.field_code(
+                element, 'val', 'item', 'element_errors', max_errors))
+
+        if max_errors is None:
+            lines.extend([
+                '    except NormalisationError as err:',
+                '        normalisation_errors[idx] = locate_errors('
+                'element_errors, err, idx)',
+                '        continue',
+                '    except ValidationError as err:',
+                '        validation_errors[idx] = locate_errors('
+                'element_errors, err, idx)',
+                '        continue',
+                '    except PayloadError as err:',
+                '        relocate(err, idx)',
+                '        raise',
+            ])
+
+            if not self.check:
+                lines.append('    collection.append(item)')
+        else:
+            lines.extend([
+                '    except NormalisationError as err:',
+                '        normalisation_errors[idx] = locate_errors('
+                'element_errors, err, idx)',
+                '    except ValidationError as err:',
+                '        validation_errors[idx] = locate_errors('
+                'element_errors, err, idx)',
+                '    except PayloadError as err:',
+                '        relocate(err, idx)',
+                '        raise',
+                '    else:',
+            ])
+
+            if not self.check:
+                lines.append('        collection.append(item)')
+
+            lines.extend([
+                '        continue',
+                '    if len(normalisation_errors) + len(validation_errors) '
+                f'>= {max_errors!r}:',
+                '        break',
+            ])
+
+        lines.extend([
+            'if normalisation_errors:',
+            '    errors[:] = [normalisation_errors]',
+            '    raise PayloadError(Error("invalid_items", errors))',
+            'if validation_errors:',
+            '    errors[:] = [validation_errors]',
+            '    raise ValidationError(Error("validation_failed", errors))',
+            'return collection',
+        ])
+
+        return lines
+
+
+def _compile(schema, check, max_errors=None):
+    if isinstance(schema, type):
+        schema = schema()
+
+    compiler = LoaderCompiler(check)
+
+    entry = 'load'
+
+    compiler.sources.append('\n'.join(
+        [f'def {entry}(value, errors):'] + [
+            '    ' + line for line in compiler.field_code(
+                schema, 'value', 'value', 'errors', max_errors)
+        ] + ['    return None' if check else '    return value']
+    ))
+
+    source = '\n\n\n'.join(compiler.sources)
+
+    code = compile(source, f'<python_schema.compiler:{schema.name}>', 'exec')
+
+    exec(code, compiler.namespace)  # pylint: disable=exec-used
+
+    # functions call each other by name, wrapper takes place of the original
+    for name, cache, token in compiler.memoised:
+        compiler.namespace[name] = memo.memoised(
+            cache, token, compiler.namespace[name])
+
+    return compiler.namespace[entry], source
+
+
+def compile_loader(schema, max_errors=None):
+    """Compiles field (SchemaField class or any field instance) into a function
+    that takes payload and returns normalised python data, the same
+    `.as_python()` returns after `.loads(payload)`.
+
+    max_errors - limit of errors for collections that don't set their own (as
+        if it was inherited from the parent, see `limit_errors`)
+    """
+    function, source = _compile(schema, False, max_errors)
+
+    def loader(payload, errors=None):
+        """Returns normalised payload, on failure `errors` (if given) holds
+        errors that `schema.errors` would hold.
+        """
+        return function(payload, [] if errors is None else errors)
+
+    loader.source = source
+
+    return loader
+
+
+def compile_checker(schema):
+    """Compiles field (SchemaField class or any field instance) into a function
+    that takes payload and raises the same exception `.loads(payload)` would
+    raise, nothing is loaded and valid payload allocates (almost) nothing.
+    """
+    function, source = _compile(schema, True)
+
+    def checker(payload, errors=None):
+        """Returns None if payload is valid, on failure `errors` (if given)
+        holds errors that `schema.errors` would hold.
+        """
+        function(payload, [] if errors is None else errors)
+
+    checker.source = source
+
+    return checker
+
+
+def compile_dumper(plan, method):
+    """Generates function that takes value of loaded SchemaField (dict of
+    fields) and returns the same data as `method` (`as_json` or `as_python`)
+    of the schema would. Plain fields are dumped inline, others are called.
+
+    NotSet is returned if value doesn't follow the plan (it was set
+    manually), such value has to be dumped by the interpreted path.
+    """
+    namespace = {
+        'NotSet': misc.NotSet,
+        'KEYS': tuple(plan.fields),
+    }
+
+    lines = [
+        'def dump(value):',
+        '    if tuple(value) != KEYS:',
+        '        return NotSet',
+        '    output = {}',
+    ]
+
+    for key, field in plan.fields.items():
+        key_literal = repr(key)
+        kind = get_kind(field)
+
+        lines.append(f'    field = value[{key_literal}]')
+
+        if kind is None:
+            lines.extend([
+                '    if field.computed_value is not NotSet:',
+                f'        output[{key_literal}] = field.{method}()',
+            ])
+
+            continue
+
+        # the same as `.computed_value`, without property and try/except
+        lines.extend([
+            '    item = field._value',
+            '    if item is NotSet:',
+            '        item = field.default_value',
+            '    if item is not NotSet:',
+        ])
+
+        if kind in (SchemaField, CollectionField) or \
+                getattr(type(field), method) is not getattr(kind, method):
+            lines.append(f'        output[{key_literal}] = field.{method}()')
+        else:
+            # plain field returns its value
+            lines.append(f'        output[{key_literal}] = item')
+
+    lines.append('    return output')
+
+    source = '\n'.join(lines)
+
+    code = compile(
+        source, f'<python_schema.compiler:{plan.schema.__name__}.{method}>',
+        'exec')
+
+    exec(code, namespace)  # pylint: disable=exec-used
+
+    dump = namespace['dump']
+    dump.source = source
+
+    return dump
@@ -1,3 +1,204 @@
+class Error:
+    """Structured error of loading, reported instead of a ready message.
+
+    code - stable identifier of the problem (see MESSAGES), meant for
+        programmatic handling
+
+    value - offending value (or details, ie. unknown keys, messages of
+        validators, errors of elements), it's a reference, nothing is copied
+        nor formatted
+
+    path - keys of schemas and indexes of collections leading to the field
+        that failed, relative to the field that reported it
+
+    Message is rendered only when it's read (`str(error)`, `.message`), it's
+    the same message that used to be reported, errors compare equal to their
+    messages and their repr is repr of the message.
+    """
+    __slots__ = ('code', 'value', 'path')
+
+    MESSAGES = {
+        'none_not_allowed': "None is not allowed value",
+        'int_invalid': "IntField cannot be populated with value: {}",
+        'str_invalid': "StrField cannot be populated with value: {}",
+        'not_iterable': (
+            "CollectionField cannot be populated with value: {}. "
+            "Value is not iterable."),
+        'out_of_range': "Value out of range: {}",
+        'not_mapping': (
+            "SchemaField cannot be populated with value: {}. "
+            "Value is not a mapping."),
+        'unknown_keys': "Unexpected payload with key(s): {}",
+        'invalid_items': "Unable to load items in collection: {}",
+        'validation_failed': "Validation error",
+    }
+
+    # codes whose value is list of errors (of the field or, as dictionaries
+    # keyed by index, of elements), those are located along with the error
+    NESTED = frozenset(['invalid_items', 'validation_failed'])
+
+    def __init__(self, code, value=None, path=()):
+        self.code = code
+        self.value = value
+        self.path = path
+
+    @property
+    def message(self):
+        value = self.value
+
+        if self.code == 'unknown_keys':
+            value = ', '.join(value)
+
+        return self.MESSAGES[self.code].format(value)
+
+    def located(self, key):
+        """Returns copy of the error as seen from the parent, `key` is key
+        of schema or index of collection, errors of nested elements are
+        located as well.
+        """
+        value = self.value
+
+        if self.code in self.NESTED:
+            value = locate_all(value, key)
+
+        return Error(self.code, value, (key,) + self.path)
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return repr(self.message)
+
+    def __eq__(self, other):
+        if isinstance(other, Error):
+            return self.code == other.code and \
+                self.message == other.message
+
+        if isinstance(other, str):
+            return self.message == other
+
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.message)
+
+
+def locate(error, key):
+    """Returns error (Error, plain message or errors of elements keyed by
+    index) as seen from the parent, plain messages (ie. returned by
+    validators) have no path.
+    """
+    if isinstance(error, Error):
+        return error.located(key)
+
+    if isinstance(error, dict):
+        return {idx: locate_all(errors, key) for idx, errors in error.items()}
+
+    return error
+
+
+def locate_all(errors, key):
+    return [locate(error, key) for error in errors]
+
+
+def locate_errors(errors, err, key):
+    """Returns errors of field that failed with `err` as seen from the
+    parent, errors of nested fields are not stored on the field (schema), in
+    such case Error the exception was raised with is the only one.
+    """
+    return locate_all(errors or [error_of(err)], key)
+
+
+def describe(error):
+    """Returns list of failures the error (or exception raised with it)
+    consists of (errors of elements and messages of validators are listed one
+    by one), each one is a dictionary of code, path and message, ready to be
+    reported (ie. as JSON).
+
+    Plain messages have no code, unless they were reported by validators.
+    """
+    if isinstance(error, BaseException):
+        error = error_of(error)
+
+    failures = []
+
+    _describe(error, None, (), failures)
+
+    return failures
+
+
+def _describe(error, code, path, failures):
+    """Appends failures of the error, `code` and `path` belong to the
+    closest Error, plain messages are reported under them.
+    """
+    if isinstance(error, dict):
+        for idx, errors in error.items():
+            for element_error in errors:
+                _describe(element_error, code, path + (idx,), failures)
+    elif not isinstance(error, Error):
+        failures.append(
+            {'code': code, 'path': list(path), 'message': str(error)})
+    elif error.code in Error.NESTED:
+        # plain messages inside of failed validation were returned by
+        # validators
+        code = error.code if error.code == 'validation_failed' else None
+
+        for item in error.value:
+            _describe(item, code, error.path, failures)
+    else:
+        failures.append({
+            'code': error.code,
+            'path': list(error.path),
+            'message': error.message,
+        })
+
+
+def render(errors):
+    """Returns errors (Error records, plain messages, errors of elements
+    keyed by index and lists of them) with records replaced by their
+    messages, ready to be reported (ie. as JSON).
+    """
+    if isinstance(errors, Error):
+        return errors.message
+
+    if isinstance(errors, list):
+        return [render(error) for error in errors]
+
+    if isinstance(errors, dict):
+        return {idx: render(error) for idx, error in errors.items()}
+
+    return errors
+
+
+def args_of(err):
+    """Returns arguments the exception was raised with, PayloadError renders
+    its `args` when they're read.
+    """
+    return BaseException.args.__get__(err)
+
+
+def error_of(err):
+    """Returns Error the exception was raised with, message of the exception
+    if it was raised with plain message.
+    """
+    args = args_of(err)
+
+    if args and isinstance(args[0], Error):
+        return args[0]
+
+    return str(err)
+
+
+def relocate(err, key):
+    """Locates Error the exception was raised with (see `Error.located`),
+    exception is re-raised by the parent afterwards.
+    """
+    args = args_of(err)
+
+    if args and isinstance(args[0], Error):
+        err.args = (args[0].located(key),) + args[1:]
+
+
 class BasePythonSchemaError(Exception):
     """Base class in order to catch all python-schema easily
     """
@@ -12,8 +213,34 @@ class SchemaConfigurationError(BasePythonSchemaError):
 
 class PayloadError(BasePythonSchemaError):
     """Base exception fo for all payload related problems.
+
+    Exception is raised with Error record (see `error`), its `args` and
+    `errors` are plain messages rendered when they're read.
     """
-    pass
+    # errors of the field that failed to load (records, see Error), set only
+    # when field state is not reachable otherwise (see BaseField.load)
+    error_records = None
+
+    @property
+    def args(self):
+        return tuple(render(arg) for arg in args_of(self))
+
+    @args.setter
+    def args(self, value):
+        BaseException.args.__set__(self, value)
+
+    @property
+    def error(self):
+        """Error record the exception was raised with (see `error_of`).
+        """
+        return error_of(self)
+
+    @property
+    def errors(self):
+        if self.error_records is None:
+            return None
+
+        return render(self.error_records)
 
 
 class NormalisationError(PayloadError):
@@ -47,3 +274,11 @@ class ReadValueError(BasePythonSchemaError):
     populated with data.
     """
     pass
+
+
+class LazyCollectionError(BasePythonSchemaError, TypeError):
+    """Lazy CollectionField is used as a sequence (length, indexing,
+    comparison) or it's iterated over for the second time, its elements are
+    loaded while it's iterated over and they are not kept.
+    """
+    pass
@@ -2,4 +2,5 @@ from .base_field import BaseField  # NOQA
 from .int_field import IntField  # NOQA
 from .str_field import StrField  # NOQA
 from .collection_field import CollectionField  # NOQA
+from .array_field import ArrayField  # NOQA
 from .schema_field import SchemaField  # NOQA
@@ -0,0 +1,196 @@
+import array
+
+from python_schema import exception, misc
+
+from .collection_field import CollectionField
+from .int_field import IntField
+
+
+class ArrayField(CollectionField):
+    """Collection of homogeneous numbers, instead of list of field instances
+    value is `array.array` (compact, contiguous). Elements are normalised as
+    a batch, one by one (the same way CollectionField does it) only when
+    batch fails or when elements have validators.
+
+    Loaded values can be read without copying via `.as_buffer()` (or
+    `memoryview(field)` since python 3.12), `as_json` and `as_python` build
+    a list.
+
+    Array cannot hold None, thus None elements are always reported as
+    errors.
+    """
+    __slots__ = ('typecode',)
+
+    _defaults = {
+        # array.array typecode of elements, 'q' is signed 64-bit integer
+        'typecode': 'q',
+    }
+
+    # element types that can be normalised as a batch, customised subclasses
+    # (other normalisation) are not accepted
+    _element_types = (IntField,)
+
+    # how many elements are converted to list at once by `.iter_json`
+    JSON_SLICE_SIZE = 1024
+
+    def __init__(self, name, type_=IntField, *args, typecode=None, **kwargs):
+        super().__init__(name, type_, *args, **kwargs)
+
+        self.typecode = self.typecode if typecode is None else typecode
+
+        if self.lazy:
+            raise exception.SchemaConfigurationError(
+                "ArrayField cannot be lazy, elements are stored in array")
+
+    def update_defaults(self, **kwargs):
+        kwargs = super().update_defaults(**kwargs)
+
+        kwargs.setdefault('typecode', self.typecode)
+
+        return kwargs
+
+    def copy_configuration(self, instance):
+        super().copy_configuration(instance)
+
+        instance.typecode = self.typecode
+
+    def materialise(self):
+        super().materialise()
+
+        # pylint: disable=protected-access
+        if type(self._computed_type) not in self._element_types:
+            raise exception.SchemaConfigurationError(
+                "ArrayField supports only elements of type: {}".format(
+                    ', '.join(
+                        class_.__name__ for class_ in self._element_types)))
+
+    def _loads(self, payload):
+        # pylint: disable=protected-access
+        if not self._computed_type.is_materialised:
+            self._computed_type.materialise()
+
+        if not self._computed_type.validators:
+            try:
+                # first convert to str so that 12.2 won't be accepted as
+                # integer (see IntField)
+                self.value = array.array(
+                    self.typecode, map(int, map(str, payload)))
+
+                return
+            except (TypeError, ValueError, OverflowError):
+                # there is at least one invalid element, errors are reported
+                # per element
+                pass
+
+        values = array.array(self.typecode)
+        normalisation_errors = {}
+        validation_errors = {}
+
+        for idx, val in enumerate(payload):
+            instance = self._load_element(
+                idx, val, normalisation_errors, validation_errors)
+
+            if instance is not None:
+                self._store(values, idx, instance, normalisation_errors)
+
+            if self._limit_reached(normalisation_errors, validation_errors):
+                break
+
+        self._raise_errors(normalisation_errors, validation_errors)
+
+        self.value = values
+
+    @staticmethod
+    def _store(values, idx, instance, normalisation_errors):
+        """Appends value of loaded element to the array, element that
+        cannot be stored in it is reported as an error.
+        """
+        if instance.value is None:
+            normalisation_errors[idx] = [
+                exception.Error('none_not_allowed', None, (idx,))]
+
+            return
+
+        try:
+            values.append(instance.value)
+        except OverflowError:
+            normalisation_errors[idx] = [
+                exception.Error('out_of_range', instance.value, (idx,))]
+
+    async def _aloads(self, payload, semaphore):
+        if not self._computed_type.validators:
+            # there is nothing to await, elements are loaded as a batch
+            self._loads(payload)
+
+            return
+
+        if not self._computed_type.is_materialised:
+            self._computed_type.materialise()
+
+        values = array.array(self.typecode)
+        normalisation_errors = {}
+        validation_errors = {}
+
+        def store(idx, instance):
+            self._store(values, idx, instance, normalisation_errors)
+
+        await self._aload_elements(
+            payload, semaphore, store, normalisation_errors,
+            validation_errors)
+
+        self._raise_errors(normalisation_errors, validation_errors)
+
+        self.value = values
+
+    def force(self):
+        pass
+
+    def as_buffer(self):
+        """Returns read-only memoryview of loaded values (format of elements
+        is the typecode), nothing is copied.
+        """
+        if self.value is None:
+            return None
+
+        return memoryview(self.value).toreadonly()
+
+    def __buffer__(self, flags):
+        # buffer protocol (PEP 688), memoryview(field), bytes(field), etc.
+        view = self.as_buffer()
+
+        if view is None:
+            raise exception.ReadValueError(
+                f"ArrayField {self.name} is None, it has no buffer")
+
+        return view
+
+    def _iter_json(self):
+        if self.value is None:
+            yield 'null'
+
+            return
+
+        # slices are converted to list one at a time
+        size = self.JSON_SLICE_SIZE
+        separator = '['
+
+        for start in range(0, len(self.value), size):
+            items = self.value[start:start + size].tolist()
+
+            yield separator + misc.json_encoder.encode(items)[1:-1]
+
+            separator = ', '
+
+        yield '[]' if separator == '[' else ']'
+
+    def as_json(self):
+        if self.value is None:
+            return None
+
+        return self.value.tolist()
+
+    def as_python(self):
+        if self.value is None:
+            return None
+
+        return self.value.tolist()
@@ -1,20 +1,103 @@
-from python_schema import exception, misc
+import inspect
 
+from python_schema import exception, instrument, misc
+
+
+# type of descriptors python creates for __slots__
+_SlotType = type(type('_Slotted', (), {'__slots__': ('slot',)}).slot)
+
+
+class FieldType(type):
+    """Metaclass of fields, configuration read from the class returns its
+    default (there is a slot under the same name, see BaseField._defaults),
+    the same class attribute used to return.
+    """
+
+    def __getattribute__(cls, name):
+        value = type.__getattribute__(cls, name)
+
+        if type(value) is _SlotType:
+            for class_ in type.__getattribute__(cls, '__mro__'):
+                defaults = class_.__dict__.get('_defaults')
+
+                if defaults is not None and name in defaults:
+                    return defaults[name]
+
+        return value
+
+
+# pylint: disable=too-many-instance-attributes
+class BaseField(metaclass=FieldType):
+    # instances are compact (no __dict__), it matters when loading big
+    # collections, subclasses that don't declare __slots__ work as usual
+    __slots__ = (
+        'name', 'description', 'validators', 'allow_none', 'default_value',
+        'parent', 'error_records', '_value', '_materialised', '_compiled',
+    )
 
-class BaseField:  # pylint: disable=too-many-instance-attributes
     # configuration of the object, those attributes can be set either on class
-    # directly or as parameter of __init__
-    description = ''
-    validators = None
-    allow_none = True
-    default_value = misc.NotSet
-
-    # state of the object, should not be altered manually in order to avoid
-    # unexpected behaviour
-    parent = None
-    errors = None
-    _value = misc.NotSet
-    _materialised = False
+    # directly or as parameter of __init__ (there are slots under the same
+    # names, thus defaults are kept aside, see __getattr__ and FieldType)
+    _defaults = {
+        'description': '',
+        'validators': None,
+        'allow_none': True,
+        'default_value': misc.NotSet,
+
+        # state of the object, should not be altered manually in order to
+        # avoid unexpected behaviour
+        'parent': None,
+        'error_records': None,
+        '_value': misc.NotSet,
+        '_materialised': False,
+        '_compiled': None,
+    }
+
+    # attributes computed during materialisation
+    _materialised_attributes = ('_materialised', '_compiled')
+
+    # how much JSON (in characters) `.iter_json` yields at once
+    JSON_CHUNK_SIZE = 64 * 1024
+
+    # whether instances have __dict__ (see clone)
+    _has_dict = False
+
+    # slots of subclasses that don't copy them in copy_configuration (see
+    # clone)
+    _extra_slots = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls._has_dict = bool(cls.__dictoffset__)
+        cls._extra_slots = tuple(
+            name
+            for class_ in cls.__mro__
+            if 'copy_configuration' not in class_.__dict__
+            for name in class_.__dict__.get('__slots__', ())
+        )
+
+        if '__slots__' not in cls.__dict__:
+            return
+
+        # class attribute would hide slot of the same name (and make it read
+        # only), defaults given that way are moved to `_defaults`
+        slots = {
+            name
+            for class_ in cls.__mro__[1:]
+            for name in class_.__dict__.get('__slots__', ())
+        }
+        overrides = {
+            name: value for name, value in cls.__dict__.items()
+            if name in slots and not hasattr(value, '__get__')
+        }
+
+        for name in overrides:
+            delattr(cls, name)
+
+        if overrides:
+            cls._defaults = dict(
+                cls.__dict__.get('_defaults', {}), **overrides)
 
     def __init__(
             self, name, description=None, validators=None, allow_none=None,
@@ -63,6 +146,10 @@ class BaseField:  # pylint: disable=too-many-instance-attributes
             default_value
         )
 
+        self._materialised = False
+        self._compiled = None
+        self.parent = None
+
         # and this resets the state of the field
         self.reset_state()
 
@@ -82,6 +169,49 @@ class BaseField:  # pylint: disable=too-many-instance-attributes
     def __repr__(self):
         return self.__str__()
 
+    def __getattr__(self, name):
+        # called only when slot was never set, default takes its place
+        for class_ in type(self).__mro__:
+            defaults = class_.__dict__.get('_defaults', {})
+
+            if name in defaults:
+                return defaults[name]
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self):
+        """Outcome of materialisation is not pickled (it refers to lazily
+        resolved classes and compiled plans), field is materialised again
+        when needed after unpickling.
+        """
+        state = dict(getattr(self, '__dict__', {}))
+
+        for class_ in type(self).__mro__:
+            for name in class_.__dict__.get('__slots__', ()):
+                state.setdefault(name, getattr(self, name))
+
+        for name in self._materialised_attributes:
+            state.pop(name, None)
+
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        # loaded field has to be usable right away
+        if self.is_set:
+            self.materialise()
+
+    @property
+    def errors(self):
+        """Errors of the last `.loads` as plain messages (JSON-safe), Error
+        records are kept in `.error_records` (see exception.Error) and their
+        messages are rendered only here.
+        """
+        return exception.render(self.error_records)
+
     @property
     def total_parents(self):
         counter = 0
@@ -104,14 +234,81 @@ class BaseField:  # pylint: disable=too-many-instance-attributes
         return kwargs
 
     def make_new(self, **kwargs):
-        return self.__class__(**self.update_defaults(**kwargs))
+        # outcome of materialisation depends only on configuration of the
+        # field, as long as it was not altered new instance can be a copy
+        if self.is_materialised and kwargs.keys() <= {'name'}:
+            return self.clone(**kwargs)
+
+        instance = self.__class__(**self.update_defaults(**kwargs))
+
+        self.copy_extra_slots(instance, kwargs)
+
+        return instance
+
+    def clone(self, name=None):
+        """Returns copy of the field in base state (before first `.loads`),
+        it shares configuration and outcome of materialisation with the
+        field, optionally under another name.
+        """
+        # class attributes are not read here (it's the hot path and every
+        # read goes through FieldType), fields don't customise __new__
+        instance = object.__new__(type(self))
+
+        self.copy_configuration(instance)
+        self.copy_extra_slots(instance)
+
+        # subclasses without __slots__ may keep their configuration there
+        if self._has_dict:
+            instance.__dict__.update(self.__dict__)
+
+        if name is not None:
+            instance.name = name
+
+        instance.parent = None
+        instance.reset_state()
+
+        return instance
+
+    def copy_configuration(self, instance):
+        """Copy configuration and outcome of materialisation to the instance
+        of the same class, used by `.clone`.
+        """
+        instance.name = self.name
+        instance.description = self.description
+        instance.validators = self.validators
+        instance.allow_none = self.allow_none
+        instance.default_value = self.default_value
+        instance._materialised = self._materialised
+        instance._compiled = self._compiled
+
+    def copy_extra_slots(self, instance, skip=()):
+        """Copy slots of subclasses that don't override copy_configuration
+        (they are unknown to `update_defaults` as well), slots given in
+        `skip` and slots that were never set are left alone.
+        """
+        for name in self._extra_slots:
+            if name in skip:
+                continue
+
+            try:
+                setattr(instance, name, getattr(self, name))
+            except AttributeError:
+                pass
 
     def reset_state(self):
-        """Reset field to base state (before first `.loads`).
+        """Reset field to base state (before first `.loads`), field stays
+        attached to its parent (reloaded field is still part of it).
         """
         self.value = misc.NotSet
-        self.errors = []
-        self.parent = None
+        self.error_records = []
+
+    def _child_changed(self, child, itself):
+        """Called when value of nested field changed (`itself` is False if
+        it was a field nested deeper), parents are notified all the way up.
+        """
+        # pylint: disable=protected-access
+        if self.parent is not None:
+            self.parent._child_changed(self, False)
 
     def insist_not_none_or_none_allowed(self, value):
         if value is not None:
@@ -120,19 +317,22 @@ class BaseField:  # pylint: disable=too-many-instance-attributes
         if self.allow_none is True:
             return
 
-        raise exception.NoneNotAllowedError("None is not allowed value")
+        raise exception.NoneNotAllowedError(
+            exception.Error('none_not_allowed'))
 
     def normalise(self, value):
         try:
             self.insist_not_none_or_none_allowed(value)
         except exception.NormalisationError as err:
-            self.errors.append(str(err))
+            self.error_records.append(exception.error_of(err))
 
             raise
 
         return value
 
     def validate(self, value):
+        errors = self.error_records
+
         for validate in self.validators:
             try:
                 return_value = validate(value)
@@ -140,14 +340,51 @@ class BaseField:  # pylint: disable=too-many-instance-attributes
                 if return_value is True:
                     continue
 
-                self.errors.append(return_value)
+                if inspect.isawaitable(return_value):
+                    misc.reject_awaitable(validate, return_value)
+
+                errors.append(return_value)
             except exception.ValidationError as err:
-                self.errors.append(str(err))
+                errors.append(str(err))
+
+                raise exception.ValidationError(
+                    exception.Error('validation_failed', errors))
+
+        if errors:
+            raise exception.ValidationError(
+                exception.Error('validation_failed', errors))
+
+    async def avalidate(self, value, semaphore=None):
+        """Asynchronous counterpart of `.validate`, validators can be
+        coroutine functions as well, those are awaited (one at a time) under
+        semaphore (if given).
+        """
+        errors = self.error_records
 
-                raise exception.ValidationError('Validation error')
+        for validate in self.validators:
+            try:
+                return_value = validate(value)
 
-        if self.errors:
-            raise exception.ValidationError('Validation error')
+                if inspect.isawaitable(return_value):
+                    if semaphore is None:
+                        return_value = await return_value
+                    else:
+                        async with semaphore:
+                            return_value = await return_value
+
+                if return_value is True:
+                    continue
+
+                errors.append(return_value)
+            except exception.ValidationError as err:
+                errors.append(str(err))
+
+                raise exception.ValidationError(
+                    exception.Error('validation_failed', errors))
+
+        if errors:
+            raise exception.ValidationError(
+                exception.Error('validation_failed', errors))
 
     def as_json(self):
         """Field returns value that can be json.dumped (ie datetime is
@@ -165,6 +402,44 @@ class BaseField:  # pylint: disable=too-many-instance-attributes
         """Field returns python valid data (ie datetime stays as a datatime)
         """
         return self.value
+
+    def iter_json(self, chunk_size=None):
+        """Yields JSON representation of the field in chunks of about
+        chunk_size characters, joined they are exactly what
+        `json.dumps(field.as_json())` returns. Schemas and collections are
+        walked element by element, whole representation is never built.
+        """
+        chunk_size = self.JSON_CHUNK_SIZE if chunk_size is None else \
+            chunk_size
+
+        pieces = []
+        size = 0
+
+        for piece in self._iter_json():
+            pieces.append(piece)
+            size += len(piece)
+
+            if size >= chunk_size:
+                yield ''.join(pieces)
+
+                pieces = []
+                size = 0
+
+        if pieces:
+            yield ''.join(pieces)
+
+    def dump_json(self, fp, chunk_size=None):
+        """Writes JSON representation of the field to text file-like object
+        (see `.iter_json`).
+        """
+        for chunk in self.iter_json(chunk_size):
+            fp.write(chunk)
+
+    def _iter_json(self):
+        """Yields pieces of JSON representation, fields that contain other
+        fields yield pieces of their elements.
+        """
+        yield misc.json_encoder.encode(self.as_json())
     @property
     def is_set(self):
         return self._value is not misc.NotSet
@@ -197,8 +472,12 @@ class BaseField:  # pylint: disable=too-many-instance-attributes
 
     @value.setter
     def value(self, value):
+        # pylint: disable=protected-access
         self._value = value
 
+        if self.parent is not None:
+            self.parent._child_changed(self, True)
+
     @value.deleter
     def value(self):
         self._value = misc.NotSet
@@ -213,7 +492,65 @@ class BaseField:  # pylint: disable=too-many-instance-attributes
     def _loads(self, payload):
         self.value = payload
 
+    def force(self):
+        """Loads everything that was deferred by lazy loading (see
+        SchemaField), plain fields have nothing to defer.
+        """
+
+    def limit_errors(self, max_errors):
+        """Passes limit of errors down from the parent (see CollectionField),
+        plain fields report errors of a single value anyway.
+        """
+
+    def keep_payloads(self):
+        """Passes keep_payload down from the parent (see SchemaField), only
+        schemas keep payload they were loaded with.
+        """
+
     def loads(self, payload):
+        if instrument.recorder is not None:
+            instrument.recorder.loads(self, payload)
+
+            return
+
+        self._load_steps(payload, None)
+
+    def _load_steps(self, payload, measure):
+        # steps of .loads, recorder measures each of them (see instrument),
+        # without recorder steps are called directly (it's the hot path)
+        self.reset_state()
+
+        if not self.is_materialised:
+            self.materialise()
+
+        if measure is None:
+            payload = self.normalise(payload)
+
+            self.validate(payload)
+        else:
+            payload = measure('normalise', self.normalise, payload)
+
+            measure('validate', self.validate, payload)
+
+        if payload is None:
+            self.value = payload
+        elif measure is None:
+            self._loads(payload)
+        else:
+            measure('_loads', self._loads, payload)
+
+    async def _aloads(self, payload, semaphore):
+        self._loads(payload)
+
+    async def aloads(self, payload, semaphore=None):
+        """Asynchronous counterpart of `.loads`, allows validators to be
+        coroutine functions (ie. doing I/O). Independent fields (keys of
+        SchemaField, elements of CollectionField) are loaded concurrently,
+        errors are the same as `.loads` would report.
+
+        semaphore - optional asyncio.Semaphore, it's shared by all nested
+            fields and limits how many validators are awaited at once
+        """
         self.reset_state()
 
         if not self.is_materialised:
@@ -221,14 +558,154 @@ class BaseField:  # pylint: disable=too-many-instance-attributes
 
         payload = self.normalise(payload)
 
-        self.validate(payload)
+        await self.avalidate(payload, semaphore)
 
         if payload is None:
             self.value = payload
 
             return
 
-        self._loads(payload)
+        await self._aloads(payload, semaphore)
+
+    def load(self, payload):
+        """Reentrant counterpart of `.loads`, field is used only as a
+        definition and it's never altered by loading, payload is loaded into
+        a new instance of the field which is returned. Thus one field can be
+        shared between threads.
+
+        On failure exception carries errors of that new instance in
+        `.errors` attribute.
+        """
+        if not self.is_materialised:
+            self.materialise()
+
+        instance = self.make_new()
+
+        try:
+            instance.loads(payload)
+        except exception.PayloadError as err:
+            err.error_records = instance.error_records
+
+            raise
+
+        return instance
+
+    def load_python(self, payload):
+        """Returns normalised python data, the same `.as_python()` returns
+        after `.loads(payload)`, but without building tree of field instances
+        (see `compiler.compile_loader`). Field is never altered by loading.
+
+        On failure exception carries errors the field would hold in `.errors`
+        attribute (the same way `.load` does).
+        """
+        loader = self.get_compiled('loader')
+
+        errors = []
+
+        try:
+            return loader(payload, errors)
+        except exception.PayloadError as err:
+            err.error_records = errors
+
+            raise
+
+    def loads_json(self, source):
+        """Returns normalised python data (the same `.load_python` returns)
+        out of JSON document (bytes, str or file-like object), document is
+        parsed and validated incrementally and never kept in memory as a
+        whole (see `incremental`). Field is never altered by loading.
+
+        Invalid JSON raises ValueError.
+        """
+        # pylint: disable=cyclic-import
+        from python_schema import incremental
+
+        return incremental.loads_json(self, source)
+
+    def check(self, payload):
+        """Only normalises and validates payload, nothing is loaded nor kept
+        (see `compiler.compile_checker`), field is never altered.
+
+        Returns None if payload is valid, otherwise report of the failure:
+        name of exception, its message and every failure (of nested fields
+        and elements as well) with its code, path and message (see
+        `exception.describe`).
+        """
+        checker = self.get_compiled('checker')
+
+        errors = []
+
+        try:
+            checker(payload, errors)
+        except exception.PayloadError as err:
+            return {
+                'error': type(err).__name__,
+                'message': str(err),
+                'errors': exception.describe(exception.error_of(err)),
+            }
+
+        return None
+
+    def get_compiled(self, kind, max_errors=None):
+        """Returns function compiled out of the field (`loader` or `checker`),
+        it's compiled once and shared by clones of the field.
+
+        max_errors - limit of errors inherited from the parent (loader only)
+        """
+        if self._compiled is None:
+            self._compiled = {}
+
+        key = kind if max_errors is None else (kind, max_errors)
+
+        try:
+            return self._compiled[key]
+        except KeyError:
+            pass
+
+        # compiler depends on field classes, thus it's imported lazily
+        from python_schema import compiler  # pylint: disable=cyclic-import
+
+        if max_errors is None:
+            function = getattr(compiler, f'compile_{kind}')(self)
+        else:
+            function = getattr(compiler, f'compile_{kind}')(self, max_errors)
+
+        self._compiled[key] = function
+
+        return function
+
+    def loads_many(self, payloads):
+        """Loads each payload into a new instance of the field (see `.load`).
+
+        Returns tuple of two dictionaries (both keyed by index of payload),
+        loaded instances and errors of payloads that failed to load (the
+        same shape CollectionField uses). Failure of one payload doesn't
+        affect the others.
+        """
+        if not self.is_materialised:
+            self.materialise()
+
+        make_new = self.make_new
+
+        loaded = {}
+        errors = {}
+
+        for idx, payload in enumerate(payloads):
+            instance = make_new()
+
+            try:
+                instance.loads(payload)
+            except exception.PayloadError as err:
+                # errors of nested fields are not stored on the instance,
+                # exception carries them (located, see exception.Error)
+                errors[idx] = instance.error_records or [
+                    exception.error_of(err)]
+
+                continue
+
+            loaded[idx] = instance
+
+        return loaded, errors
 
     def dumps(self):
         return self.as_json()
@@ -1,97 +1,333 @@
-from python_schema import exception, misc
+import asyncio
+import inspect
+import itertools
+
+from python_schema import exception, misc, registry
 
 from .base_field import BaseField
 
 
 class CollectionField(BaseField):
-    # after materialisation collection will consist elements of this typer
-    _computed_type= None
+    __slots__ = (
+        'type_', 'lazy', 'chunk_size', 'max_errors', '_computed_type')
+
+    _defaults = {
+        # configuration:
+
+        # lazy collection loads elements only when it's iterated over (in
+        # chunks of chunk_size elements), thus it accepts any single-pass
+        # iterable (generators, file-backed readers) and never keeps all of
+        # them in memory
+        'lazy': False,
+        'chunk_size': 1000,
+
+        # loading stops after that many elements failed to load (errors of
+        # those are reported), None means that every element is loaded,
+        # limit is passed down to nested schemas and collections that don't
+        # have one (fail_fast=True is the same as max_errors=1)
+        'max_errors': None,
+
+        # state:
+
+        # after materialisation collection will consist elements of this typer
+        '_computed_type': None,
+    }
 
-    def __init__(self, name, type_, *args, **kwargs):
+    _materialised_attributes = BaseField._materialised_attributes + (
+        '_computed_type',)
+
+    def __init__(
+            self, name, type_, *args, lazy=None, chunk_size=None,
+            fail_fast=None, max_errors=None, **kwargs):
         super().__init__(name, *args, **kwargs)
 
         self.type_ = type_
 
+        self._computed_type = None
+
+        self.lazy = (
+            (True if self.lazy is True else False)
+            if lazy is None else lazy
+        )
+        self.chunk_size = (
+            self.chunk_size if chunk_size is None else chunk_size
+        )
+        self.max_errors = (
+            (1 if fail_fast else self.max_errors)
+            if max_errors is None else max_errors
+        )
+
+        if self.lazy and self.validators:
+            raise exception.SchemaConfigurationError(
+                "Lazy CollectionField cannot have validators, its elements "
+                "are not known until it's iterated over")
+
     def normalise(self, value):
         value = super().normalise(value)
 
         if value is None:
             return value
 
-        message = (
-            f"CollectionField cannot be populated with value: {value}. "
-            "Value is not iterable."
-        )
-
         try:
             # check if we can iterate over value, it has to be list-like object
-            [elm for elm in value]
+            iterator = iter(value)
+
+            # single-pass iterable can be consumed only once, unless
+            # collection is lazy we need all elements at hand (validators)
+            if iterator is value and not self.lazy:
+                value = list(iterator)
         except (TypeError, ValueError):
-            self.errors.append(message)
+            error = exception.Error('not_iterable', value)
 
-            raise exception.NormalisationError(message)
+            self.error_records.append(error)
 
-        return value
+            raise exception.NormalisationError(error)
+
+        return iterator if self.lazy else value
 
     def update_defaults(self, **kwargs):
         kwargs = super().update_defaults(**kwargs)
 
         kwargs.setdefault('type_', self.type_)
+        kwargs.setdefault('lazy', self.lazy)
+        kwargs.setdefault('chunk_size', self.chunk_size)
+        kwargs.setdefault('max_errors', self.max_errors)
 
         return kwargs
 
+    def copy_configuration(self, instance):
+        # pylint: disable=protected-access
+        super().copy_configuration(instance)
+
+        instance.type_ = self.type_
+        instance.lazy = self.lazy
+        instance.chunk_size = self.chunk_size
+        instance.max_errors = self.max_errors
+        instance._computed_type = self._computed_type
+
     def materialise(self):
         if isinstance(self.type_, str):
-            instance = misc.ImportModule(self.type_).get_class()(
-                name=self.name)
+            instance = registry.resolve(self.type_)(name=self.name)
         elif isinstance(self.type_, type):
             instance = self.type_(name=self.name)
         else:
-            instance = self.type_
+            # copy, so that materialisation of elements won't alter instance
+            # given by the user
+            instance = self.type_.make_new()
 
         self._computed_type = instance
 
         super().materialise()
 
+    def _load_element(self, idx, val, normalisation_errors, validation_errors):
+        """Returns loaded element or None if it failed to load (errors are
+        stored under its index).
+        """
+        # elements share name of the collection, index is part of the path
+        # of their errors
+        instance = self._computed_type.make_new()
+
+        if self.max_errors is not None:
+            instance.limit_errors(self.max_errors)
+
+        try:
+            instance.loads(val)
+        except exception.NormalisationError as err:
+            normalisation_errors[idx] = exception.locate_errors(
+                instance.error_records, err, idx)
+
+            return None
+        except exception.ValidationError as err:
+            validation_errors[idx] = exception.locate_errors(
+                instance.error_records, err, idx)
+
+            return None
+        except exception.PayloadError as err:
+            # nested collection failed, it's not an error of the element
+            exception.relocate(err, idx)
+
+            raise
+
+        instance.parent = self
+
+        return instance
+
+    def limit_errors(self, max_errors):
+        if self.max_errors is None:
+            self.max_errors = max_errors
+
+    def _limit_reached(self, normalisation_errors, validation_errors):
+        return self.max_errors is not None and (
+            len(normalisation_errors) + len(validation_errors) >=
+            self.max_errors)
+
+    def _raise_errors(self, normalisation_errors, validation_errors):
+        if normalisation_errors:
+            self.error_records = [normalisation_errors]
+
+            raise exception.PayloadError(
+                exception.Error('invalid_items', self.error_records))
+
+        if validation_errors:
+            self.error_records = [validation_errors]
+
+            raise exception.ValidationError(
+                exception.Error('validation_failed', self.error_records))
+
     def _loads(self, payload):
+        # prototype is materialised once, every element made out of it later
+        # on reuses the outcome
+        if not self._computed_type.is_materialised:
+            self._computed_type.materialise()
+
+        if self.lazy:
+            self.value = self._loads_lazily(payload)
+
+            return
+
         collection = []
         normalisation_errors = {}
         validation_errors = {}
 
         for idx, val in enumerate(payload):
-            name = f"{self.name}[{idx}]"
+            instance = self._load_element(
+                idx, val, normalisation_errors, validation_errors)
 
-            instance = self._computed_type.make_new(name=name)
+            if instance is not None:
+                collection.append(instance)
+            elif self._limit_reached(normalisation_errors, validation_errors):
+                break
 
-            try:
-                instance.loads(val)
-            except (exception.NormalisationError,):
-                normalisation_errors[idx] = instance.errors
+        self._raise_errors(normalisation_errors, validation_errors)
 
-                continue
-            except (exception.ValidationError,):
-                validation_errors[idx] = instance.errors
+        self.value = collection
+
+    async def _aloads(self, payload, semaphore):
+        if self.lazy:
+            raise exception.SchemaConfigurationError(
+                "Lazy CollectionField cannot be loaded asynchronously")
+
+        if not self._computed_type.is_materialised:
+            self._computed_type.materialise()
 
-                continue
+        collection = []
+        normalisation_errors = {}
+        validation_errors = {}
 
+        def store(idx, instance):
             instance.parent = self
 
             collection.append(instance)
 
-        if normalisation_errors:
-            self.errors = [normalisation_errors]
+        await self._aload_elements(
+            payload, semaphore, store, normalisation_errors,
+            validation_errors)
 
-            raise exception.PayloadError(
-                "Unable to load items in collection: {}".format(self.errors))
+        self._raise_errors(normalisation_errors, validation_errors)
 
-        if validation_errors:
-            self.errors = [validation_errors]
+        self.value = collection
+
+    async def _aload_elements(
+            self, payload, semaphore, store, normalisation_errors,
+            validation_errors):
+        """Loads elements concurrently, `store(idx, instance)` is called for
+        every loaded element, errors are stored under indexes of elements
+        that failed.
+        """
+        instances = []
+        tasks = []
+
+        for val in payload:
+            instance = self._computed_type.make_new()
+
+            if self.max_errors is not None:
+                instance.limit_errors(self.max_errors)
+
+            instances.append(instance)
+            tasks.append(asyncio.ensure_future(
+                instance.aloads(val, semaphore)))
+
+        # outcomes are taken in order (errors are the same synchronous path
+        # would report), once limit of errors is reached elements that are
+        # still loading are cancelled
+        try:
+            for idx, (instance, task) in enumerate(zip(instances, tasks)):
+                try:
+                    await task
+                except exception.NormalisationError as err:
+                    normalisation_errors[idx] = exception.locate_errors(
+                        instance.error_records, err, idx)
+                except exception.ValidationError as err:
+                    validation_errors[idx] = exception.locate_errors(
+                        instance.error_records, err, idx)
+                except exception.PayloadError as err:
+                    exception.relocate(err, idx)
+
+                    raise
+                else:
+                    store(idx, instance)
+
+                if self._limit_reached(
+                        normalisation_errors, validation_errors):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            # outcome of every task is retrieved, even if it's not needed
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _loads_lazily(self, iterator):
+        """Generator of loaded elements, payload is read and loaded in chunks.
+        Valid elements are yielded as they go, errors are raised (the same way
+        eager collection does) once all elements are consumed.
+        """
+        normalisation_errors = {}
+        validation_errors = {}
 
-            raise exception.ValidationError('Validation error')
+        idx = 0
 
-        self.value = collection
+        while not self._limit_reached(normalisation_errors, validation_errors):
+            chunk = list(itertools.islice(iterator, self.chunk_size))
+
+            if not chunk:
+                break
+
+            loaded = []
+
+            for val in chunk:
+                instance = self._load_element(
+                    idx, val, normalisation_errors, validation_errors)
+
+                idx += 1
+
+                if instance is not None:
+                    loaded.append(instance)
+                elif self._limit_reached(
+                        normalisation_errors, validation_errors):
+                    break
+
+            yield from loaded
+
+        self._raise_errors(normalisation_errors, validation_errors)
+
+    def _sequence(self, operation):
+        """Returns value of collection, elements of lazy collection are not
+        kept, thus it cannot be used as a sequence.
+        """
+        value = self.value
+
+        if self.lazy and inspect.isgenerator(value):
+            raise exception.LazyCollectionError(
+                f"Lazy CollectionField does not support {operation}, its "
+                f"elements are loaded while it's iterated over and they are "
+                f"not kept")
+
+        return value
 
     def __eq__(self, values):
+        self._sequence('comparison')
+
         if len(self) != len(values):
             return False
 
@@ -112,6 +348,9 @@ class CollectionField(BaseField):
 
         if value is misc.NotSet:
             value = ['NotSet']
+        elif self.lazy and value is not None:
+            # printing must not consume elements of lazy collection
+            value = ['Lazy']
 
         for value in value:
             output.append('\t{},'.format(value))
@@ -122,20 +361,70 @@ class CollectionField(BaseField):
 
         return '\n'.join(output)
 
+    def force(self):
+        # elements of lazy collection are loaded while it's iterated over
+        if self.lazy or not self.is_set or self.value is None:
+            return
+
+        for field in self.value:
+            field.force()
+
+    def __iter__(self):
+        value = self.value
+
+        if self.lazy and inspect.isgenerator(value) and \
+                inspect.getgeneratorstate(value) != inspect.GEN_CREATED:
+            raise exception.LazyCollectionError(
+                "Lazy CollectionField can be iterated over only once, its "
+                "elements are loaded while it's iterated over and they are "
+                "not kept")
+
+        return iter(value)
+
     def __getitem__(self, idx):
-        return self.value[idx]
+        return self._sequence('indexing')[idx]
 
     def __len__(self):
-        return len(self.value)
+        return len(self._sequence('len()'))
 
     def as_json(self):
         if self.value is None:
             return None
 
-        return [elm.as_json() for elm in self.value]
+        return [elm.as_json() for elm in self]
+
+    def _iter_json(self):
+        if type(self).as_json is not CollectionField.as_json:
+            # representation was customised
+            yield from super()._iter_json()
+
+            return
+
+        if self.value is None:
+            yield 'null'
+
+            return
+
+        # pylint: disable=protected-access
+        encode = misc.json_encoder.encode
+
+        # elements of lazy collection are loaded while they are dumped
+        separator = '['
+
+        for elm in self:
+            if type(elm)._iter_json is BaseField._iter_json:
+                yield separator + encode(elm.as_json())
+            else:
+                yield separator
+
+                yield from elm._iter_json()
+
+            separator = ', '
+
+        yield '[]' if separator == '[' else ']'
 
     def as_python(self):
         if self.value is None:
             return None
 
-        return [elm.as_python() for elm in self.value]
+        return [elm.as_python() for elm in self]
@@ -4,20 +4,23 @@ from .base_field import BaseField
 
 
 class IntField(BaseField):
+    __slots__ = ()
+
     def normalise(self, value):
         value = super().normalise(value)
 
         if value is None:
             return value
 
-        message = f"IntField cannot be populated with value: {value}"
-
         try:
             # first convert to str so that 12.2 won't be accepted as integer
             value = int(str(value))
         except (TypeError, ValueError):
-            self.errors.append(message)
+            # message is rendered only if someone reads it
+            error = exception.Error('int_invalid', value)
+
+            self.error_records.append(error)
 
-            raise exception.NormalisationError(message)
+            raise exception.NormalisationError(error)
 
         return value
@@ -1,26 +1,76 @@
-from python_schema import exception, misc
+import asyncio
+
+from python_schema import exception, misc, plan, registry
 
 from .base_field import BaseField
+from .collection_field import CollectionField
 
 
 class SchemaField(BaseField):
-    # configuration:
+    __slots__ = (
+        'exception_on_unknown', 'lazy', 'max_errors', 'memo', 'cache_dumps',
+        'keep_payload', 'fields', 'schema',
+        '_computed_fields', '_plan', '_pending', '_payload', '_dumps',
+        '_changes',
+    )
+
+    _defaults = {
+        # configuration:
+
+        # throw exception if loads receives unexpected key, otherwise ignore
+        # silently
+        'exception_on_unknown': True,
+
+        # lazy schema loads nested schemas and collections only when they are
+        # read (see `force`), fields of other types are loaded right away
+        'lazy': False,
+
+        # limit of errors passed down to nested collections (see
+        # CollectionField), schema itself stops at the first failing key
+        'max_errors': None,
+
+        # memo.Cache of loaded payloads, used by compiled paths (see memo)
+        'memo': None,
+
+        # outcome of `as_json` and `as_python` is kept until value of the
+        # schema (or any nested field) changes
+        'cache_dumps': False,
+
+        # copy of loaded payload is kept, schema can be updated (see `update`)
+        'keep_payload': False,
+        'fields': None,
+        'schema': None,  # allows lazy load and inline definition
+
+        # state:
+
+        # computed_fields takes into account parents, overrides and
+        # everything in between, is set automatically during materailisation
+        '_computed_fields': None,
+        '_plan': None,
+
+        # payloads of nested fields that are not loaded yet (lazy schema)
+        '_pending': None,
+
+        # copy of payload schema was loaded with (only with keep_payload),
+        # allows to apply partial updates (see `update`)
+        '_payload': None,
 
-    # throw exception if loads receives unexpected key, otherwise ignore
-    # silently
-    exception_on_unknown = True
-    fields = None
-    schema = None  # allows lazy load and inline definition
+        # cached dumps, (value they were made of, {method: output})
+        '_dumps': None,
 
-    # state:
+        # keys changed since load, {key: True if field itself changed, False
+        # if only fields nested in it did}, see `dump_changes`
+        '_changes': None,
+    }
 
-    # computed_fields takes into account parents, overrides and everything in
-    # between, is set automatically during materailisation
-    _computed_fields = None
+    _materialised_attributes = BaseField._materialised_attributes + (
+        '_computed_fields', '_plan')
 
     def __init__(
             self, name=None, schema=None, fields=None,
-            exception_on_unknown=None, **kwargs):  # NOQA
+            exception_on_unknown=None, lazy=None, fail_fast=None,
+            max_errors=None, memo=None, cache_dumps=None, keep_payload=None,
+            **kwargs):  # NOQA
         """Initialises new instance of the Schema.
 
         name - optional name for the schema if not given it will be taken from
@@ -31,6 +81,24 @@ class SchemaField(BaseField):
 
         fields - optional list of fields that should be added to this schema,
             allows to modyfy on the fly content of SchemaField
+
+        lazy - nested schemas and collections are loaded (normalised and
+            validated) only when they are read, see `force`
+
+        fail_fast, max_errors - limit of errors of nested collections, see
+            CollectionField
+
+        memo - memo.Cache, identical payloads are loaded once by compiled
+            paths (`load_python`, `check`), `.loads` doesn't use it, see memo
+
+        cache_dumps - `as_json` and `as_python` are computed once and kept
+            until value changes (through `value` setter, reload or `update`
+            of the schema or any nested field), every caller gets a copy of
+            cached output (containers are copied, see misc.copy_payload)
+
+        keep_payload - copy of loaded payload is kept (it's passed down to
+            nested schemas), it's required by `update`, payloads of nested
+            fields of lazy schema are copied only once they are loaded
         """
         # name is mandatory, but SchemaField is a class and as such we
         # can take class name as a name
@@ -57,38 +125,43 @@ class SchemaField(BaseField):
             if exception_on_unknown is None else exception_on_unknown
         )
 
+        self.lazy = (
+            (True if self.lazy is True else False)
+            if lazy is None else lazy
+        )
+
+        self.max_errors = (
+            (1 if fail_fast else self.max_errors)
+            if max_errors is None else max_errors
+        )
+
+        self.memo = self.memo if memo is None else memo
+
+        self.cache_dumps = (
+            (True if self.cache_dumps is True else False)
+            if cache_dumps is None else cache_dumps
+        )
+
+        self.keep_payload = (
+            (True if self.keep_payload is True else False)
+            if keep_payload is None else keep_payload
+        )
+
         self.schema = self.__class__ if schema is None else schema
 
+        self._computed_fields = None
+        self._plan = None
+
     def materialise(self):
         if isinstance(self.schema, str):
-            schema = misc.ImportModule(self.schema).get_class()
+            schema = registry.resolve(self.schema)
         elif isinstance(self.schema, SchemaField):
             schema = self.schema.__class__
         else:
             schema = self.schema
 
-        self._computed_fields = {}
-
-        for field in self.fields:
-            if field.name in self._computed_fields:
-                continue
-
-            self._computed_fields[field.name] = field.make_new(
-                name=field.name)
-
-        # reads all parents and adds all parents fields to our list of fields
-        for ancestor in schema.mro()[:-1]:
-            fields = getattr(ancestor, 'fields', None)
-
-            if not fields:
-                continue
-
-            for field in fields:
-                if field.name in self._computed_fields:
-                    continue
-
-                self._computed_fields[field.name] = field.make_new(
-                    name=field.name)
+        self._plan = plan.get_plan(schema, self.fields)
+        self._computed_fields = self._plan.fields
 
         super().materialise()
 
@@ -98,17 +171,22 @@ class SchemaField(BaseField):
         if value is None:
             return value
 
+        if not isinstance(value, misc.mapping_types):
+            error = exception.Error('not_mapping', value)
+
+            self.error_records.append(error)
+
+            raise exception.NormalisationError(error)
+
         if self.exception_on_unknown:
-            unknown_keys = set(value.keys()).difference(
-                set(self._computed_fields.keys()))
+            unknown_keys = self._plan.unknown_keys(value.keys())
 
             if unknown_keys:
-                message = "Unexpected payload with key(s): {}".format(
-                    ', '.join(unknown_keys))
+                error = exception.Error('unknown_keys', unknown_keys)
 
-                self.errors.append(message)
+                self.error_records.append(error)
 
-                raise exception.UnknownFieldError(message)
+                raise exception.UnknownFieldError(error)
 
         return value
 
@@ -118,9 +196,29 @@ class SchemaField(BaseField):
         kwargs.setdefault('schema', self.schema)
         kwargs.setdefault('fields', self.fields)
         kwargs.setdefault('exception_on_unknown', self.exception_on_unknown)
+        kwargs.setdefault('lazy', self.lazy)
+        kwargs.setdefault('max_errors', self.max_errors)
+        kwargs.setdefault('memo', self.memo)
+        kwargs.setdefault('cache_dumps', self.cache_dumps)
+        kwargs.setdefault('keep_payload', self.keep_payload)
 
         return kwargs
 
+    def copy_configuration(self, instance):
+        # pylint: disable=protected-access
+        super().copy_configuration(instance)
+
+        instance.exception_on_unknown = self.exception_on_unknown
+        instance.lazy = self.lazy
+        instance.max_errors = self.max_errors
+        instance.memo = self.memo
+        instance.cache_dumps = self.cache_dumps
+        instance.keep_payload = self.keep_payload
+        instance.fields = self.fields
+        instance.schema = self.schema
+        instance._computed_fields = self._computed_fields
+        instance._plan = self._plan
+
     def _loads(self, payload):
         if payload is None:
             self.value = None
@@ -128,14 +226,322 @@ class SchemaField(BaseField):
             return
 
         schema = {}
+        pending = {} if self.lazy else None
+
+        for key, field in self._computed_fields.items():
+            if key in payload:
+                # prototype is materialised once, every instance made out of
+                # it later on reuses the outcome
+                if not field.is_materialised:
+                    field.materialise()
+
+                schema[key] = field.make_new()
+
+                if self.max_errors is not None:
+                    schema[key].limit_errors(self.max_errors)
+
+                if self.keep_payload:
+                    schema[key].keep_payloads()
+
+                if pending is not None and isinstance(
+                        field, (SchemaField, CollectionField)):
+                    pending[key] = payload[key]
+                else:
+                    try:
+                        schema[key].loads(payload[key])
+                    except exception.PayloadError as err:
+                        # error is reported from the point of view of the
+                        # schema
+                        exception.relocate(err, key)
+
+                        raise
+            else:
+                schema[key] = field.make_new()
+
+            schema[key].parent = self
+
+        self.value = schema
+        self._pending = pending or None
+
+        if self.keep_payload:
+            self._payload = self._keep(payload, payload)
+
+    @staticmethod
+    def _load_child(field, key, payload):
+        """Loads nested field (see `_loads`) outside of the main loop.
+        """
+        try:
+            field.loads(payload)
+        except exception.PayloadError as err:
+            exception.relocate(err, key)
+
+            raise
+
+    def limit_errors(self, max_errors):
+        if self.max_errors is None:
+            self.max_errors = max_errors
+
+    def keep_payloads(self):
+        self.keep_payload = True
+
+    def reset_state(self):
+        super().reset_state()
+
+        self._pending = None
+        self._payload = None
+        self._dumps = None
+        self._changes = None
+
+    def _child_changed(self, child, itself):
+        changes = self._changes
+
+        if changes is None:
+            changes = self._changes = {}
+
+        changes[child.name] = itself or changes.get(child.name, False)
+
+        self._dumps = None
+
+        super()._child_changed(child, itself)
+
+    def dump_changes(self):
+        """Returns `as_json` representation of fields changed since the
+        schema was loaded (through `value` setter, reload or `update`),
+        nested schemas report only their own changes.
+        """
+        changes = self._changes
+
+        if not changes or not self.is_set or self.value is None:
+            return {}
+
+        output = {}
+
+        # the same order as `as_json`
+        for key, field in self.value.items():
+            if key not in changes:
+                continue
+
+            if not changes[key] and isinstance(field, SchemaField):
+                output[key] = field.dump_changes()
+            elif field.computed_value is not misc.NotSet:
+                output[key] = field.as_json()
+
+        return output
+
+    def update(self, partial):
+        """Applies partial payload to already loaded schema, outcome is the
+        same as loading again payload merged with partial one (keys of nested
+        schemas are merged as well, any other value is replaced). Only keys
+        present in partial payload are loaded again, validators of schema
+        are run against merged payload.
+
+        Schema has to be configured with keep_payload, loaded payload is
+        kept only then. On failure field is left in the same state failed
+        `.loads` would leave it.
+        """
+        # pylint: disable=protected-access
+        if not self.keep_payload:
+            raise exception.SchemaConfigurationError(
+                f"SchemaField {self.name} can be updated only with "
+                f"keep_payload=True")
+
+        if partial is None or not self.is_set or self._payload is None:
+            self.loads(partial)
+
+            return
+
+        self.error_records = []
+
+        try:
+            partial = self.normalise(partial)
+
+            payload = self._merge(self._payload, partial)
+
+            self.validate(payload)
+
+            self._update(payload, partial)
+        except exception.PayloadError:
+            errors = self.error_records
+
+            self.reset_state()
+
+            self.error_records = errors
+
+            raise
+
+        self._payload = self._keep(payload, partial)
+
+    def _keep(self, payload, keys):
+        """Returns payload kept for `update`, values of given keys are copied
+        (caller may change its own payload later on), nested schemas that
+        were loaded already kept copies of their own, payloads of pending
+        fields are not copied (they are once they are loaded).
+        """
+        # pylint: disable=protected-access
+        kept = dict(payload)
+        schema = self.value
+        pending = self._pending or ()
+
+        for key in keys:
+            value = payload[key]
+
+            # any other value is shared (it's meant to be immutable)
+            if not isinstance(value, (dict, list)) or key in pending:
+                continue
+
+            field = schema.get(key)
+
+            if isinstance(field, SchemaField) and field._payload is not None:
+                kept[key] = field._payload
+            else:
+                kept[key] = misc.copy_payload(value)
+
+        return kept
+
+    def _update(self, payload, partial):
+        # pylint: disable=protected-access
+        schema = self.value
 
         for key, field in self._computed_fields.items():
+            if key not in partial:
+                continue
+
+            if self._pending and key in self._pending:
+                del self._pending[key]
+
+            current = schema[key]
+
+            if isinstance(current, SchemaField) and current.is_set and \
+                    current._payload is not None and \
+                    isinstance(partial[key], dict):
+                self._update_child(current, key, partial[key])
+
+                self._child_changed(current, False)
+
+                continue
+
+            if not field.is_materialised:
+                field.materialise()
+
             schema[key] = field.make_new()
+            schema[key].parent = self
+
+            if self.max_errors is not None:
+                schema[key].limit_errors(self.max_errors)
 
+            schema[key].keep_payloads()
+
+            if self.lazy and isinstance(field, (SchemaField, CollectionField)):
+                if self._pending is None:
+                    self._pending = {}
+
+                self._pending[key] = payload[key]
+            else:
+                self._load_child(schema[key], key, payload[key])
+
+            self._child_changed(schema[key], True)
+
+    @staticmethod
+    def _update_child(field, key, partial):
+        """Updates nested schema, errors are reported the way `_load_child`
+        reports them.
+        """
+        try:
+            field.update(partial)
+        except exception.PayloadError as err:
+            exception.relocate(err, key)
+
+            raise
+
+    def _merge(self, payload, partial):
+        """Returns payload merged with partial one, payloads of nested schemas
+        are merged recursively.
+        """
+        # pylint: disable=protected-access
+        if not self.is_materialised:
+            self.materialise()
+
+        merged = dict(payload)
+
+        for key, value in partial.items():
+            field = self._computed_fields.get(key)
+            current = payload.get(key)
+
+            if isinstance(field, SchemaField) and \
+                    isinstance(current, dict) and isinstance(value, dict):
+                merged[key] = field._merge(current, value)
+            else:
+                merged[key] = value
+
+        return merged
+
+    def _load_pending(self, key=None):
+        """Loads nested fields of lazy schema which were not read yet, given
+        key or all of them. Field stays pending until it's loaded without
+        errors, thus every read raises the same error.
+        """
+        pending = self._pending
+
+        for name in list(pending) if key is None else [key]:
+            field = self.value[name]
+
+            # deferred loading is not a change of the value
+            field.parent = None
+
+            try:
+                self._load_child(field, name, pending[name])
+            finally:
+                field.parent = self
+
+            del pending[name]
+
+        if not pending:
+            self._pending = None
+
+    def force(self):
+        """Loads everything lazy schema (and lazy schemas nested in it)
+        deferred, errors are raised the same way eager `.loads` raises them.
+        """
+        if self._pending:
+            self._load_pending()
+
+        if not self.is_set or self.value is None:
+            return
+
+        for field in self.value.values():
+            field.force()
+
+    async def _aloads(self, payload, semaphore):
+        schema = {}
+        pending = {}
+
+        for key, field in self._computed_fields.items():
             if key in payload:
-                schema[key].loads(payload[key])
+                if not field.is_materialised:
+                    field.materialise()
 
-            schema[key].parent = self
+                schema[key] = field.make_new()
+
+                if self.max_errors is not None:
+                    schema[key].limit_errors(self.max_errors)
+
+                pending[key] = schema[key].aloads(payload[key], semaphore)
+            else:
+                schema[key] = field.make_new()
+
+        results = await asyncio.gather(
+            *pending.values(), return_exceptions=True)
+
+        # the same error as in synchronous path, the first failing key wins
+        for key, result in zip(pending, results):
+            if isinstance(result, exception.PayloadError):
+                exception.relocate(result, key)
+
+            if isinstance(result, BaseException):
+                raise result
+
+        for field in schema.values():
+            field.parent = self
 
         self.value = schema
 
@@ -162,6 +568,9 @@ class SchemaField(BaseField):
         return '\n'.join(output)
 
     def __eq__(self, dct):
+        if self._pending:
+            self._load_pending()
+
         if not hasattr(dct, 'items') or not hasattr(dct, 'keys'):
             raise exception.ReadValueError(
                 "Unable to compare SchemaField with non dict-like object "
@@ -198,41 +607,112 @@ class SchemaField(BaseField):
         return self.value.keys()
 
     def values(self):
+        if self._pending:
+            self._load_pending()
+
         return self.value.values()
 
     def items(self):
+        if self._pending:
+            self._load_pending()
+
         return self.value.items()
 
     def __getitem__(self, key):
         if key not in self._computed_fields:
             raise exception.ReadValueError(f"Schema has no field {key}")
 
+        if self._pending and key in self._pending:
+            self._load_pending(key)
+
         return self.value[key]
 
     def as_json(self):
+        return self._dump('as_json')
+
+    def as_python(self):
+        return self._dump('as_python')
+
+    def _iter_json(self):
+        if type(self).as_json is not SchemaField.as_json:
+            # representation was customised
+            yield from super()._iter_json()
+
+            return
+
+        if self._pending:
+            self._load_pending()
+
         if self.value is None:
-            return None
+            yield 'null'
 
-        output = {}
+            return
+
+        # pylint: disable=protected-access
+        encode = misc.json_encoder.encode
+
+        # the same keys in the same order as `as_json`
+        separator = '{'
 
         for key, field in self.value.items():
             if field.computed_value is misc.NotSet:
                 continue
 
-            output[key] = field.as_json()
+            if type(field)._iter_json is BaseField._iter_json:
+                # plain value, the most common case is not a generator
+                yield f'{separator}{encode(key)}: {encode(field.as_json())}'
+            else:
+                yield f'{separator}{encode(key)}: '
 
-        return output
+                yield from field._iter_json()
 
-    def as_python(self):
-        if self.value is None:
+            separator = ', '
+
+        yield '{}' if separator == '{' else '}'
+
+    def _dump(self, method):
+        if self._pending:
+            self._load_pending()
+
+        value = self.value
+
+        if value is None:
             return None
 
+        # cache is valid only for the dict it was made of, value of the
+        # schema itself can be replaced directly
+        dumps = self._dumps
+
+        if dumps is not None and dumps[0] is value and method in dumps[1]:
+            return misc.copy_payload(dumps[1][method])
+
+        output = self._dump_value(value, method)
+
+        if self.cache_dumps:
+            if dumps is None or dumps[0] is not value:
+                dumps = self._dumps = (value, {})
+
+            # caller may alter what it got, cached output stays intact
+            dumps[1][method] = output
+
+            return misc.copy_payload(output)
+
+        return output
+
+    def _dump_value(self, value, method):
+        if self._plan is not None:
+            # generated out of the plan, see compiler.compile_dumper
+            output = self._plan.dumper(method)(value)
+
+            if output is not misc.NotSet:
+                return output
+
         output = {}
 
-        for key, field in self.value.items():
+        for key, field in value.items():
             if field.computed_value is misc.NotSet:
                 continue
 
-            output[key] = field.as_python()
+            output[key] = getattr(field, method)()
 
         return output
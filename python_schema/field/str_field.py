@@ -4,19 +4,22 @@ from .base_field import BaseField
 
 
 class StrField(BaseField):
+    __slots__ = ()
+
     def normalise(self, value):
         value = super().normalise(value)
 
         if value is None:
             return value
 
-        message = f"StrField cannot be populated with value: {value}"
-
         try:
             value = str(value)
         except (TypeError, ValueError):
-            self.errors.append(message)
+            # message is rendered only if someone reads it
+            error = exception.Error('str_invalid', value)
+
+            self.error_records.append(error)
 
-            raise exception.NormalisationError(message)
+            raise exception.NormalisationError(error)
 
         return value
@@ -0,0 +1,567 @@
+"""Incremental loading of a single (large) JSON document.
+
+Document is read in chunks and tokenized into events, payload is normalised
+and validated against the tree of SchemaField/CollectionField while it's
+being parsed. Raw document is never kept, memory use depends on nesting depth
+and on loaded data, not on size of the document:
+
+    with open('users.json', 'rb') as fp:
+        users = field.CollectionField('users', User).loads_json(fp)
+
+Outcome is the same as `json.loads` followed by `.load_python(payload)`,
+errors are reported in order of the document though: unknown key fails the
+schema as soon as it's read (message names only that key) and when payload
+has more than one error, the first one in the document is raised.
+
+Schemas and collections that have validators (they need the whole payload),
+memoised schemas and customised fields are built out of events and loaded
+via compiled loader, their payload is kept in memory while they are loaded.
+
+Tokenizer is pure python, loading is several times slower than `json.loads`
+followed by `.load_python`, it pays off when memory is the limit.
+"""
+import codecs
+import io
+import json
+import re
+
+from python_schema import compiler, exception, misc
+
+
+# how much data (in bytes or characters) is read at once
+CHUNK_SIZE = 64 * 1024
+
+# events yielded by Tokenizer, value is set only for KEY and VALUE
+START_MAP = 'start_map'
+END_MAP = 'end_map'
+START_ARRAY = 'start_array'
+END_ARRAY = 'end_array'
+KEY = 'key'
+VALUE = 'value'
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+_NUMBER = re.compile(r'(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?')
+
+# characters of number or constant, anything else ends it
+_TOKEN = re.compile(r'[^,:\[\]{}" \t\n\r]*')
+
+# characters of string that are taken as they are
+_STRING_CHUNK = re.compile(r'[^"\\\x00-\x1f]*')
+
+# escape sequence, surrogate pair is taken as a whole
+_ESCAPE = re.compile(
+    r'\\(?:["\\/bfnrt]'
+    r'|u[dD][89abAB][0-9a-fA-F]{2}\\u[dD][c-fC-F][0-9a-fA-F]{2}'
+    r'|u[0-9a-fA-F]{4})')
+
+# the longest escape sequence (surrogate pair)
+_MAX_ESCAPE = 12
+
+# constants json.loads accepts
+_CONSTANTS = {
+    'true': True,
+    'false': False,
+    'null': None,
+    'NaN': float('nan'),
+    'Infinity': float('inf'),
+    '-Infinity': float('-inf'),
+}
+
+
+class Tokenizer:
+    """Pure python JSON event parser, reads file-like object (text or
+    binary, decoded as UTF-8) chunk by chunk. Only the unparsed rest of the
+    current chunk and the stack of open containers are kept.
+
+    Invalid JSON raises ValueError, position is counted in
+    characters from the beginning of the document.
+    """
+
+    def __init__(self, fp, chunk_size=CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = None
+        self.buffer = ''
+        self.pos = 0
+        # characters dropped from the buffer so far
+        self.offset = 0
+        self.eof = False
+        # open containers, START_MAP or START_ARRAY
+        self.stack = []
+
+    def fill(self):
+        data = self.fp.read(self.chunk_size)
+
+        # end is told by what was read, part of multi-byte character
+        # decodes to nothing
+        self.eof = not data
+
+        if isinstance(data, (bytes, bytearray)):
+            if self.decoder is None:
+                self.decoder = codecs.getincrementaldecoder('utf-8-sig')()
+
+            data = self.decoder.decode(data, final=self.eof)
+
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+
+    def error(self, message, position=None):
+        # document is not kept, only the position is reported
+        if position is None:
+            position = self.offset + self.pos
+
+        return ValueError(f"{message}: char {position}")
+
+    def peek(self):
+        """Skips whitespace, returns next character ('' at the end).
+        """
+        # fast path, there is no whitespace between most of tokens
+        if self.pos < len(self.buffer):
+            char = self.buffer[self.pos]
+
+            if char not in ' \t\n\r':
+                return char
+
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+
+            if self.eof:
+                return ''
+
+            self.fill()
+
+    def string(self):
+        try:
+            value, end = json.decoder.scanstring(self.buffer, self.pos + 1)
+        except json.JSONDecodeError:
+            # string is split between chunks (or it's invalid)
+            return self.split_string()
+
+        self.pos = end
+
+        return value
+
+    def split_string(self):
+        """Decodes string piece by piece, decoded pieces are dropped from the
+        buffer and never scanned again, invalid escape fails right away.
+        """
+        start = self.offset + self.pos
+        pieces = []
+
+        self.pos += 1
+
+        while True:
+            end = _STRING_CHUNK.match(self.buffer, self.pos).end()
+
+            pieces.append(self.buffer[self.pos:end])
+
+            self.pos = end
+
+            if end == len(self.buffer):
+                if self.eof:
+                    raise self.error("Unterminated string starting at", start)
+
+                self.fill()
+
+                continue
+
+            char = self.buffer[end]
+
+            if char == '"':
+                self.pos += 1
+
+                return ''.join(pieces)
+
+            if char != '\\':
+                raise self.error("Invalid control character at")
+
+            # escape sequence can be split between chunks as well
+            while len(self.buffer) - self.pos < _MAX_ESCAPE and not self.eof:
+                self.fill()
+
+            match = _ESCAPE.match(self.buffer, self.pos)
+
+            if match is None:
+                if self.buffer[self.pos + 1:self.pos + 2] == 'u':
+                    raise self.error("Invalid \\uXXXX escape")
+
+                raise self.error("Invalid \\escape")
+
+            pieces.append(json.decoder.scanstring(f'"{match.group()}"', 1)[0])
+
+            self.pos = match.end()
+
+    def scalar(self, char):
+        if char == '"':
+            return self.string()
+
+        while True:
+            end = _TOKEN.match(self.buffer, self.pos).end()
+
+            # number or constant can continue in the next chunk
+            if end < len(self.buffer) or self.eof:
+                break
+
+            self.fill()
+
+        token = self.buffer[self.pos:end]
+
+        match = _NUMBER.fullmatch(token)
+
+        if match is not None:
+            integer, fraction, exponent = match.groups()
+
+            value = float(token) if fraction or exponent else int(integer)
+        elif token in _CONSTANTS:
+            value = _CONSTANTS[token]
+        else:
+            raise self.error("Expecting value")
+
+        self.pos = end
+
+        return value
+
+    def expect(self, char, message):
+        if self.peek() != char:
+            raise self.error(message)
+
+        self.pos += 1
+
+    def events(self):
+        """Yields tuples (event, value), after the last event of the
+        top-level value it makes sure only whitespace follows.
+        """
+        # pylint: disable=too-many-branches
+        stack = self.stack
+        # what is expected next: value, first value of array, key (or end
+        # of map if first), or whatever can follow a value
+        state = 'value'
+
+        while True:
+            char = self.peek()
+
+            if state == 'value':
+                if char == '{':
+                    self.pos += 1
+                    stack.append(START_MAP)
+                    state = 'first_key'
+
+                    yield START_MAP, None
+                elif char == '[':
+                    self.pos += 1
+                    stack.append(START_ARRAY)
+                    state = 'first_value'
+
+                    yield START_ARRAY, None
+                else:
+                    value = self.scalar(char)
+                    state = 'after_value'
+
+                    yield VALUE, value
+            elif state == 'first_value':
+                if char == ']':
+                    self.pos += 1
+                    stack.pop()
+                    state = 'after_value'
+
+                    yield END_ARRAY, None
+                else:
+                    state = 'value'
+            elif state in ('key', 'first_key'):
+                if char == '}' and state == 'first_key':
+                    self.pos += 1
+                    stack.pop()
+                    state = 'after_value'
+
+                    yield END_MAP, None
+                elif char == '"':
+                    key = self.string()
+
+                    self.expect(':', "Expecting ':' delimiter")
+
+                    state = 'value'
+
+                    yield KEY, key
+                else:
+                    raise self.error(
+                        "Expecting property name enclosed in double quotes")
+            elif not stack:
+                if char:
+                    raise self.error("Extra data")
+
+                return
+            elif char == ',':
+                self.pos += 1
+                state = 'key' if stack[-1] is START_MAP else 'value'
+            elif char == '}' and stack[-1] is START_MAP:
+                self.pos += 1
+                stack.pop()
+
+                yield END_MAP, None
+            elif char == ']' and stack[-1] is START_ARRAY:
+                self.pos += 1
+                stack.pop()
+
+                yield END_ARRAY, None
+            else:
+                raise self.error("Expecting ',' delimiter")
+
+
+class Loader:
+    """Loads events of Tokenizer according to the field, mirror of compiled
+    loader (see compiler) working on events instead of python data.
+    """
+
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        self.events = tokenizer.events()
+        # id of field: (event that starts streamed value or None, field)
+        self.starts = {}
+
+    def start_of(self, field):
+        """Returns event that starts value which is loaded while it's being
+        parsed (START_MAP or START_ARRAY), None if field needs the whole
+        value.
+        """
+        try:
+            return self.starts[id(field)][0]
+        except KeyError:
+            pass
+
+        kind = compiler.get_kind(field)
+
+        if not field.is_materialised:
+            field.materialise()
+
+        start = None
+
+        if field.validators:
+            pass
+        elif kind is compiler.SchemaField and field.memo is None:
+            start = START_MAP
+        elif kind is compiler.CollectionField:
+            start = START_ARRAY
+
+        # field is kept so that its id won't be reused
+        self.starts[id(field)] = (start, field)
+
+        return start
+
+    def load(self, field, errors, max_errors=None):
+        """Loads the next value, `errors` collects errors of the field,
+        `max_errors` is the limit of errors inherited from the parent.
+        """
+        event, value = next(self.events)
+
+        return self.load_value(field, event, value, errors, max_errors)
+
+    def load_value(self, field, event, value, errors, max_errors):
+        if event is VALUE:
+            return field.get_compiled('loader', max_errors)(value, errors)
+
+        start = self.start_of(field)
+
+        if event is START_MAP and start is START_MAP:
+            return self.schema(field, errors, max_errors)
+
+        if event is START_ARRAY and start is START_ARRAY:
+            return self.collection(field, errors, max_errors)
+
+        # fields that need the whole payload
+        value = self.build(event)
+
+        return field.get_compiled('loader', max_errors)(value, errors)
+
+    def schema(self, field, errors, max_errors):
+        # pylint: disable=protected-access
+        if field.max_errors is not None:
+            max_errors = field.max_errors
+
+        fields = field._computed_fields
+        output = {}
+
+        for event, key in self.events:
+            if event is END_MAP:
+                break
+
+            child = fields.get(key)
+
+            if child is None:
+                if field.exception_on_unknown:
+                    error = exception.Error('unknown_keys', [key])
+
+                    errors.append(error)
+
+                    raise exception.UnknownFieldError(error)
+
+                self.skip()
+
+                continue
+
+            # errors of children are not kept on the schema, see compiler
+            try:
+                output[key] = self.load(child, [], max_errors)
+            except exception.PayloadError as err:
+                exception.relocate(err, key)
+
+                raise
+
+        # output follows order of fields, the same as compiled loader
+        data = {}
+
+        for key, child in fields.items():
+            if key in output:
+                data[key] = output[key]
+            elif child.default_value is not misc.NotSet:
+                data[key] = compiler._missing(child)
+
+        return data
+
+    def collection(self, field, errors, max_errors):
+        # pylint: disable=protected-access
+        if field.max_errors is not None:
+            max_errors = field.max_errors
+
+        element = field._computed_type
+        stack = self.tokenizer.stack
+        collection = []
+        normalisation_errors = {}
+        validation_errors = {}
+        idx = -1
+
+        for event, value in self.events:
+            if event is END_ARRAY:
+                break
+
+            idx += 1
+            depth = len(stack) - (event is START_MAP or event is START_ARRAY)
+            element_errors = []
+
+            try:
+                collection.append(self.load_value(
+                    element, event, value, element_errors, max_errors))
+
+                continue
+            except exception.NormalisationError as err:
+                normalisation_errors[idx] = exception.locate_errors(
+                    element_errors, err, idx)
+            except exception.ValidationError as err:
+                validation_errors[idx] = exception.locate_errors(
+                    element_errors, err, idx)
+            except exception.PayloadError as err:
+                exception.relocate(err, idx)
+
+                raise
+
+            # element could fail half way through, rest of it is skipped
+            while len(stack) > depth:
+                next(self.events)
+
+            if max_errors is not None and \
+                    len(normalisation_errors) + len(validation_errors) >= \
+                    max_errors:
+                break
+
+        if normalisation_errors:
+            errors[:] = [normalisation_errors]
+
+            raise exception.PayloadError(
+                exception.Error('invalid_items', errors))
+
+        if validation_errors:
+            errors[:] = [validation_errors]
+
+            raise exception.ValidationError(
+                exception.Error('validation_failed', errors))
+
+        return collection
+
+    def build(self, event):
+        """Builds python data out of container that has just started.
+        """
+        if event is START_MAP:
+            data = {}
+
+            for event_, key in self.events:
+                if event_ is END_MAP:
+                    return data
+
+                event_, value = next(self.events)
+
+                data[key] = value if event_ is VALUE else self.build(event_)
+
+        data = []
+
+        for event_, value in self.events:
+            if event_ is END_ARRAY:
+                return data
+
+            data.append(value if event_ is VALUE else self.build(event_))
+
+        return data
+
+    def skip(self):
+        """Skips the next value.
+        """
+        stack = self.tokenizer.stack
+        depth = len(stack)
+
+        next(self.events)
+
+        while len(stack) > depth:
+            next(self.events)
+
+    def finish(self):
+        """Makes sure that nothing but whitespace follows loaded value.
+        """
+        for _ in self.events:
+            pass
+
+
+def _open(source):
+    if isinstance(source, str):
+        return io.StringIO(source)
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+
+    return source
+
+
+def loads_json(schema, source, chunk_size=CHUNK_SIZE):
+    """Loads JSON document incrementally, returns normalised python data (the
+    same `.load_python` returns).
+
+    schema - field (class or instance) used as a definition, it is never
+        altered
+
+    source - JSON document (bytes or str) or file-like object (text or
+        binary) opened for reading
+
+    On failure exception carries errors the field would hold in `.errors`
+    attribute, invalid JSON raises ValueError.
+    """
+    if isinstance(schema, type):
+        schema = schema()
+
+    loader = Loader(Tokenizer(_open(source), chunk_size))
+
+    errors = []
+
+    try:
+        data = loader.load(schema, errors)
+    except StopIteration:
+        raise loader.tokenizer.error("Expecting value") from None
+    except exception.PayloadError as err:
+        err.error_records = errors
+
+        raise
+
+    loader.finish()
+
+    return data
@@ -0,0 +1,244 @@
+"""Memoisation of repeated sub-payloads.
+
+Payloads often repeat identical sub-documents (the same address in thousands
+of rows), SchemaField configured with a cache loads each distinct payload
+once, identical payload later on returns the same normalised data (or raises
+the same error) straight from the cache:
+
+    addresses = memo.Cache(maxsize=10000)
+
+    @memo.pure
+    def is_street(value):
+        ...
+
+    class Address(field.SchemaField):
+        memo = addresses
+
+        fields = [
+            field.StrField('street', validators=[is_street]),
+        ]
+
+    class Row(field.SchemaField):
+        fields = [
+            field.IntField('id'),
+            Address('address'),
+        ]
+
+    rows = field.CollectionField('rows', Row).load_python(payload)
+
+    print(addresses.stats())
+
+Cache is configuration of the field (the same as `exception_on_unknown`), it
+is used only by compiled paths (`load_python`, `check`, see compiler),
+`.loads` builds field instances and never consults the cache. Payloads are
+keyed by schema and their canonical form (see `canonical`), payloads that
+are not plain JSON data are never cached. Every hit returns its own copy of
+cached data, callers can change what they got.
+
+Computing the key and copying cached data cost about as much as loading a
+small schema with cheap validators, memoisation pays off when validators are
+expensive or when sub-documents repeat a lot.
+
+Only schemas whose validators (including validators of nested fields) are
+all declared pure (see `pure`) can be memoised.
+"""
+import collections
+import math
+
+from python_schema import exception, misc
+
+
+def pure(function):
+    """Declares validator pure, its outcome depends only on the value it
+    validates (no I/O, no time or state dependency).
+    """
+    function.pure = True
+
+    return function
+
+
+def is_pure(validator):
+    return getattr(validator, 'pure', False) is True
+
+
+def insist_pure(field, seen=None):
+    """Raises SchemaConfigurationError unless every validator of the field
+    and its nested fields is declared pure.
+    """
+    # pylint: disable=protected-access
+    seen = set() if seen is None else seen
+
+    if id(field) in seen:
+        return
+
+    seen.add(id(field))
+
+    for validator in field.validators:
+        if not is_pure(validator):
+            raise exception.SchemaConfigurationError(
+                f"Field {field.name} cannot be memoised, validator "
+                f"{validator!r} is not declared pure")
+
+    if not field.is_materialised:
+        field.materialise()
+
+    nested = getattr(field, '_computed_fields', None) or {}
+
+    for child in nested.values():
+        insist_pure(child, seen)
+
+    element = getattr(field, '_computed_type', None)
+
+    if element is not None:
+        insist_pure(element, seen)
+
+
+def canonical(payload):
+    """Returns hashable form of payload, equal for payloads that load the
+    same way. Order of keys doesn't matter, types do (list and tuple, 1 and
+    True or '1' are told apart), raises TypeError (or ValueError) if payload
+    is not plain JSON data (dict, list, tuple, str, int, float, bool, None,
+    exactly those types, floats have to be finite).
+    """
+    kind = type(payload)
+
+    # the most common values are their own form, so is None, any other
+    # scalar is tagged with its type (1, 1.0 and True are equal in python)
+    if kind is str or kind is int or payload is None:
+        return payload
+
+    if kind is dict:
+        return (dict, frozenset([
+            (canonical(key), canonical(value))
+            for key, value in payload.items()
+        ]))
+
+    if kind is list or kind is tuple:
+        return (kind, tuple([canonical(value) for value in payload]))
+
+    if kind is bool:
+        return (bool, payload)
+
+    if kind is float:
+        if not math.isfinite(payload):
+            raise ValueError(f"Value {payload} is not allowed in JSON")
+
+        return (float, payload)
+
+    raise TypeError(f"Value of type {kind.__name__} is not plain JSON data")
+
+
+class Cache:
+    """Bounded cache of loaded payloads.
+
+    maxsize - how many entries cache keeps at most
+
+    policy - which entry is evicted once cache is full, `lru` (least
+        recently used) or `fifo` (the oldest one)
+    """
+
+    POLICIES = ('lru', 'fifo')
+
+    def __init__(self, maxsize=1024, policy='lru'):
+        if policy not in self.POLICIES:
+            raise exception.SchemaConfigurationError(
+                "Unknown eviction policy {}, expected one of: {}".format(
+                    policy, ', '.join(self.POLICIES)))
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Returns cached entry or None.
+        """
+        try:
+            entry = self.entries[key]
+
+            if self.policy == 'lru':
+                self.entries.move_to_end(key)
+        except KeyError:
+            # missing or evicted meanwhile by another thread, counters are
+            # approximate when cache is shared by threads
+            self.misses += 1
+
+            return None
+
+        self.hits += 1
+
+        return entry
+
+    def set(self, key, entry):
+        entries = self.entries
+
+        entries[key] = entry
+
+        while len(entries) > self.maxsize:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                break
+
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.entries),
+            'maxsize': self.maxsize,
+        }
+
+
+def memoised(cache, token, function):
+    """Wraps compiled function `function(value, errors)` of SchemaField,
+    token identifies the schema (together with hash of payload it's the key
+    of the cache).
+    """
+    def load(value, errors):
+        try:
+            key = (token, canonical(value))
+        except (TypeError, ValueError):
+            return function(value, errors)
+
+        entry = cache.get(key)
+
+        if entry is None:
+            own_errors = []
+
+            try:
+                result = function(value, own_errors)
+            except exception.PayloadError as err:
+                entry = (
+                    type(err), exception.args_of(err), list(own_errors))
+
+                cache.set(key, entry)
+
+                errors.extend(own_errors)
+
+                raise
+
+            cache.set(key, (None, result, None))
+
+            errors.extend(own_errors)
+
+            return misc.copy_payload(result)
+
+        error, data, own_errors = entry
+
+        if error is None:
+            return misc.copy_payload(data)
+
+        errors.extend(own_errors)
+
+        raise error(*data)
+
+    return load
@@ -1,10 +1,21 @@
+import collections.abc
 import importlib
+import json
+
+from python_schema import exception
 
 
 class NotSet:
     pass
 
 
+# encoder with the same settings json.dumps uses by default
+json_encoder = json.JSONEncoder()
+
+# types schemas can be loaded from, dict goes first (it's checked the most)
+mapping_types = (dict, collections.abc.Mapping)
+
+
 class ImportModule:
     def __init__(self, path_to_class):
         self.class_name = path_to_class.split('.')[-1]
@@ -16,3 +27,40 @@ class ImportModule:
         module = importlib.import_module(self.path_to_module)
 
         return getattr(module, self.class_name)
+
+
+def copy_payload(payload):
+    """Returns copy of payload, dictionaries and lists are copied all the way
+    down, any other value is shared (it's meant to be immutable).
+    """
+    if isinstance(payload, dict):
+        payload = payload.copy()
+
+        # only values that are containers are copied again
+        for key, value in payload.items():
+            if isinstance(value, (dict, list)):
+                payload[key] = copy_payload(value)
+    elif isinstance(payload, list):
+        payload = payload.copy()
+
+        for idx, value in enumerate(payload):
+            if isinstance(value, (dict, list)):
+                payload[idx] = copy_payload(value)
+
+    return payload
+
+
+def reject_awaitable(validate, awaitable):
+    """Raises SchemaConfigurationError, validator returned awaitable on
+    synchronous path (it's coroutine function), those are awaited only by
+    `.aloads`.
+    """
+    # coroutine would warn that it was never awaited
+    close = getattr(awaitable, 'close', None)
+
+    if close is not None:
+        close()
+
+    raise exception.SchemaConfigurationError(
+        f"Validator {validate!r} returned awaitable, asynchronous validators "
+        f"can be used only with `.aloads`")
@@ -0,0 +1,141 @@
+"""Loading of large batches of payloads in worker processes.
+
+Schema is pickled and sent to every worker only once, there it's compiled
+(see `compiler.compile_loader`) and used for all chunks of payloads that
+worker receives:
+
+    loaded, errors = parallel.loads_many(User, payloads, max_workers=32)
+
+Since loaded field instances would have to be pickled on the way back,
+workers return normalised python data (the same `.as_python()` returns).
+"""
+import collections
+import hashlib
+import itertools
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from python_schema import compiler, exception
+
+
+CHUNK_SIZE = 1000
+
+# how many chunks can wait for processing at once
+MAX_PENDING = 2 * (os.cpu_count() or 1)
+
+
+# loaders compiled in this (worker) process, keyed by token of the schema,
+# executor given by the caller may outlive any number of batches, thus only
+# MAX_LOADERS most recently used ones are kept
+_loaders = collections.OrderedDict()
+
+MAX_LOADERS = 16
+
+
+def _compile(token, schema):
+    _loaders[token] = compiler.compile_loader(schema)
+
+    if len(_loaders) > MAX_LOADERS:
+        _loaders.popitem(last=False)
+
+
+def _load_chunk(token, schema, start, payloads):
+    try:
+        loader = _loaders[token]
+    except KeyError:
+        _compile(token, schema)
+
+        loader = _loaders[token]
+    else:
+        _loaders.move_to_end(token)
+
+    loaded = {}
+    errors = {}
+
+    for idx, payload in enumerate(payloads, start):
+        payload_errors = []
+
+        try:
+            loaded[idx] = loader(payload, payload_errors)
+        except exception.PayloadError as err:
+            # the same errors BaseField.loads_many reports
+            errors[idx] = payload_errors or [exception.error_of(err)]
+
+    return loaded, errors
+
+
+def _chunks(payloads, chunk_size):
+    iterator = iter(payloads)
+
+    for start in itertools.count(0, chunk_size):
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+        if not chunk:
+            return
+
+        yield start, chunk
+
+
+def loads_many(
+        schema, payloads, executor=None, max_workers=None,
+        chunk_size=CHUNK_SIZE):
+    """Parallel counterpart of BaseField.loads_many.
+
+    schema - SchemaField (class or instance) used as a definition
+
+    payloads - any iterable, it's consumed in chunks of chunk_size
+
+    executor - executor to use, ProcessPoolExecutor of max_workers is created
+        (and shut down) if not given, schema is sent to its workers when they
+        start, with executor given schema is sent along each chunk (and
+        compiled only once per worker anyway)
+
+    Returns tuple of two dictionaries keyed by index of payload, normalised
+    payloads and errors of payloads that failed to load (both in order).
+    """
+    if isinstance(schema, type):
+        schema = schema()
+
+    # copy in base state, there is no point sending loaded data around
+    schema = schema.make_new()
+
+    # the same schema yields the same token, batches of it share loaders
+    # compiled by workers of executor given by the caller
+    token = hashlib.sha1(pickle.dumps(schema)).hexdigest()
+
+    if executor is None:
+        with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_compile,
+                initargs=(token, schema)) as own_executor:
+            return _loads_many(
+                own_executor, token, None, payloads, chunk_size)
+
+    return _loads_many(executor, token, schema, payloads, chunk_size)
+
+
+def _loads_many(executor, token, schema, payloads, chunk_size):
+    loaded = {}
+    errors = {}
+
+    def collect(future):
+        chunk_loaded, chunk_errors = future.result()
+
+        loaded.update(chunk_loaded)
+        errors.update(chunk_errors)
+
+    # only limited number of chunks is sent ahead, payloads are streamed to
+    # workers as they go through them
+    pending = collections.deque()
+
+    for start, chunk in _chunks(payloads, chunk_size):
+        pending.append(
+            executor.submit(_load_chunk, token, schema, start, chunk))
+
+        if len(pending) >= MAX_PENDING:
+            collect(pending.popleft())
+
+    while pending:
+        collect(pending.popleft())
+
+    return loaded, errors
@@ -0,0 +1,156 @@
+import collections
+import weakref
+from types import MappingProxyType
+
+
+# compiled plans of every schema class (forgotten together with the class),
+# keyed by identity of fields that were given as an override, least recently
+# used ones are dropped once there are more than MAX_PLANS of them (schemas
+# built inline at runtime get new override with every call)
+_plans = weakref.WeakKeyDictionary()
+
+MAX_PLANS = 128
+
+
+class SchemaPlan:
+    """Compiled description of SchemaField.
+
+    Plan is what materialisation of SchemaField used to compute for every
+    new instance: resolved order of fields (own and inherited), set of known
+    keys (everything else is an unknown key) and prototypes of fields that
+    each loaded instance is made of. It is computed once per schema class and
+    `fields` override and shared by every instance that is using it.
+
+    Order and names of fields are read-only, prototypes are not: they are
+    materialised in place the first time they are loaded (see `children`),
+    which is what allows schemas to reference each other.
+    """
+
+    __slots__ = (
+        '_schema', 'fields', 'field_names', '_source', '_dumpers')
+
+    def __init__(self, schema, fields):
+        computed_fields = {}
+
+        for field in fields:
+            if field.name in computed_fields:
+                continue
+
+            computed_fields[field.name] = field.make_new(name=field.name)
+
+        # reads all parents and adds all parents fields to our list of fields
+        for ancestor in schema.mro()[:-1]:
+            for field in getattr(ancestor, 'fields', None) or ():
+                if field.name in computed_fields:
+                    continue
+
+                computed_fields[field.name] = field.make_new(name=field.name)
+
+        # plan must not keep schema class alive, it's the key of the cache
+        self._schema = weakref.ref(schema)
+        self.fields = MappingProxyType(computed_fields)
+        self.field_names = frozenset(computed_fields)
+
+        # keeps overrides alive, as long as plan exists their ids (part of
+        # the cache key) cannot be reused
+        self._source = tuple(fields)
+
+        # generated `as_json` and `as_python`, see `dumper`
+        self._dumpers = {}
+
+    @property
+    def schema(self):
+        return self._schema()
+
+    def __repr__(self):
+        return '<SchemaPlan({}: {})>'.format(
+            self.schema.__name__, ', '.join(self.fields))
+
+    @property
+    def children(self):
+        """Plans of nested schemas that were already resolved, either
+        directly (SchemaField) or as element of CollectionField.
+
+        Prototypes are materialised lazily (the first time given key shows up
+        in the payload), thus references to schemas that are never loaded are
+        never imported.
+        """
+        children = {}
+
+        for key, field in self.fields.items():
+            if not field.is_materialised:
+                continue
+
+            field = getattr(field, '_computed_type', field)
+            plan = getattr(field, '_plan', None)
+
+            if plan is not None:
+                children[key] = plan
+
+        return MappingProxyType(children)
+
+    def dumper(self, method):
+        """Returns function that dumps value of loaded schema the same way
+        `method` (`as_json` or `as_python`) would, it's generated once per
+        plan (see compiler.compile_dumper).
+        """
+        try:
+            return self._dumpers[method]
+        except KeyError:
+            pass
+
+        # compiler depends on field classes, thus it's imported lazily
+        from python_schema import compiler  # pylint: disable=cyclic-import
+
+        function = compiler.compile_dumper(self, method)
+
+        self._dumpers[method] = function
+
+        return function
+
+    def unknown_keys(self, keys):
+        return set(keys).difference(self.field_names)
+
+
+def get_plan(schema, fields):
+    """Returns plan for given schema class and fields, compiles it if this
+    combination was never seen before.
+    """
+    # fields declared on the schema class are going to be read from mro
+    # anyway, it's not an override and it should not yield separate plan
+    declared = getattr(schema, 'fields', None) or ()
+
+    if len(fields) == len(declared) and all(
+            field is other for field, other in zip(fields, declared)):
+        fields = ()
+
+    key = tuple(id(field) for field in fields)
+
+    plans = _plans.get(schema)
+
+    if plans is None:
+        plans = _plans.setdefault(schema, collections.OrderedDict())
+
+    try:
+        compiled = plans[key]
+    except KeyError:
+        pass
+    else:
+        plans.move_to_end(key)
+
+        return compiled
+
+    compiled = plans.setdefault(key, SchemaPlan(schema, fields))
+
+    if len(plans) > MAX_PLANS:
+        # instances that use evicted plan keep it, it's only not shared
+        # with new ones anymore
+        plans.popitem(last=False)
+
+    return compiled
+
+
+def clear():
+    """Forget all compiled plans, next materialisation compiles them again.
+    """
+    _plans.clear()
@@ -0,0 +1,123 @@
+from python_schema import exception, misc
+
+
+class TypeRegistry:
+    """Registry of classes that fields reference by string (lazy load).
+
+    Each dotted path is imported only once, following lookups are plain
+    dictionary reads. Schemas can be registered under short name as well and
+    then referenced by that name instead of the full path.
+
+    Intended use is to `preload` all schemas during boot time and `freeze`
+    registry afterwards, from that moment on unknown references are reported
+    as configuration error instead of triggering import in the middle of
+    request.
+    """
+
+    def __init__(self):
+        self._classes = {}
+        self._frozen = False
+
+    def __contains__(self, name):
+        return name in self._classes
+
+    @property
+    def is_frozen(self):
+        return self._frozen
+
+    def register(self, class_, name=None):
+        """Register class under given name (class name on default).
+        """
+        if name is None:
+            name = class_.__name__
+
+        if self._frozen:
+            raise exception.SchemaConfigurationError(
+                f"Registry is frozen, unable to register {name}")
+
+        registered = self._classes.setdefault(name, class_)
+
+        if registered is not class_:
+            raise exception.SchemaConfigurationError(
+                f"Name {name} is already taken by {registered}")
+
+        return class_
+
+    def resolve(self, name):
+        """Returns class registered under given name, dotted paths are
+        imported (only once) when seen for the first time.
+        """
+        try:
+            return self._classes[name]
+        except KeyError:
+            pass
+
+        if self._frozen:
+            raise exception.SchemaConfigurationError(
+                f"Registry is frozen, unable to resolve {name}")
+
+        if '.' not in name:
+            raise exception.SchemaConfigurationError(
+                f"Unknown name {name}, register it or use full dotted path")
+
+        return self._classes.setdefault(
+            name, misc.ImportModule(name).get_class())
+
+    def preload(self, *targets):
+        """Resolve given names and classes together with every string
+        reference found in their fields (recursively), so that no import
+        happens later on when loading payloads.
+        """
+        seen = set()
+        pending = list(targets)
+
+        while pending:
+            target = pending.pop()
+
+            if isinstance(target, str):
+                target = self.resolve(target)
+
+            if not isinstance(target, type) or target in seen:
+                continue
+
+            seen.add(target)
+
+            for ancestor in target.mro()[:-1]:
+                for field in getattr(ancestor, 'fields', None) or ():
+                    pending.extend(_references(field))
+
+    def freeze(self):
+        """Disallow any new registration or import, see `preload`.
+        """
+        self._frozen = True
+
+
+def _references(field):
+    """Returns all classes and names that given field refers to."""
+    references = []
+
+    for attr in ('schema', 'type_'):
+        reference = getattr(field, attr, None)
+
+        if reference is None:
+            continue
+
+        if isinstance(reference, (str, type)):
+            references.append(reference)
+        else:
+            references.append(reference.__class__)
+            references.extend(_references(reference))
+
+    for nested in getattr(field, 'fields', None) or ():
+        references.extend(_references(nested))
+
+    return references
+
+
+# process-wide registry used by fields
+default = TypeRegistry()
+
+register = default.register
+resolve = default.resolve
+preload = default.preload
+freeze = default.freeze
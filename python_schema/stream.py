@@ -0,0 +1,168 @@
+"""Validation of newline-delimited JSON (one payload per line).
+
+Lines are read in chunks of bounded size, each payload is loaded and yielded
+right away, nothing is kept, memory use doesn't depend on size of the file:
+
+    stats = stream.Stats()
+
+    for line_no, result in stream.ndjson('users.ndjson', User, stats=stats):
+        if isinstance(result, field.BaseField):
+            save(result.as_python())
+        else:
+            report(line_no, result)
+
+    print(stats.as_dict())
+"""
+import io
+import json
+import os
+import time
+
+from python_schema import exception
+
+
+# how much data (in bytes) is read from file at once, lines are never split
+# between chunks
+CHUNK_SIZE = 1024 * 1024
+
+
+class Stats:
+    """Counters of processed stream, updated while stream is consumed.
+    """
+
+    def __init__(self):
+        self.lines = 0
+        self.bytes = 0
+        self.valid = 0
+        self.invalid = 0
+        self.started = None
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+
+        finished = time.perf_counter() if self.finished is None else \
+            self.finished
+
+        return finished - self.started
+
+    @property
+    def lines_per_second(self):
+        return self.lines / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        return {
+            'lines': self.lines,
+            'bytes': self.bytes,
+            'valid': self.valid,
+            'invalid': self.invalid,
+            'elapsed': self.elapsed,
+            'lines_per_second': self.lines_per_second,
+            'bytes_per_second': self.bytes_per_second,
+        }
+
+
+def _read_chunks(fp, chunk_size):
+    while True:
+        lines = fp.readlines(chunk_size)
+
+        if not lines:
+            return
+
+        yield lines
+
+
+def ndjson(
+        source, schema, chunk_size=CHUNK_SIZE,
+        buffer_size=io.DEFAULT_BUFFER_SIZE, stats=None):
+    """Lazily loads every line of newline-delimited JSON with given schema.
+
+    source - path to the file or file-like object (text or binary) opened
+        for reading
+
+    schema - SchemaField (class or instance) used as a definition, it is
+        never altered (see BaseField.load)
+
+    chunk_size - how much data is read at once
+
+    buffer_size - size of read buffer, used only if source is a path
+
+    stats - optional Stats instance, updated as lines are processed
+
+    Yields tuples (line_no, result) where line_no starts with 1 and result is
+    either loaded instance of the schema or list of errors (invalid JSON is
+    reported the same way). Empty lines are skipped.
+    """
+    if isinstance(schema, type):
+        schema = schema()
+
+    if stats is None:
+        stats = Stats()
+
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb', buffering=buffer_size) as fp:
+            yield from _ndjson(fp, schema, chunk_size, stats)
+    else:
+        yield from _ndjson(source, schema, chunk_size, stats)
+
+
+def _ndjson(fp, schema, chunk_size, stats):
+    stats.started = time.perf_counter()
+    stats.finished = None
+
+    line_no = 0
+
+    for lines in _read_chunks(fp, chunk_size):
+        for line in lines:
+            line_no += 1
+
+            stats.lines += 1
+            # text stream yields characters, stats are kept in bytes
+            stats.bytes += len(
+                line.encode() if isinstance(line, str) else line)
+
+            if not line.strip():
+                continue
+
+            try:
+                payload = json.loads(line)
+            except ValueError as err:
+                stats.invalid += 1
+
+                yield line_no, [f"Invalid JSON: {err}"]
+
+                continue
+
+            if payload is not None and not isinstance(payload, dict):
+                # valid JSON, but not an object schema can be loaded with
+                # (None is up to the schema, see allow_none)
+                stats.invalid += 1
+
+                yield line_no, [
+                    f"Invalid payload: expected JSON object, got "
+                    f"{type(payload).__name__}"]
+
+                continue
+
+            try:
+                result = schema.load(payload)
+            except exception.PayloadError as err:
+                stats.invalid += 1
+
+                # errors of nested fields are not reported on SchemaField,
+                # in such case exception carries them
+                yield line_no, err.error_records or [err.error]
+
+                continue
+
+            stats.valid += 1
+
+            yield line_no, result
+
+    stats.finished = time.perf_counter()
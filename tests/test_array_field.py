@@ -0,0 +1,167 @@
+"""Checks if ArrayField loads numbers into array the same way CollectionField
+loads them into fields.
+"""
+
+import array
+import asyncio
+import pickle
+import struct
+
+import pytest
+
+from python_schema import exception, field
+
+
+class Telemetry(field.SchemaField):
+    fields = [
+        field.ArrayField('samples', typecode='i'),
+    ]
+
+
+def test_array_field_loads_numbers_into_array():
+    ids = field.ArrayField('ids')
+    ids.loads(['1', 2, '-3'])
+
+    assert isinstance(ids.value, array.array)
+    assert ids.value.typecode == 'q'
+    assert ids.as_python() == [1, 2, -3]
+    assert ids.as_json() == [1, 2, -3]
+    assert ids == [1, 2, -3]
+    assert ids[1] == 2
+    assert len(ids) == 3
+
+    ids.loads(iter(['4']))
+
+    assert ids.as_python() == [4]
+
+    ids.loads(None)
+
+    assert ids.as_python() is None
+
+
+def test_array_field_reports_errors_the_same_way_collection_does():
+    payload = ['1', 'a', 12.5, '4']
+
+    ids = field.ArrayField('ids')
+    collection = field.CollectionField('ids', field.IntField)
+
+    with pytest.raises(exception.PayloadError) as info:
+        ids.loads(payload)
+
+    with pytest.raises(exception.PayloadError) as expected:
+        collection.loads(payload)
+
+    assert str(info.value) == str(expected.value)
+    assert ids.errors == collection.errors
+
+
+def test_array_field_rejects_none_and_out_of_range_values():
+    ids = field.ArrayField('ids', typecode='b')
+
+    with pytest.raises(exception.PayloadError):
+        ids.loads([1, None, 1000])
+
+    assert ids.errors == [{
+        1: ['None is not allowed value'],
+        2: ['Value out of range: 1000'],
+    }]
+
+    ids = field.ArrayField('ids', fail_fast=True)
+
+    with pytest.raises(exception.PayloadError):
+        ids.loads([None, None])
+
+    assert ids.errors == [{0: ['None is not allowed value']}]
+
+
+def test_array_field_runs_validators_of_elements():
+    def is_even(val):
+        return f"Number is not even, got {val}" if val % 2 else True
+
+    ids = field.ArrayField('ids', field.IntField('id', validators=[is_even]))
+
+    ids.loads([2, 4])
+
+    assert ids.as_python() == [2, 4]
+
+    with pytest.raises(exception.ValidationError):
+        ids.loads([2, 3])
+
+    assert ids.errors == [{1: ['Number is not even, got 3']}]
+
+
+def test_array_field_configuration():
+    class Name(field.IntField):
+        def normalise(self, value):
+            return value
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        field.ArrayField('ids', Name).loads([1])
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        field.ArrayField('ids', lazy=True)
+
+    telemetry = Telemetry()
+    telemetry.loads({'samples': [1, 2]})
+
+    assert telemetry.value['samples'].value.typecode == 'i'
+    assert telemetry.load_python({'samples': ['3']}) == {'samples': [3]}
+    assert pickle.loads(pickle.dumps(telemetry)).as_python() == {
+        'samples': [1, 2]}
+
+
+def test_array_field_exposes_values_without_copy():
+    samples = field.ArrayField('samples', typecode='i')
+    samples.loads(['1', 2, 3])
+
+    view = samples.as_buffer()
+
+    assert view.format == 'i'
+    assert view.readonly
+    assert view.tolist() == [1, 2, 3]
+    assert struct.unpack('3i', view) == (1, 2, 3)
+    assert view.obj is samples.value
+
+    with pytest.raises(TypeError):
+        view[0] = 12
+
+    samples.loads(None)
+
+    assert samples.as_buffer() is None
+
+    with pytest.raises(exception.ReadValueError):
+        samples.__buffer__(0)
+
+    with pytest.raises(exception.ReadValueError):
+        field.ArrayField('samples').__buffer__(0)
+
+
+def test_async_validators_of_elements_are_awaited():
+    async def is_even(value):
+        await asyncio.sleep(0)
+
+        if value is None or value % 2 == 0:
+            return True
+
+        return f"Number is not even, got {value}"
+
+    samples = field.ArrayField(
+        'samples', field.IntField('sample', validators=[is_even]))
+
+    asyncio.run(samples.aloads(['2', 4]))
+
+    assert samples.value == array.array('q', [2, 4])
+
+    with pytest.raises(exception.PayloadError):
+        asyncio.run(samples.aloads([2, 3, None, 2 ** 70, 'x']))
+
+    assert samples.errors == [{
+        2: ['None is not allowed value'],
+        3: ['Value out of range: {}'.format(2 ** 70)],
+        4: ['IntField cannot be populated with value: x'],
+    }]
+
+    with pytest.raises(exception.ValidationError):
+        asyncio.run(samples.aloads([2, 3]))
+
+    assert samples.errors == [{1: ['Number is not even, got 3']}]
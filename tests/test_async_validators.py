@@ -0,0 +1,136 @@
+"""Checks if fields can be validated with coroutine functions.
+"""
+
+import asyncio
+
+import pytest
+
+from python_schema import exception, field
+
+
+class FakeStore:
+    """In-memory store pretending to be remote (each lookup takes a while).
+    """
+
+    def __init__(self, taken):
+        self.taken = set(taken)
+        self.running = 0
+        self.max_running = 0
+        self.calls = 0
+
+    async def is_unique(self, value):
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            self.running -= 1
+
+        return True if value not in self.taken else f"{value} is taken"
+
+
+def make_schema(store):
+    class User(field.SchemaField):
+        fields = [
+            field.StrField('login', validators=[store.is_unique]),
+            field.StrField('email', validators=[store.is_unique]),
+            field.CollectionField('aliases', field.StrField(
+                'alias', validators=[store.is_unique])),
+        ]
+
+    return User
+
+
+def test_async_validators_are_awaited():
+    store = FakeStore(['root'])
+    user = make_schema(store)()
+
+    asyncio.run(user.aloads({
+        'login': 'frank',
+        'email': 'frank@example.com',
+        'aliases': ['punisher', 'castle'],
+    }))
+
+    assert user == {
+        'login': 'frank',
+        'email': 'frank@example.com',
+        'aliases': ['punisher', 'castle'],
+    }
+    assert user['aliases'][0].parent is user['aliases']
+    assert user['login'].parent is user
+    assert store.calls == 4
+
+
+def test_async_errors_match_synchronous_path():
+    store = FakeStore(['root', 'admin'])
+    user = make_schema(store)()
+
+    aliases = field.CollectionField('aliases', field.StrField(
+        'alias', validators=[store.is_unique]))
+
+    with pytest.raises(exception.ValidationError):
+        asyncio.run(aliases.aloads(['admin', 'castle', 'root']))
+
+    assert aliases.errors == [{
+        0: ['admin is taken'],
+        2: ['root is taken'],
+    }]
+
+    with pytest.raises(exception.ValidationError) as info:
+        asyncio.run(user.aloads({'login': 'root'}))
+
+    assert str(info.value) == 'Validation error'
+
+    numbers = field.CollectionField('numbers', field.IntField)
+
+    with pytest.raises(exception.PayloadError) as info:
+        asyncio.run(numbers.aloads([1, 'a', 2, 'b']))
+
+    with pytest.raises(exception.PayloadError) as sync_info:
+        field.CollectionField('numbers', field.IntField).loads(
+            [1, 'a', 2, 'b'])
+
+    assert str(info.value) == str(sync_info.value)
+
+
+def test_async_validators_are_rejected_on_synchronous_paths():
+    store = FakeStore([])
+    schema = make_schema(store)
+
+    for load in [
+        lambda: schema().loads({'login': 'frank'}),
+        lambda: schema().load_python({'login': 'frank'}),
+        lambda: schema().check({'aliases': ['castle']}),
+        lambda: schema().loads_json('{"email": "frank@example.com"}'),
+    ]:
+        with pytest.raises(exception.SchemaConfigurationError) as info:
+            load()
+
+        assert '`.aloads`' in str(info.value)
+
+
+def test_semaphore_limits_concurrency():
+    store = FakeStore([])
+    collection = field.CollectionField('logins', field.StrField(
+        'login', validators=[store.is_unique]))
+
+    asyncio.run(collection.aloads([f'user{idx}' for idx in range(50)]))
+
+    # without semaphore all of them run at once
+    assert store.max_running == 50
+
+    store = FakeStore([])
+    collection = field.CollectionField('logins', field.StrField(
+        'login', validators=[store.is_unique]))
+
+    async def load():
+        await collection.aloads(
+            [f'user{idx}' for idx in range(50)], asyncio.Semaphore(5))
+
+    asyncio.run(load())
+
+    assert store.max_running == 5
+    assert store.calls == 50
+    assert len(collection) == 50
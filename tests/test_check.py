@@ -0,0 +1,129 @@
+"""Checks if payload can be validated without loading it.
+"""
+
+import pytest
+
+from python_schema import exception, field
+
+from .test_compiler import Newspaper
+
+
+def test_check_of_valid_payload():
+    schema = Newspaper()
+
+    assert schema.check({
+        'issue': '2',
+        'articles': [{'title': 'One', 'tags': ['a', 'b']}],
+        'pages': [[2, 4], [6]],
+        'editor': {'name': 'Frank'},
+    }) is None
+
+    assert schema.check(None) is None
+
+    # field is only a definition, it's never loaded
+    assert not schema.is_set
+
+
+def test_check_reports_what_loads_would_raise():
+    for schema, payload in [
+        (Newspaper(), {'articles': [{'title': 2}, {'title': None}]}),
+        (Newspaper(), {'pages': [[2, 3], [5]]}),
+        (Newspaper(), {'pages': [[2, 'x'], [6]]}),
+        (Newspaper(), {'unknown': 1}),
+        (Newspaper(), {'issue': 3}),
+        (Newspaper(), {'editor': 'Frank'}),
+        (Newspaper(), {'articles': [['One']]}),
+        (Newspaper(), 'Newspaper'),
+        (field.CollectionField('ids', field.IntField), 12),
+    ]:
+        instance = schema.make_new()
+
+        with pytest.raises(exception.PayloadError) as info:
+            instance.loads(payload)
+
+        report = schema.check(payload)
+
+        assert report['error'] == type(info.value).__name__
+        assert report['message'] == str(info.value)
+        assert report['errors'] == exception.describe(info.value)
+
+
+def test_check_reports_every_failure_with_its_path():
+    schema = Newspaper()
+
+    assert schema.check({'issue': 3}) == {
+        'error': 'ValidationError',
+        'message': 'Validation error',
+        'errors': [{
+            'code': 'validation_failed',
+            'path': ['issue'],
+            'message': 'Number is not even, got 3',
+        }],
+    }
+
+    assert schema.check({'articles': [{'title': 'One'}, {'title': None}]}) == {
+        'error': 'PayloadError',
+        'message': (
+            "Unable to load items in collection: "
+            "[{1: ['None is not allowed value']}]"),
+        'errors': [{
+            'code': 'none_not_allowed',
+            'path': ['articles', 1, 'title'],
+            'message': 'None is not allowed value',
+        }],
+    }
+
+    assert schema.check({'pages': [[2, 3], [6, 'x', 7]]})['errors'] == [{
+        'code': 'int_invalid',
+        'path': ['pages', 1, 1],
+        'message': 'IntField cannot be populated with value: x',
+    }]
+
+    assert schema.check({'pages': [[2, 3], [6, 7]]})['errors'] == [{
+        'code': 'validation_failed',
+        'path': ['pages', 0, 1],
+        'message': 'Number is not even, got 3',
+    }, {
+        'code': 'validation_failed',
+        'path': ['pages', 1, 1],
+        'message': 'Number is not even, got 7',
+    }]
+
+    assert schema.check({'editor': {'nickname': 'jj'}})['errors'] == [{
+        'code': 'unknown_keys',
+        'path': ['editor'],
+        'message': 'Unexpected payload with key(s): nickname',
+    }]
+
+
+def test_check_reports_values_that_are_not_mappings():
+    assert Newspaper().check({'editor': 'Frank'})['errors'] == [{
+        'code': 'not_mapping',
+        'path': ['editor'],
+        'message': (
+            'SchemaField cannot be populated with value: Frank. '
+            'Value is not a mapping.'),
+    }]
+
+
+def test_check_of_collection():
+    ids = field.CollectionField('ids', field.IntField('id', allow_none=False))
+
+    assert ids.check(['1', 2]) is None
+    assert ids.check(iter(['1', 2])) is None
+    assert ids.check(['1', None, 'x']) == {
+        'error': 'PayloadError',
+        'message': (
+            "Unable to load items in collection: [{1: ['None is not allowed "
+            "value'], 2: ['IntField cannot be populated with value: x']}]"
+        ),
+        'errors': [{
+            'code': 'none_not_allowed',
+            'path': [1],
+            'message': 'None is not allowed value',
+        }, {
+            'code': 'int_invalid',
+            'path': [2],
+            'message': 'IntField cannot be populated with value: x',
+        }],
+    }
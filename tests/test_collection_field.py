@@ -299,3 +299,120 @@ def test_collection_of_same_collection_works():
         master_collection.loads([
             [2,],
         ])
+
+
+def test_collection_can_be_loaded_from_generator():
+    schema = field.CollectionField('list_of_numbers', field.IntField)
+
+    schema.loads(str(number) for number in range(5))
+
+    assert schema.as_python() == [0, 1, 2, 3, 4]
+
+    with pytest.raises(exception.NormalisationError):
+        schema.loads(12)
+
+
+def test_lazy_collection_loads_elements_while_iterated_over():
+    consumed = []
+
+    def numbers(total):
+        for number in range(total):
+            consumed.append(number)
+
+            yield str(number)
+
+    schema = field.CollectionField(
+        'list_of_numbers', field.IntField, lazy=True, chunk_size=10)
+
+    schema.loads(numbers(25))
+
+    # nothing was read yet
+    assert consumed == []
+
+    elements = iter(schema)
+
+    assert next(elements) == 0
+    # only one chunk was read
+    assert consumed == list(range(10))
+
+    assert [elm.value for elm in elements] == list(range(1, 25))
+    assert consumed == list(range(25))
+
+    # elements are not kept, collection can be iterated over only once
+    with pytest.raises(exception.LazyCollectionError):
+        list(schema)
+
+
+def test_lazy_collection_cannot_be_used_as_sequence():
+    schema = field.CollectionField(
+        'list_of_numbers', field.IntField, lazy=True)
+
+    schema.loads(iter(['1', '2']))
+
+    with pytest.raises(exception.LazyCollectionError):
+        len(schema)
+
+    with pytest.raises(exception.LazyCollectionError):
+        schema[0]
+
+    with pytest.raises(exception.LazyCollectionError):
+        schema == [1, 2]
+
+    # nothing was consumed by those
+    assert schema.as_python() == [1, 2]
+
+    with pytest.raises(exception.LazyCollectionError):
+        schema.as_python()
+
+    with pytest.raises(exception.LazyCollectionError):
+        schema.as_json()
+
+
+def test_lazy_collection_reports_errors_once_consumed():
+    schema = field.CollectionField(
+        'list_of_numbers', field.IntField, lazy=True, chunk_size=2)
+
+    schema.loads(iter(['1', 'a', '3', 'b', '5']))
+
+    loaded = []
+
+    with pytest.raises(exception.PayloadError) as info:
+        for elm in schema:
+            loaded.append(elm.value)
+
+    # valid elements were yielded nonetheless
+    assert loaded == [1, 3, 5]
+    assert schema.errors == [{
+        1: ['IntField cannot be populated with value: a'],
+        3: ['IntField cannot be populated with value: b'],
+    }]
+    assert str(info.value) == (
+        "Unable to load items in collection: {}".format(schema.errors))
+
+
+def test_lazy_collection_inside_of_schema():
+    class Report(field.SchemaField):
+        fields = [
+            field.StrField('title'),
+            field.CollectionField('rows', field.SchemaField('row', fields=[
+                field.IntField('value'),
+            ]), lazy=True),
+        ]
+
+    report = Report()
+
+    report.loads({
+        'title': 'Numbers',
+        'rows': ({'value': idx} for idx in range(3)),
+    })
+
+    assert 'Lazy' in str(report)
+    assert report['title'] == 'Numbers'
+    assert report.as_python() == {
+        'title': 'Numbers',
+        'rows': [{'value': 0}, {'value': 1}, {'value': 2}],
+    }
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        field.CollectionField(
+            'rows', field.IntField, lazy=True, validators=[len])
@@ -0,0 +1,207 @@
+"""Checks if compiled loaders behave exactly like interpreted path.
+"""
+
+import pytest
+
+from python_schema import compiler, exception, field, misc
+
+from .test_schema_field_can_survive_cycles import Book
+
+
+def interpreted(schema, payload):
+    instance = schema()
+    instance.loads(payload)
+
+    return instance.as_python()
+
+
+def assert_same_behaviour(schema, payloads):
+    loader = compiler.compile_loader(schema)
+
+    for payload in payloads:
+        try:
+            expected = interpreted(schema, payload)
+        except Exception as err:  # pylint: disable=broad-except
+            with pytest.raises(type(err)) as info:
+                loader(payload)
+
+            assert type(info.value) is type(err)
+            assert str(info.value) == str(err)
+        else:
+            assert loader(payload) == expected
+
+
+def is_even(val):
+    return f"Number is not even, got {val}" if val % 2 else True
+
+
+def is_short(val):
+    return True if len(val) < 4 else f"Too long, got {len(val)}"
+
+
+def is_not_banned(val):
+    if val == 'banned':
+        raise exception.ValidationError('Banned value')
+
+    return True
+
+
+class Article(field.SchemaField):
+    fields = [
+        field.StrField('title', allow_none=False, validators=[
+            is_not_banned]),
+        field.CollectionField('tags', field.StrField(
+            'tag', validators=[is_not_banned]), validators=[is_short]),
+    ]
+
+
+class Newspaper(field.SchemaField):
+    fields = [
+        field.IntField('issue', validators=[is_even]),
+        field.StrField('title', default_value='Untitled'),
+        field.BaseField('anything'),
+        field.CollectionField('articles', Article),
+        field.CollectionField('pages', field.CollectionField(
+            'page', field.IntField('number', validators=[is_even]))),
+        field.SchemaField('editor', fields=[
+            field.StrField('name'),
+        ], allow_none=False),
+    ]
+
+
+def test_compiled_loader_matches_interpreted_path():
+    assert_same_behaviour(Newspaper, [
+        {},
+        None,
+        {'issue': '2', 'title': 12, 'anything': object},
+        {'issue': 3},
+        {'issue': 'abc'},
+        {'issue': 12.5},
+        {'issue': None},
+        {'unknown': 1, 'other': 2},
+        {'articles': []},
+        {'articles': None},
+        {'articles': 12},
+        {'articles': [{'title': 'One', 'tags': ['a', 'b']}, {'title': 2}]},
+        {'articles': [{'title': None}]},
+        {'articles': [{'title': 'banned'}]},
+        {'articles': [{'title': 'One', 'tags': ['a', 'b', 'c', 'd']}]},
+        {'articles': [{'title': 'One', 'tags': ['a', 'banned']}]},
+        {'articles': [{'title': 'One', 'extra': True}]},
+        {'articles': [None, {'title': 'One'}]},
+        {'pages': [[2, 4], [6]]},
+        {'pages': [[2, 3], [5]]},
+        {'pages': [[2, 'x'], [6]]},
+        {'editor': {'name': 'Frank'}},
+        {'editor': None},
+        {'editor': {'name': 'Frank', 'age': 12}},
+    ])
+
+
+def test_compiled_loader_survives_cycles():
+    assert_same_behaviour(Book, [
+        {'title': 'Chapter I', 'author': {
+            'name': 'drachenfels',
+            'books': [{
+                'title': 'Chapter I',
+            }, {
+                'title': 'Chapter II',
+                'author': {'name': 'drachenfels'},
+            }],
+            'home_address': {'postcode': 'aaa1', 'street': 'st. James'},
+            'publisher_address': {'postcode': 'ccc1', 'letterbox': 12},
+        }},
+        {'title': 'Chapter I', 'author': {
+            'books': [{'title': 'Chapter I', 'pages': 12}],
+        }},
+    ])
+
+
+def test_customised_fields_fall_back_to_interpreted_path():
+    class UpperStrField(field.StrField):
+        def normalise(self, value):
+            value = super().normalise(value)
+
+            if value is None:
+                return value
+
+            return value.upper()
+
+    class User(field.SchemaField):
+        fields = [
+            field.StrField('name'),
+            UpperStrField('nickname', allow_none=False),
+            field.CollectionField('aliases', UpperStrField),
+        ]
+
+    assert compiler.get_kind(User()) is field.SchemaField
+    assert compiler.get_kind(UpperStrField('nickname')) is None
+
+    assert_same_behaviour(User, [
+        {'name': 'Frank', 'nickname': 'punisher', 'aliases': ['a', 'b']},
+        {'name': 'Frank', 'nickname': None},
+        {'name': 'Frank', 'aliases': [None, 'b']},
+    ])
+
+    loader = compiler.compile_loader(User)
+
+    assert loader({'nickname': 'punisher'}) == {'nickname': 'PUNISHER'}
+
+
+def interpreted_dump(schema, method):
+    """Mirror of SchemaField.as_json/as_python before they were compiled.
+    """
+    value = schema.value
+
+    if value is None:
+        return None
+
+    return {
+        key: getattr(child, method)()
+        for key, child in value.items()
+        if child.computed_value is not misc.NotSet
+    }
+
+
+def test_compiled_dumpers_match_interpreted_path():
+    class Tag(field.StrField):
+        def as_json(self):
+            return f'#{self.value}'
+
+    class Post(field.SchemaField):
+        fields = [
+            field.IntField('id', default_value=0),
+            field.StrField('title'),
+            Tag('tag'),
+            field.BaseField('extra', default_value=None),
+            field.CollectionField('comments', field.StrField),
+            field.SchemaField('author', fields=[field.StrField('name')]),
+        ]
+
+    for payload in [
+        {},
+        {'id': '1', 'title': None, 'tag': 'a', 'comments': ['x', 2]},
+        {'title': 'One', 'author': {'name': 'Frank'}, 'comments': None},
+        {'author': None, 'extra': {'a': [1]}},
+    ]:
+        schema = Post()
+        schema.loads(payload)
+
+        for method in ('as_json', 'as_python'):
+            expected = interpreted_dump(schema, method)
+
+            assert repr(getattr(schema, method)()) == repr(expected)
+
+    assert 'output[\'tag\'] = field.as_json()' in \
+        schema._plan.dumper('as_json').source
+
+
+def test_value_set_manually_is_dumped_by_interpreted_path():
+    schema = field.SchemaField('point', fields=[
+        field.IntField('x'), field.IntField('y'),
+    ])
+    schema.loads({'x': 1, 'y': 2})
+
+    schema.value = {'y': schema.value['y'], 'x': schema.value['x']}
+
+    assert list(schema.as_json()) == ['y', 'x']
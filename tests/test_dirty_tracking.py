@@ -0,0 +1,158 @@
+"""Checks if dumps of loaded schema are cached and if changes are tracked.
+"""
+
+from python_schema import field
+
+
+class Address(field.SchemaField):
+    fields = [
+        field.StrField('street'),
+        field.StrField('city'),
+    ]
+
+
+class User(field.SchemaField):
+    cache_dumps = True
+    keep_payload = True
+
+    fields = [
+        field.StrField('name'),
+        Address('address'),
+        field.CollectionField('tags', field.StrField),
+    ]
+
+
+PAYLOAD = {
+    'name': 'Frank',
+    'address': {'street': 'Main', 'city': 'London'},
+    'tags': ['a', 'b'],
+}
+
+
+def loaded(**kwargs):
+    user = User(**kwargs)
+    user.loads(PAYLOAD)
+
+    return user
+
+
+def test_dumps_are_cached_until_value_changes(monkeypatch):
+    user = loaded()
+
+    dumped = []
+    dump_value = User._dump_value
+
+    def counted(self, value, method):
+        dumped.append(method)
+
+        return dump_value(self, value, method)
+
+    monkeypatch.setattr(User, '_dump_value', counted)
+
+    assert user.as_json() == user.as_json() == PAYLOAD
+    assert user.as_python() == user.as_python() == PAYLOAD
+    assert dumped == ['as_json', 'as_python']
+
+    user['address']['city'].value = 'Paris'
+
+    assert user.as_json()['address'] == {'street': 'Main', 'city': 'Paris'}
+    assert dumped == ['as_json', 'as_python', 'as_json']
+
+    user['tags'][0].value = 'c'
+
+    assert user.as_python()['tags'] == ['c', 'b']
+
+    user['name'].loads('John')
+
+    assert user.as_json()['name'] == 'John'
+
+    user.update({'address': {'street': 'High'}})
+
+    assert user.as_json()['address'] == {'street': 'High', 'city': 'Paris'}
+
+    user.loads({'name': 'Jim'})
+
+    assert user.as_json() == {'name': 'Jim'}
+
+
+def test_callers_get_copies_of_cached_dumps():
+    user = loaded()
+
+    as_json = user.as_json()
+    as_json['name'] = 'John'
+    as_json['address']['city'] = 'Paris'
+    as_json['tags'].append('c')
+
+    assert user.as_json() is not as_json
+    assert user.as_json() == PAYLOAD
+    assert user.as_python() == PAYLOAD
+
+
+def test_dumps_are_not_cached_unless_configured():
+    user = loaded(cache_dumps=False)
+
+    assert user.as_json() is not user.as_json()
+    assert user.as_json() == PAYLOAD
+
+
+def test_value_replaced_directly_is_dumped_again():
+    user = loaded()
+
+    assert user.as_json() == PAYLOAD
+
+    user.value = dict(user.value, name=field.StrField('name'))
+    user.value['name'].loads('John')
+
+    assert user.as_json() == dict(PAYLOAD, name='John')
+
+
+def test_dump_changes_reports_fields_changed_since_load():
+    user = loaded()
+
+    assert user.dump_changes() == {}
+
+    user['address']['city'].value = 'Paris'
+
+    assert user.dump_changes() == {'address': {'city': 'Paris'}}
+
+    user['tags'][1].value = 'c'
+    user['name'].loads('John')
+
+    assert user.dump_changes() == {
+        'name': 'John',
+        'address': {'city': 'Paris'},
+        'tags': ['a', 'c'],
+    }
+
+    # reloaded field is still part of the schema
+    assert user['name'].parent is user
+
+    user.loads(PAYLOAD)
+
+    assert user.dump_changes() == {}
+
+
+def test_dump_changes_after_update():
+    user = loaded()
+
+    user.update({'address': {'street': 'High'}, 'tags': ['x']})
+
+    assert user.dump_changes() == {
+        'address': {'street': 'High'},
+        'tags': ['x'],
+    }
+
+    user.update({'address': None})
+
+    assert user.dump_changes() == {'address': None, 'tags': ['x']}
+
+
+def test_deferred_loading_of_lazy_schema_is_not_a_change():
+    user = loaded(lazy=True)
+
+    assert user.as_json() == PAYLOAD
+    assert user.dump_changes() == {}
+
+    user['address']['street'].value = 'High'
+
+    assert user.dump_changes() == {'address': {'street': 'High'}}
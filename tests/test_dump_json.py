@@ -0,0 +1,116 @@
+"""Checks if loaded fields can be serialised to JSON as a stream of chunks.
+"""
+
+import io
+import json
+import tracemalloc
+
+from python_schema import field
+
+from .test_compiler import Article, Newspaper
+
+
+class Point(field.SchemaField):
+    fields = [
+        field.IntField('x'),
+        field.IntField('y'),
+    ]
+
+    def as_json(self):
+        return [self['x'].value, self['y'].value]
+
+
+def test_iter_json_matches_json_dumps_of_as_json():
+    schema = Newspaper()
+    schema.loads({
+        'issue': '2',
+        'anything': {'nested': [1, None, 'ż']},
+        'articles': [{'title': 'One', 'tags': ['a', 'b']}, {'title': 'Two'}],
+        'pages': [[2, 4], []],
+        'editor': {'name': 'Frank'},
+    })
+
+    expected = json.dumps(schema.as_json())
+
+    for chunk_size in (1, 10, None):
+        assert ''.join(schema.iter_json(chunk_size)) == expected
+
+    fp = io.StringIO()
+
+    schema.dump_json(fp)
+
+    assert fp.getvalue() == expected
+
+
+def test_iter_json_of_empty_and_none_values():
+    for instance, payload in [
+        (Newspaper(), None),
+        (Newspaper(), {}),
+        (field.CollectionField('tags', field.StrField), []),
+        (field.CollectionField('tags', field.StrField), None),
+        (field.ArrayField('numbers'), []),
+        (field.ArrayField('numbers'), list(range(3000))),
+        (field.IntField('number'), '12'),
+    ]:
+        instance.loads(payload)
+
+        assert ''.join(instance.iter_json()) == json.dumps(instance.as_json())
+
+
+def test_customised_as_json_is_respected():
+    points = field.CollectionField('points', Point)
+    points.loads([{'x': 1, 'y': 2}, {'x': 3, 'y': 4}])
+
+    assert ''.join(points.iter_json()) == '[[1, 2], [3, 4]]'
+
+
+def test_lazy_collection_is_loaded_while_it_is_dumped():
+    consumed = []
+
+    def payload():
+        for idx in range(10):
+            consumed.append(idx)
+
+            yield {'x': idx, 'y': idx}
+
+    points = field.CollectionField(
+        'points', field.SchemaField('point', fields=[
+            field.IntField('x'), field.IntField('y'),
+        ]), lazy=True, chunk_size=2)
+    points.loads(payload())
+
+    chunks = points.iter_json(chunk_size=1)
+
+    assert next(chunks) == '['
+    assert len(consumed) == 2
+
+    assert json.loads('[' + ''.join(chunks)) == [
+        {'x': idx, 'y': idx} for idx in range(10)]
+
+
+class Sink:
+    def write(self, chunk):
+        pass
+
+
+def peak_memory(total):
+    articles = field.CollectionField('articles', Article)
+    articles.loads([
+        {'title': f'Title {idx}', 'tags': ['a', 'b']} for idx in range(total)
+    ])
+
+    tracemalloc.start()
+
+    try:
+        articles.dump_json(Sink())
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_use_does_not_depend_on_size_of_collection():
+    small = peak_memory(2000)
+    big = peak_memory(20000)
+
+    assert big < small * 2
@@ -0,0 +1,234 @@
+"""Checks if errors carry stable codes and paths and if their messages are
+rendered only when they're read.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from python_schema import exception, field
+
+
+class Item(field.SchemaField):
+    fields = [
+        field.IntField('number', validators=[
+            lambda val: True if val > 0 else 'Number has to be positive',
+        ]),
+        field.CollectionField('tags', field.IntField),
+    ]
+
+
+class Order(field.SchemaField):
+    fields = [
+        Item('main'),
+        field.CollectionField('items', Item),
+    ]
+
+
+def loaders(schema, payload):
+    yield lambda: schema.loads(payload)
+    yield lambda: schema.load_python(payload)
+    yield lambda: schema.loads_json(json.dumps(payload))
+
+
+def raised(payload):
+    """Returns errors raised by every way of loading payload."""
+    errors = []
+
+    for load in loaders(Order(), payload):
+        with pytest.raises(exception.PayloadError) as excinfo:
+            load()
+
+        errors.append(excinfo.value.error)
+
+    return errors
+
+
+def test_error_of_nested_field_has_code_and_path():
+    for error in raised({'main': {'number': 'x'}}):
+        assert isinstance(error, exception.Error)
+        assert error.code == 'int_invalid'
+        assert error.value == 'x'
+        assert error.path == ('main', 'number')
+
+
+def test_errors_of_collection_elements_are_located():
+    payload = {'items': [{'number': 1}, {'tags': [1, 'y']}]}
+
+    for error in raised(payload):
+        assert error.code == 'invalid_items'
+        assert error.path == ('items', 1, 'tags')
+
+        [element] = error.value[0][1]
+
+        assert element.code == 'int_invalid'
+        assert element.path == ('items', 1, 'tags', 1)
+
+
+def test_errors_of_nested_fields_of_elements_are_reported():
+    payload = {'items': [{'number': 1}, {'number': 'x'}]}
+
+    for error in raised(payload):
+        assert error.code == 'invalid_items'
+        assert error.path == ('items',)
+
+        [element] = error.value[0][1]
+
+        assert element.code == 'int_invalid'
+        assert element.path == ('items', 1, 'number')
+
+
+def test_failed_validation_has_code_and_path():
+    for error in raised({'main': {'number': -1}}):
+        assert error.code == 'validation_failed'
+        assert error.path == ('main', 'number')
+        assert error.value == ['Number has to be positive']
+        assert str(error) == 'Validation error'
+
+
+def test_failed_validation_of_elements_is_located():
+    payload = {'items': [{'number': 1}, {'number': -1}]}
+
+    for error in raised(payload):
+        assert error.code == 'validation_failed'
+        assert error.path == ('items',)
+
+        [element] = error.value[0][1]
+
+        assert element.code == 'validation_failed'
+        assert element.path == ('items', 1, 'number')
+        assert element.value == ['Number has to be positive']
+
+
+def test_elements_share_name_of_collection():
+    # elements used to be named `items[0]`, index is part of path of errors
+    order = Order()
+    order.loads({'items': [{'number': 1}, {'number': 2}]})
+
+    assert [item.name for item in order['items']] == ['items', 'items']
+
+
+def test_unknown_keys_have_code_and_path():
+    for error in raised({'main': {'unknown': 1}}):
+        assert error.code == 'unknown_keys'
+        assert error.path == ('main',)
+        assert str(error) == 'Unexpected payload with key(s): unknown'
+
+
+def test_values_that_are_not_mappings_have_code_and_path():
+    for error in raised({'main': 'x'}):
+        assert error.code == 'not_mapping'
+        assert error.path == ('main',)
+        assert str(error) == (
+            'SchemaField cannot be populated with value: x. '
+            'Value is not a mapping.')
+
+    for payload in [[], 12]:
+        with pytest.raises(exception.NormalisationError) as excinfo:
+            Order().loads(payload)
+
+        assert excinfo.value.error.code == 'not_mapping'
+
+
+def test_errors_stored_on_fields_are_structured():
+    number = field.IntField('number')
+
+    with pytest.raises(exception.PayloadError):
+        number.loads('x')
+
+    [error] = number.error_records
+
+    assert error.code == 'int_invalid'
+    assert error.path == ()
+
+    tags = field.CollectionField('tags', field.IntField)
+
+    with pytest.raises(exception.PayloadError):
+        tags.loads(['a', 1, 'b'])
+
+    assert {
+        idx: [error.code for error in errors]
+        for idx, errors in tags.error_records[0].items()
+    } == {0: ['int_invalid'], 2: ['int_invalid']}
+    assert tags.error_records[0][2][0].path == (2,)
+
+
+def test_errors_of_asynchronous_loading_are_located():
+    schema = Order()
+
+    with pytest.raises(exception.PayloadError) as excinfo:
+        asyncio.run(schema.aloads({'items': [{'tags': ['y']}]}))
+
+    assert excinfo.value.error.path == ('items', 0, 'tags')
+
+
+def test_errors_are_compatible_with_messages():
+    error = exception.Error('int_invalid', 'x')
+
+    assert error == 'IntField cannot be populated with value: x'
+    assert str(error) == error.message
+    assert repr(error) == repr('IntField cannot be populated with value: x')
+    assert error == exception.Error('int_invalid', 'x', ('a',))
+    assert error != exception.Error('str_invalid', 'x')
+
+    with pytest.raises(exception.NormalisationError) as excinfo:
+        field.IntField('number').loads('x')
+
+    assert str(excinfo.value) == 'IntField cannot be populated with value: x'
+
+
+class Unprintable:
+    """Payload that counts how many times it was formatted, it's not
+    iterable, thus it's rejected without being formatted.
+    """
+    formatted = 0
+
+    def __str__(self):
+        Unprintable.formatted += 1
+
+        return 'unprintable'
+
+
+def test_messages_are_rendered_only_when_read():
+    Unprintable.formatted = 0
+    matrix = field.CollectionField(
+        'matrix', field.CollectionField('row', field.IntField))
+
+    with pytest.raises(exception.PayloadError) as excinfo:
+        matrix.loads([Unprintable()] * 100)
+
+    assert Unprintable.formatted == 0
+
+    error = excinfo.value.error
+
+    assert 'unprintable' in str(error)
+    assert Unprintable.formatted == 100
+
+
+def test_errors_and_arguments_of_exceptions_are_plain_messages():
+    tags = field.CollectionField('tags', field.IntField)
+
+    with pytest.raises(exception.PayloadError) as excinfo:
+        tags.loads(['a', 1])
+
+    message = 'IntField cannot be populated with value: a'
+
+    assert tags.errors == [{0: [message]}]
+    assert json.loads(json.dumps(tags.errors)) == [{'0': [message]}]
+    assert excinfo.value.args == (
+        f"Unable to load items in collection: [{{0: ['{message}']}}]",)
+    assert excinfo.value.args[0] == str(excinfo.value)
+
+    for load in [
+        lambda: tags.load(['a', 1]),
+        lambda: tags.load_python(['a', 1]),
+        lambda: tags.loads_json('["a", 1]'),
+    ]:
+        with pytest.raises(exception.PayloadError) as excinfo:
+            load()
+
+        assert excinfo.value.errors == [{0: [message]}]
+        # structured records are kept aside
+        assert excinfo.value.error_records[0][0][0].code == 'int_invalid'
+        assert excinfo.value.error.code == 'invalid_items'
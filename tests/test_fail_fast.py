@@ -0,0 +1,137 @@
+"""Checks if loading stops once limit of errors is reached.
+"""
+
+import asyncio
+
+import pytest
+
+from python_schema import compiler, exception, field
+
+
+class Point(field.SchemaField):
+    fields = [
+        field.IntField('x', allow_none=False),
+        field.CollectionField('tags', field.IntField),
+    ]
+
+
+class Shape(field.SchemaField):
+    fields = [
+        field.CollectionField('points', Point),
+    ]
+
+
+def test_fail_fast_stops_at_first_error():
+    loaded = []
+
+    def record(value):
+        loaded.append(value)
+
+        return True
+
+    ids = field.CollectionField(
+        'ids', field.IntField('id', validators=[record]), fail_fast=True)
+
+    with pytest.raises(exception.PayloadError) as info:
+        ids.loads(['1', 'a', 'b', '4'])
+
+    assert ids.errors == [{1: ['IntField cannot be populated with value: a']}]
+    assert str(info.value) == (
+        "Unable to load items in collection: "
+        "[{1: ['IntField cannot be populated with value: a']}]")
+    assert loaded == [1]
+
+
+def test_max_errors_stops_after_n_errors():
+    ids = field.CollectionField('ids', field.IntField, max_errors=2)
+
+    with pytest.raises(exception.PayloadError):
+        ids.loads(['a', '1', 'b', 'c'])
+
+    assert ids.errors == [{
+        0: ['IntField cannot be populated with value: a'],
+        2: ['IntField cannot be populated with value: b'],
+    }]
+
+    ids = field.CollectionField('ids', field.IntField, max_errors=5)
+    ids.loads(['1', '2'])
+
+    assert ids.as_python() == [1, 2]
+
+
+def test_limit_is_passed_down_to_nested_collections():
+    payload = {'points': [
+        {'x': 1, 'tags': ['a', 'b']},
+        {'x': None},
+    ]}
+
+    with pytest.raises(exception.PayloadError) as info:
+        Shape(fail_fast=True).loads(payload)
+
+    assert str(info.value) == (
+        "Unable to load items in collection: "
+        "[{0: ['IntField cannot be populated with value: a']}]")
+
+    # without the limit the same payload reports every failure
+    with pytest.raises(exception.PayloadError) as info:
+        Shape().loads(payload)
+
+    assert str(info.value) == (
+        "Unable to load items in collection: "
+        "[{0: ['IntField cannot be populated with value: a'], "
+        "1: ['IntField cannot be populated with value: b']}]")
+
+
+def test_compiled_and_async_paths_report_the_same_errors():
+    shape = Shape(max_errors=1)
+
+    for payload in [
+        {'points': [{'x': 1, 'tags': ['a', 'b']}, {'x': None}]},
+        {'points': [{'x': None}, {'x': 'a'}]},
+        {'points': [{'x': 1, 'tags': [1, 2]}]},
+    ]:
+        instance = shape.make_new()
+
+        try:
+            instance.loads(payload)
+        except exception.PayloadError as err:
+            expected = err
+        else:
+            assert shape.load_python(payload) == instance.as_python()
+            assert shape.check(payload) is None
+
+            continue
+
+        with pytest.raises(type(expected)) as info:
+            compiler.compile_loader(shape)(payload)
+
+        assert str(info.value) == str(expected)
+
+        with pytest.raises(type(expected)) as info:
+            asyncio.run(shape.make_new().aloads(payload))
+
+        assert str(info.value) == str(expected)
+
+
+def test_async_fail_fast_cancels_elements_still_loading():
+    finished = []
+
+    async def slowly(value):
+        await asyncio.sleep(0 if value < 0 else 10)
+
+        finished.append(value)
+
+        return True if value >= 0 else f"Negative value: {value}"
+
+    ids = field.CollectionField(
+        'ids', field.IntField('id', validators=[slowly]), fail_fast=True)
+
+    async def load():
+        with pytest.raises(exception.ValidationError):
+            await asyncio.wait_for(ids.aloads([-1, 2, 3]), timeout=5)
+
+    asyncio.run(load())
+
+    assert ids.errors == [{0: ['Negative value: -1']}]
+    # other elements were cancelled, their validators never finished
+    assert finished == [-1]
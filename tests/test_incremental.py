@@ -0,0 +1,232 @@
+"""Checks if JSON document can be parsed and loaded incrementally.
+"""
+
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from python_schema import exception, field, incremental
+
+from .test_compiler import Newspaper
+
+
+DOCUMENTS = [
+    '{}',
+    'null',
+    '{"issue": "2", "title": 12, "anything": {"a": [1, 2.5, null]}}',
+    '{"issue": 3}',
+    '{"issue": 1e2, "title": "\\u017c\\u00f3\\u0142w \\"quoted\\""}',
+    '{"articles": [{"title": "One", "tags": ["a", "b"]}, {"title": "Two"}]}',
+    '{"articles": [{"title": 2}, {"title": null}, {"title": "banned"}]}',
+    '{"articles": [{"title": "One", "tags": ["a", "b", "c", "d"]}]}',
+    '{"pages": [[2, 4], [6, 3, 5], [], [8]], "editor": {"name": "Frank"}}',
+    '{"editor": null}',
+    '{"editor": {"name": "Frank", "age": 12}}',
+    '{"unknown": {"nested": [1, 2]}}',
+    '{"editor": "Frank"}',
+    '{"editor": ["Frank"]}',
+    '{"articles": ["One", {"title": "Two"}]}',
+    ' {"title": true, "anything": false, "issue": -0} ',
+]
+
+
+def assert_same_as_load_python(schema, document, chunk_size):
+    payload = json.loads(document)
+
+    try:
+        expected = schema.load_python(payload)
+    except exception.PayloadError as err:
+        with pytest.raises(type(err)) as info:
+            incremental.loads_json(
+                schema, document.encode(), chunk_size=chunk_size)
+
+        assert str(info.value) == str(err)
+        assert info.value.errors == err.errors
+    else:
+        assert incremental.loads_json(
+            schema, io.StringIO(document), chunk_size=chunk_size) == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, incremental.CHUNK_SIZE])
+def test_loads_json_matches_load_python(chunk_size):
+    for document in DOCUMENTS:
+        assert_same_as_load_python(Newspaper(), document, chunk_size)
+
+
+def test_loads_json_of_collections_and_leaf_fields():
+    users = field.CollectionField('users', field.SchemaField('user', fields=[
+        field.IntField('id'),
+        field.CollectionField('scores', field.IntField, max_errors=1),
+    ]))
+
+    for document in [
+        '[{"id": "1", "scores": [1, 2]}, {"id": 2}]',
+        '[{"id": "x", "scores": [1, 2]}, {"id": 2, "scores": ["a", "b"]}]',
+        '[{"id": 1, "name": "Frank"}, {"id": 2, "nested": {"a": [1]}}]',
+        '[{"id": 1}, null, {"id": null}]',
+    ]:
+        assert_same_as_load_python(users, document, 3)
+
+    assert field.IntField('id').loads_json(b'"12"') == 12
+    assert field.ArrayField('numbers').loads_json('[1, 2, 3]') == [1, 2, 3]
+
+
+def test_unknown_key_is_rejected_as_soon_as_it_is_read():
+    document = '{"unexpected": 1, "articles": [%s]}' % ', '.join(
+        ['{"title": "One"}'] * 10000)
+
+    fp = io.StringIO(document)
+
+    with pytest.raises(exception.UnknownFieldError) as info:
+        incremental.loads_json(Newspaper, fp, chunk_size=64)
+
+    assert str(info.value) == "Unexpected payload with key(s): unexpected"
+    assert fp.tell() == 64
+
+
+def test_invalid_json_raises_value_error():
+    for document in [
+        '', '{', '[1, 2', '{"a" 1}', '{"a": 1,}', '[1,]', '{1: 2}', 'nul',
+        '[01]', '"abc', '{} {}', '[1 2]', '{"a": [}',
+    ]:
+        with pytest.raises(ValueError):
+            json.loads(document)
+
+        with pytest.raises(ValueError):
+            field.BaseField('anything').loads_json(document)
+
+
+def test_tokenizer_builds_the_same_data_as_json_loads():
+    document = json.dumps({
+        'a': [1, -2.5e-3, True, False, None, '', 'x' * 100],
+        'b': {'c': {}, 'd': [], 'e': '\\"\n\u017c'},
+    })
+
+    for chunk_size in (1, 5, 100):
+        assert field.BaseField('anything').loads_json(
+            io.BytesIO(document.encode()),
+        ) == json.loads(document)
+
+        loader = incremental.Loader(
+            incremental.Tokenizer(io.StringIO(document), chunk_size))
+
+        event, _ = next(loader.events)
+
+        assert loader.build(event) == json.loads(document)
+
+
+class Reader(io.StringIO):
+    """Counts reads of the document.
+    """
+
+    def __init__(self, document):
+        super().__init__(document)
+
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+
+        return super().read(size)
+
+
+class ShortReads(io.RawIOBase):
+    """Returns a single byte per read, whatever size was asked for.
+    """
+
+    def __init__(self, document):
+        super().__init__()
+
+        self.document = document.encode()
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.document[self.pos:self.pos + 1]
+
+        buffer[:len(data)] = data
+        self.pos += len(data)
+
+        return len(data)
+
+
+def test_multi_byte_characters_split_between_reads():
+    document = '["\u017c\u00f3\u0142w", "ok", {"\U0001f600": 1}]'
+
+    assert field.BaseField('anything').loads_json(
+        ShortReads(document),
+    ) == json.loads(document)
+
+    for chunk_size in (1, 2, 3):
+        assert incremental.loads_json(
+            field.BaseField('anything'), io.BytesIO(document.encode()),
+            chunk_size=chunk_size,
+        ) == json.loads(document)
+
+
+def test_strings_split_between_chunks_are_scanned_once():
+    value = 'x' * 10000 + '\\ \u017c \U0001f600 "quoted"' + 'y' * 10000
+
+    tokenizer = incremental.Tokenizer(io.StringIO(json.dumps([value])), 16)
+
+    buffered = []
+    fill = tokenizer.fill
+
+    def tracked_fill():
+        fill()
+
+        buffered.append(len(tokenizer.buffer))
+
+    tokenizer.fill = tracked_fill
+
+    loader = incremental.Loader(tokenizer)
+
+    event, _ = next(loader.events)
+
+    assert loader.build(event) == [value]
+
+    # decoded part of the string doesn't stay in the buffer
+    assert max(buffered) <= 16 + 12
+
+
+def test_invalid_escape_fails_without_reading_the_rest():
+    for escape in ['\\q', '\\u12x4']:
+        reader = Reader('["ab' + escape + 'x' * 100000 + '"]')
+
+        with pytest.raises(ValueError) as info:
+            incremental.loads_json(
+                field.BaseField('anything'), reader, chunk_size=10)
+
+        assert str(info.value).endswith('escape: char 4')
+        assert reader.reads <= 3
+
+
+def peak_memory(total):
+    document = json.dumps({
+        'issue': 2,
+        'ignored': [{'title': f'Title {idx}'} for idx in range(total)],
+    }).encode()
+
+    schema = Newspaper(exception_on_unknown=False)
+
+    tracemalloc.start()
+
+    try:
+        assert incremental.loads_json(
+            schema, io.BytesIO(document), chunk_size=4096) == {
+                'issue': 2, 'title': 'Untitled'}
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_use_does_not_depend_on_size_of_document():
+    small = peak_memory(2000)
+    big = peak_memory(20000)
+
+    assert big < small * 2
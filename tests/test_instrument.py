@@ -0,0 +1,146 @@
+"""Checks if loading can be instrumented per field path.
+"""
+
+import threading
+
+import pytest
+
+from python_schema import exception, field, instrument
+
+from .test_schema_field_can_survive_cycles import Book
+
+
+def test_recorder_reports_calls_per_path():
+    book = Book()
+
+    with instrument.recording() as recorder:
+        book.loads({'title': 'Chapter I', 'author': {
+            'name': 'drachenfels',
+            'books': [{'title': 'Chapter I'}, {'title': 'Chapter II'}],
+        }})
+
+    assert instrument.recorder is None
+
+    report = recorder.report()
+
+    assert set(report) == {
+        '', 'title', 'author', 'author.name', 'author.books',
+        'author.books[]', 'author.books[].title',
+    }
+    assert report['author.books[].title']['loads']['calls'] == 2
+    assert report['author.books[]']['_loads']['calls'] == 2
+    assert report['author.books']['validate'] == {
+        'calls': 1,
+        'time': report['author.books']['validate']['time'],
+        'errors': 0,
+    }
+    assert report['title'].keys() == {
+        'loads', 'normalise', 'validate', '_loads'}
+    assert report['']['loads']['time'] >= report['author']['loads']['time']
+
+
+def test_recorder_can_be_shared_by_threads():
+    threads = 8
+    rounds = 50
+
+    barrier = threading.Barrier(threads)
+
+    def load():
+        barrier.wait()
+
+        for _ in range(rounds):
+            Book().loads({'title': 'Chapter I', 'author': {
+                'name': 'drachenfels',
+                'books': [{'title': 'Chapter I'}],
+            }})
+
+    with instrument.recording() as recorder:
+        workers = [threading.Thread(target=load) for _ in range(threads)]
+
+        for worker in workers:
+            worker.start()
+
+        for worker in workers:
+            worker.join()
+
+    report = recorder.report()
+
+    # paths of fields loaded by other threads are not mixed up
+    assert set(report) == {
+        '', 'title', 'author', 'author.name', 'author.books',
+        'author.books[]', 'author.books[].title',
+    }
+    assert {
+        path: steps['loads']['calls'] for path, steps in report.items()
+    } == dict.fromkeys(report, threads * rounds)
+
+
+def test_report_can_be_read_while_threads_record():
+    fields = 200
+    schema = field.SchemaField('wide', fields=[
+        field.IntField(f'number_{idx}') for idx in range(fields)
+    ])
+    payload = {f'number_{idx}': idx for idx in range(fields)}
+    done = threading.Event()
+
+    def load():
+        for _ in range(20):
+            schema.make_new().loads(payload)
+
+        done.set()
+
+    with instrument.recording() as recorder:
+        worker = threading.Thread(target=load)
+        worker.start()
+
+        # new paths are recorded while report is being copied
+        while not done.is_set():
+            recorder.report()
+
+        worker.join()
+
+    assert len(recorder.report()) == fields + 1
+
+
+def test_recorder_counts_errors():
+    ids = field.CollectionField('ids', field.IntField(
+        'id', validators=[lambda val: True if val else 'Zero']))
+
+    with instrument.recording() as recorder:
+        with pytest.raises(exception.PayloadError):
+            ids.loads(['1', 'a', 0, 'b'])
+
+    report = recorder.report()
+
+    assert report['[]']['loads'] == {
+        'calls': 4, 'time': report['[]']['loads']['time'], 'errors': 3}
+    assert report['[]']['normalise']['errors'] == 2
+    assert report['[]']['validate']['errors'] == 1
+    assert report['']['_loads']['errors'] == 1
+
+    # without recorder nothing is recorded
+    recorder.reset()
+
+    ids.loads(['1'])
+
+    assert recorder.report() == {}
+
+
+def test_custom_recorder():
+    class Counter(instrument.Recorder):
+        def __init__(self):
+            super().__init__()
+
+            self.steps = []
+
+        def record(self, path, step, elapsed, failed):
+            self.steps.append((path, step, failed))
+
+    with instrument.recording(Counter()) as recorder:
+        with pytest.raises(exception.NormalisationError):
+            field.IntField('age').loads('x12')
+
+    assert recorder.steps == [
+        ('', 'normalise', True),
+        ('', 'loads', True),
+    ]
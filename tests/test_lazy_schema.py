@@ -0,0 +1,96 @@
+"""Checks if lazy SchemaField loads nested fields only when they are read.
+"""
+
+import pytest
+
+from python_schema import exception, field
+
+
+class Address(field.SchemaField):
+    fields = [
+        field.StrField('street', allow_none=False),
+    ]
+
+
+class Document(field.SchemaField):
+    lazy = True
+
+    fields = [
+        field.IntField('id'),
+        field.SchemaField('address', Address),
+        field.CollectionField('history', Address),
+    ]
+
+
+def test_nested_fields_are_loaded_when_read():
+    document = Document()
+
+    document.loads({
+        'id': '12',
+        'address': {'street': None},
+        'history': [{'street': 'Baker st.'}],
+    })
+
+    # plain fields are loaded right away, nested only when they are read
+    assert document.value['id'].value == 12
+    assert not document.value['address'].is_set
+    assert not document.value['history'].is_set
+
+    assert document['history'].as_python() == [{'street': 'Baker st.'}]
+
+    with pytest.raises(exception.NoneNotAllowedError):
+        document['address']
+
+    # field stays pending, thus every read reports the error
+    with pytest.raises(exception.NoneNotAllowedError):
+        document.as_json()
+
+    with pytest.raises(exception.NoneNotAllowedError):
+        document.force()
+
+
+def test_shape_and_unknown_keys_are_checked_right_away():
+    document = Document()
+
+    with pytest.raises(exception.UnknownFieldError):
+        document.loads({'address': {'street': 'Baker st.'}, 'unknown': 1})
+
+    with pytest.raises(exception.NormalisationError):
+        document.loads({'id': 'abc', 'address': {'street': None}})
+
+
+def test_lazy_schema_dumps_the_same_as_eager_one():
+    payload = {
+        'id': 12,
+        'address': {'street': 'Baker st.'},
+        'history': [{'street': 'Baker st.'}, {'street': 'Main st.'}],
+    }
+
+    document = Document()
+    document.loads(payload)
+
+    eager = Document(lazy=False)
+    eager.loads(payload)
+
+    assert document.as_python() == eager.as_python()
+    assert document == payload
+    assert document.make_new().lazy is True
+
+
+def test_force_loads_nested_lazy_schemas():
+    class Folder(field.SchemaField):
+        lazy = True
+
+        fields = [
+            field.CollectionField('documents', Document),
+        ]
+
+    folder = Folder()
+    folder.loads({'documents': [{'id': 1, 'address': {'street': None}}]})
+
+    documents = folder['documents']
+
+    assert not documents[0].value['address'].is_set
+
+    with pytest.raises(exception.NoneNotAllowedError):
+        folder.force()
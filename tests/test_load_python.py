@@ -0,0 +1,51 @@
+"""Checks if payload can be loaded straight into python data.
+"""
+
+import pytest
+
+from python_schema import exception, field
+
+from .test_compiler import Newspaper, interpreted
+
+
+def test_load_python_matches_loads_followed_by_as_python():
+    schema = Newspaper()
+
+    payload = {
+        'issue': '2',
+        'articles': [{'title': 'One', 'tags': ['a', 'b']}],
+        'pages': [[2, 4], [6]],
+        'editor': {'name': 'Frank'},
+    }
+
+    assert schema.load_python(payload) == interpreted(Newspaper, payload)
+
+    # field is only a definition, it's never loaded
+    assert not schema.is_set
+
+
+def test_load_python_reports_the_same_errors():
+    for schema, payload in [
+        (Newspaper(), {'articles': [{'title': 2}, {'title': None}]}),
+        (Newspaper(), {'pages': [[2, 3], [5]]}),
+        (Newspaper(), {'unknown': 1}),
+        (field.IntField('age', allow_none=False), None),
+        (field.IntField('age'), 'abc'),
+    ]:
+        instance = schema.make_new()
+
+        with pytest.raises(exception.PayloadError) as expected:
+            instance.loads(payload)
+
+        with pytest.raises(type(expected.value)) as info:
+            schema.load_python(payload)
+
+        assert str(info.value) == str(expected.value)
+        assert info.value.errors == instance.errors
+
+
+def test_load_python_of_leaf_fields():
+    assert field.IntField('age').load_python('12') == 12
+    assert field.StrField('name').load_python(12) == '12'
+    assert field.CollectionField(
+        'tags', field.StrField).load_python(iter([1, 2])) == ['1', '2']
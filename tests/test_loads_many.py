@@ -0,0 +1,66 @@
+"""Checks if batch of payloads can be loaded with errors isolated per record.
+"""
+
+from python_schema import field
+
+
+class User(field.SchemaField):
+    fields = [
+        field.StrField('name'),
+        field.IntField('age', validators=[
+            lambda val: True if val > 0 else f"Age has to be positive, {val}"
+        ]),
+        field.CollectionField(
+            'tags', field.StrField('tag', allow_none=False)),
+    ]
+
+
+def test_loads_many_isolates_errors_per_record():
+    schema = User()
+
+    loaded, errors = schema.loads_many([
+        {'name': 'Frank', 'age': '35'},
+        {'name': 'John', 'age': 'old'},
+        {'name': 'Jane', 'age': -1},
+        {'name': 'Jim', 'nickname': 'jimmy'},
+        {'name': 'Joe', 'tags': ['a', None]},
+        {'name': 'Jack', 'age': 12, 'tags': ['a', 'b']},
+        None,
+    ])
+
+    assert list(loaded) == [0, 5, 6]
+    assert loaded[0] == {'name': 'Frank', 'age': 35}
+    assert loaded[5].as_python() == {
+        'name': 'Jack', 'age': 12, 'tags': ['a', 'b']}
+    assert loaded[6].value is None
+
+    # errors are reported the way CollectionField does
+    assert errors == {
+        1: ['IntField cannot be populated with value: old'],
+        2: ['Validation error'],
+        3: ['Unexpected payload with key(s): nickname'],
+        4: ["Unable to load items in collection: "
+            "[{1: ['None is not allowed value']}]"],
+    }
+
+    # errors of nested fields carry their path
+    assert errors[1][0].path == ('age',)
+    assert errors[4][0].path == ('tags',)
+
+    # schema itself was not altered
+    assert not schema.is_set
+    assert schema.errors == []
+
+
+def test_loads_many_works_for_any_field_and_iterable():
+    schema = field.IntField('number', allow_none=False)
+
+    loaded, errors = schema.loads_many(
+        value for value in ['1', 2, 'three', None])
+
+    assert {idx: number.value for idx, number in loaded.items()} == {
+        0: 1, 1: 2}
+    assert errors == {
+        2: ['IntField cannot be populated with value: three'],
+        3: ['None is not allowed value'],
+    }
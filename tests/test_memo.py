@@ -0,0 +1,170 @@
+"""Checks if identical sub-payloads are loaded once when schema is memoised.
+"""
+
+import pytest
+
+from python_schema import exception, field, memo
+
+
+calls = []
+
+
+@memo.pure
+def is_not_banned(value):
+    calls.append(value)
+
+    return True if value != 'banned' else 'Banned value'
+
+
+def impure(value):
+    return True
+
+
+class Address(field.SchemaField):
+    memo = memo.Cache(maxsize=4)
+
+    fields = [
+        field.StrField('street', validators=[is_not_banned]),
+        field.IntField('number'),
+    ]
+
+
+class Row(field.SchemaField):
+    fields = [
+        field.IntField('id'),
+        Address('address'),
+    ]
+
+
+def interpreted(schema, payload):
+    instance = schema.make_new()
+    instance.loads(payload)
+
+    return instance.as_python()
+
+
+def test_identical_payloads_are_loaded_once():
+    Address.memo.clear()
+    del calls[:]
+
+    rows = field.CollectionField('rows', Row)
+
+    payload = [{
+        'id': idx,
+        'address': {'street': 'Baker st.', 'number': '221'},
+    } for idx in range(5)]
+
+    assert rows.load_python(payload) == interpreted(rows, payload)
+
+    # interpreted path is not memoised
+    del calls[:]
+
+    rows.load_python(payload)
+
+    assert calls == []
+    assert Address.memo.stats() == {
+        'hits': 9, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 4}
+
+
+def test_errors_are_cached_as_well():
+    Address.memo.clear()
+
+    row = Row()
+
+    for _ in range(2):
+        for payload in [
+            {'address': {'street': 'banned'}},
+            {'address': {'number': 'abc'}},
+        ]:
+            expected = Row()
+
+            with pytest.raises(exception.PayloadError) as expected_info:
+                expected.loads(payload)
+
+            with pytest.raises(type(expected_info.value)) as info:
+                row.load_python(payload)
+
+            assert str(info.value) == str(expected_info.value)
+
+            assert row.check(payload) == {
+                'error': type(expected_info.value).__name__,
+                'message': str(expected_info.value),
+                'errors': exception.describe(expected_info.value),
+            }
+
+    # loader and checker keep separate entries
+    assert Address.memo.stats() == {
+        'hits': 4, 'misses': 4, 'evictions': 0, 'size': 4, 'maxsize': 4}
+
+
+def test_only_pure_schemas_can_be_memoised():
+    schema = field.SchemaField('address', fields=[
+        field.StrField('street', validators=[impure]),
+    ], memo=memo.Cache())
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        schema.load_python({'street': 'Baker st.'})
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        memo.Cache(policy='random')
+
+
+def test_payloads_of_different_types_have_different_keys():
+    assert memo.canonical({'a': [1, 2], 'b': None}) == memo.canonical(
+        {'b': None, 'a': [1, 2]})
+
+    for payload, other in [
+        ([1, 2], (1, 2)),
+        ({1: 'x'}, {'1': 'x'}),
+        ({'a': 1}, {'a': True}),
+        ({'a': 1}, {'a': 1.0}),
+        ({'a': '1'}, {'a': 1}),
+    ]:
+        assert memo.canonical(payload) != memo.canonical(other)
+
+    for payload in [{'a': float('nan')}, {'a': object()}, {'a': {1, 2}}]:
+        with pytest.raises((TypeError, ValueError)):
+            memo.canonical(payload)
+
+    schema = field.SchemaField('row', fields=[
+        field.StrField('1'),
+    ], memo=memo.Cache())
+
+    assert schema.load_python({'1': 'x'}) == {'1': 'x'}
+
+    with pytest.raises(exception.UnknownFieldError):
+        schema.load_python({1: 'x'})
+
+
+def test_every_hit_returns_its_own_copy():
+    Address.memo.clear()
+
+    rows = field.CollectionField('rows', Row)
+
+    loaded = rows.load_python([
+        {'id': idx, 'address': {'street': 'Baker st.', 'number': 221}}
+        for idx in range(3)
+    ])
+
+    loaded[0]['address']['street'] = 'Changed'
+
+    assert [row['address']['street'] for row in loaded] == [
+        'Changed', 'Baker st.', 'Baker st.']
+    assert rows.load_python([
+        {'id': 1, 'address': {'street': 'Baker st.', 'number': 221}},
+    ]) == [{'id': 1, 'address': {'street': 'Baker st.', 'number': 221}}]
+    assert Address.memo.stats()['hits'] == 3
+
+
+def test_fifo_policy_evicts_the_oldest_entry():
+    cache = memo.Cache(maxsize=2, policy='fifo')
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    assert cache.get('a') == 1
+
+    cache.set('c', 3)
+
+    assert cache.get('a') is None
+    assert list(cache.entries) == ['b', 'c']
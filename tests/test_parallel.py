@@ -0,0 +1,98 @@
+"""Checks if payloads can be loaded in worker processes.
+"""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from python_schema import field, parallel
+
+from .test_schema_field_can_survive_cycles import Book
+
+
+class User(field.SchemaField):
+    fields = [
+        field.StrField('name'),
+        field.IntField('age'),
+        field.CollectionField('tags', 'tests.test_parallel.Tag'),
+    ]
+
+
+class Tag(field.SchemaField):
+    fields = [
+        field.StrField('label', allow_none=False),
+    ]
+
+
+def make_payloads(total):
+    return [{
+        'name': f'User {idx}',
+        'age': 'unknown' if idx % 10 == 3 else str(idx),
+        'tags': [{'label': 'a'}, {'label': None if idx % 10 == 7 else 'b'}],
+    } for idx in range(total)]
+
+
+def test_fields_can_be_pickled():
+    user = User()
+
+    user.loads(make_payloads(1)[0])
+
+    copy = pickle.loads(pickle.dumps(user))
+
+    assert copy.as_python() == user.as_python()
+    assert copy['tags'][0].parent is copy['tags']
+
+    book = pickle.loads(pickle.dumps(Book()))
+
+    book.loads({'title': 'Chapter I', 'author': {'books': [{'title': 'II'}]}})
+
+    assert book['author']['books'][0]['title'] == 'II'
+
+
+def test_payloads_are_loaded_in_worker_processes_in_order():
+    payloads = make_payloads(95)
+
+    loaded, errors = parallel.loads_many(
+        User, payloads, max_workers=2, chunk_size=10)
+
+    expected_loaded, expected_errors = User().loads_many(payloads)
+
+    assert list(loaded) == list(expected_loaded)
+    assert list(errors) == list(expected_errors)
+
+    for idx, data in loaded.items():
+        assert data == expected_loaded[idx].as_python()
+
+    assert errors == expected_errors
+
+    # errors of nested fields are reported with their path
+    [error] = errors[7]
+
+    assert error.code == 'invalid_items'
+    assert error.path == ('tags',)
+    assert [
+        (element.code, element.path) for element in error.value[0][1]
+    ] == [('none_not_allowed', ('tags', 1, 'label'))]
+
+
+def loaded_tokens(_):
+    # pylint: disable=protected-access
+    return set(parallel._loaders)
+
+
+def test_executor_can_be_given():
+    payloads = make_payloads(30)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        loaded, errors = parallel.loads_many(
+            User(), payloads, executor=executor, chunk_size=7)
+
+        # the same schema is compiled by each worker only once
+        parallel.loads_many(
+            User(), payloads, executor=executor, chunk_size=7)
+
+        tokens = set().union(*executor.map(
+            loaded_tokens, range(8), chunksize=1))
+
+    assert len(loaded) + len(errors) == 30
+    assert list(errors) == [3, 7, 13, 17, 23, 27]
+    assert len(tokens) == 1
@@ -0,0 +1,103 @@
+"""Checks if one field can be shared by many threads when using `.load`.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from python_schema import exception, field
+
+from .test_schema_field_can_survive_cycles import Book
+
+
+def test_load_does_not_alter_definition():
+    schema = field.SchemaField('user', fields=[
+        field.StrField('name'),
+        field.IntField('age'),
+    ])
+
+    user = schema.load({'name': 'Frank', 'age': '35'})
+
+    assert user is not schema
+    assert user == {'name': 'Frank', 'age': 35}
+    assert not schema.is_set
+    assert schema.errors == []
+
+    with pytest.raises(exception.NormalisationError) as info:
+        schema.load({'name': 'Frank', 'age': 'old'})
+
+    assert info.value.errors == []
+    assert schema.errors == []
+
+    with pytest.raises(exception.UnknownFieldError) as info:
+        schema.load({'nickname': 'Frank'})
+
+    assert info.value.errors == ['Unexpected payload with key(s): nickname']
+    assert schema.errors == []
+
+
+def test_collection_errors_are_reported_on_exception():
+    schema = field.CollectionField('numbers', field.IntField)
+
+    with pytest.raises(exception.PayloadError) as info:
+        schema.load([1, 'a', 3])
+
+    assert info.value.errors == [
+        {1: ['IntField cannot be populated with value: a']}]
+    assert schema.errors == []
+
+
+def make_payload(idx):
+    return {
+        'title': f'Chapter {idx}',
+        'author': {
+            'name': f'Author {idx}',
+            'books': [{'title': f'Chapter {idx}.{sub}'} for sub in range(5)],
+        },
+    }
+
+
+def load_one(schema, idx):
+    if idx % 7 == 0:
+        payload = make_payload(idx)
+        payload['author']['books'][idx % 5]['pages'] = idx
+
+        try:
+            schema.load(payload)
+        except exception.PayloadError as err:
+            return idx, str(err)
+
+        raise AssertionError('Invalid payload was loaded')
+
+    return idx, schema.load(make_payload(idx))
+
+
+def test_shared_schema_can_be_used_by_many_threads():
+    schema = Book()
+
+    interval = sys.getswitchinterval()
+
+    # force threads to switch as often as possible
+    sys.setswitchinterval(1e-6)
+
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(
+                lambda idx: load_one(schema, idx), range(500)))
+    finally:
+        sys.setswitchinterval(interval)
+
+    for idx, result in results:
+        if idx % 7 == 0:
+            assert result == (
+                "Unable to load items in collection: [{%d: ["
+                "'Unexpected payload with key(s): pages']}]" % (idx % 5))
+
+            continue
+
+        assert result.as_python() == make_payload(idx)
+        assert result['author']['books'][4].parent is result['author']['books']
+
+    assert not schema.is_set
+    assert schema.errors == []
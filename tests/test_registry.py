@@ -0,0 +1,83 @@
+"""Checks if string references to schemas are resolved via registry.
+"""
+
+import pytest
+
+from python_schema import exception, field, registry
+
+from .test_schema_field_can_survive_cycles import (
+    Address, Author, Book, BusinessAddress)
+
+
+def test_dotted_path_is_imported_once():
+    types = registry.TypeRegistry()
+
+    path = 'tests.test_schema_field_can_survive_cycles.Book'
+
+    assert path not in types
+    assert types.resolve(path) is Book
+    assert path in types
+    assert types.resolve(path) is Book
+
+
+def test_schema_can_be_registered_under_short_name():
+    class Pebble(field.SchemaField):
+        fields = [
+            field.IntField('weight'),
+        ]
+
+    registry.register(Pebble, 'RegistryTestPebble')
+
+    bag = field.SchemaField('bag', fields=[
+        field.CollectionField('pebbles', 'RegistryTestPebble'),
+        field.SchemaField('biggest', 'RegistryTestPebble'),
+    ])
+
+    bag.loads({
+        'pebbles': [{'weight': '1'}, {'weight': 2}],
+        'biggest': {'weight': 3},
+    })
+
+    assert bag == {
+        'pebbles': [{'weight': 1}, {'weight': 2}],
+        'biggest': {'weight': 3},
+    }
+
+
+def test_names_cannot_be_rebound():
+    types = registry.TypeRegistry()
+
+    types.register(Address, 'Address')
+    # registering the same class is fine
+    types.register(Address, 'Address')
+
+    assert types.resolve('Address') is Address
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        types.register(BusinessAddress, 'Address')
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        types.resolve('Book')
+
+
+def test_preload_resolves_references_recursively_and_freeze_locks():
+    types = registry.TypeRegistry()
+
+    types.preload(Author)
+
+    assert 'tests.test_schema_field_can_survive_cycles.Book' in types
+    assert 'tests.test_schema_field_can_survive_cycles.Author' in types
+    assert 'tests.test_schema_field_can_survive_cycles.BusinessAddress' \
+        in types
+
+    types.freeze()
+
+    assert types.is_frozen
+    assert types.resolve(
+        'tests.test_schema_field_can_survive_cycles.Book') is Book
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        types.resolve('tests.test_string_field.Unknown')
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        types.register(Address)
@@ -0,0 +1,160 @@
+"""Checks if compiled plans of SchemaField are shared between instances.
+"""
+
+import gc
+import weakref
+
+from python_schema import field, plan
+
+from .test_schema_field_can_survive_cycles import Author, Book
+
+
+PAYLOAD = {
+    'title': 'Chapter I',
+    'author': {
+        'name': 'drachenfels',
+        'books': [{
+            'title': 'Chapter I',
+        }, {
+            'title': 'Chapter II',
+        }],
+        'home_address': {
+            'postcode': 'aaa1',
+            'street': 'st. James',
+        },
+    },
+}
+
+
+def test_plan_is_compiled_once_per_schema_class():
+    book_one = Book()
+    book_two = Book()
+
+    book_one.loads(PAYLOAD)
+    book_two.loads(PAYLOAD)
+
+    assert book_one._plan is book_two._plan
+    assert book_one._plan.schema is Book
+    assert list(book_one._plan.fields) == ['title', 'author']
+    assert book_one._plan.field_names == {'title', 'author'}
+
+    # every nested author and book (even those inside collection) reuse the
+    # very same plans
+    author = book_one['author']
+    author_plan = author._plan
+
+    assert author_plan is book_two['author']._plan
+    assert author_plan.schema is Author
+    assert author['books'][0]._plan is book_one._plan
+    assert author['books'][1]._plan is book_one._plan
+
+    assert book_one._plan.children['author'] is author_plan
+    assert author_plan.children['books'] is book_one._plan
+
+
+def test_fields_of_plan_are_read_only():
+    book = Book()
+    book.loads(PAYLOAD)
+
+    compiled = book._plan
+
+    try:
+        compiled.fields['title'] = None
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('Plan fields can be altered')
+
+    assert compiled.unknown_keys(['title', 'pages']) == {'pages'}
+
+
+def test_fields_override_has_its_own_plan():
+    class User(field.SchemaField):
+        fields = [
+            field.StrField('name'),
+        ]
+
+    user = User()
+    admin = User(fields=[field.StrField('role')])
+
+    user.loads({'name': 'Frank'})
+    admin.loads({'name': 'Frank', 'role': 'admin'})
+
+    assert user._plan is not admin._plan
+    assert user._plan is plan.get_plan(User, User.fields)
+    assert list(admin._plan.fields) == ['name', 'role']
+
+
+def test_make_new_shares_materialisation():
+    user = field.SchemaField('user', fields=[
+        field.StrField('name'),
+        field.IntField('age'),
+    ])
+
+    user.loads({'name': 'Frank', 'age': '35'})
+
+    copy = user.make_new()
+
+    assert copy.is_materialised
+    assert copy._plan is user._plan
+
+    copy.loads({'name': 'John', 'age': '12'})
+
+    assert copy == {'name': 'John', 'age': 12}
+    assert user == {'name': 'Frank', 'age': 35}
+
+    # changing structure of the field means materialisation has to happen
+    # again
+    other = user.make_new(fields=[field.StrField('nickname')])
+
+    assert not other.is_materialised
+
+
+def test_unused_lazy_references_are_never_resolved():
+    schema = field.SchemaField('user', fields=[
+        field.StrField('name'),
+        field.SchemaField('ghost', 'tests.does_not_exist.Ghost'),
+        field.CollectionField('ghosts', 'tests.does_not_exist.Ghost'),
+    ])
+
+    schema.loads({'name': 'Frank'})
+
+    assert schema == {'name': 'Frank'}
+    assert dict(schema._plan.children) == {}
+
+
+def test_plans_of_inline_schemas_are_not_kept_forever():
+    def load():
+        # new override every call, ie. schema built inside of a view
+        schema = field.SchemaField('user', fields=[field.StrField('name')])
+        schema.loads({'name': 'Frank'})
+
+        return schema._plan
+
+    first = load()
+
+    for _ in range(plan.MAX_PLANS):
+        load()
+
+    plans = plan._plans[field.SchemaField]
+
+    assert len(plans) == plan.MAX_PLANS
+    assert first not in plans.values()
+
+
+def test_plans_are_forgotten_with_schema_class():
+    class Temporary(field.SchemaField):
+        fields = [
+            field.StrField('name'),
+        ]
+
+    Temporary().loads({'name': 'Frank'})
+
+    assert Temporary in plan._plans
+
+    schema = weakref.ref(Temporary)
+
+    del Temporary
+    gc.collect()
+
+    assert schema() is None
@@ -0,0 +1,219 @@
+"""Checks if partial update of loaded schema is the same as loading merged
+payload again.
+"""
+
+import pytest
+
+from python_schema import exception, field
+
+
+loaded_keys = []
+
+
+def record(value):
+    loaded_keys.append(value)
+
+    return True
+
+
+def has_title_or_subtitle(value):
+    if value.get('title') is None and value.get('subtitle') is None:
+        return 'Title or subtitle is required'
+
+    return True
+
+
+class Address(field.SchemaField):
+    fields = [
+        field.StrField('street'),
+        field.StrField('city', validators=[record]),
+    ]
+
+
+class Document(field.SchemaField):
+    validators = [has_title_or_subtitle]
+
+    keep_payload = True
+
+    fields = [
+        field.IntField('id', validators=[record]),
+        field.StrField('title'),
+        field.StrField('subtitle'),
+        field.SchemaField('address', Address),
+        field.CollectionField('tags', field.StrField),
+    ]
+
+
+PAYLOAD = {
+    'id': 1,
+    'title': 'Title',
+    'address': {'street': 'Baker st.', 'city': 'London'},
+    'tags': ['a', 'b'],
+}
+
+
+def loaded(payload=PAYLOAD, **kwargs):
+    document = Document(**kwargs)
+    document.loads(payload)
+
+    return document
+
+
+def test_update_is_the_same_as_full_reload():
+    for partial, merged in [
+        ({'title': 'Other'}, dict(PAYLOAD, title='Other')),
+        ({'address': {'city': 'Paris'}}, dict(
+            PAYLOAD, address={'street': 'Baker st.', 'city': 'Paris'})),
+        ({'address': None}, dict(PAYLOAD, address=None)),
+        ({'tags': ['c']}, dict(PAYLOAD, tags=['c'])),
+        ({'subtitle': 'Sub', 'id': '2'}, dict(PAYLOAD, subtitle='Sub', id=2)),
+        ({}, PAYLOAD),
+    ]:
+        document = loaded()
+        document.update(partial)
+
+        assert document.as_python() == loaded(merged).as_python()
+
+        # merged payload is kept for the next update
+        document.update({'title': 'Next'})
+
+        assert document.as_python() == loaded(
+            dict(merged, title='Next')).as_python()
+
+
+def test_update_loads_only_changed_keys():
+    document = loaded()
+
+    del loaded_keys[:]
+
+    document.update({'title': 'Other', 'address': {'street': 'Main st.'}})
+
+    # neither id nor address.city were loaded again
+    assert loaded_keys == []
+
+    document.update({'address': {'city': 'Paris'}})
+
+    assert loaded_keys == ['Paris']
+    assert document.value['address'].parent is document
+
+
+def test_changes_of_payload_by_caller_are_not_merged():
+    payload = {
+        'id': 1,
+        'title': 'Title',
+        'address': {'street': 'Baker st.', 'city': 'London'},
+        'tags': ['a'],
+    }
+
+    document = loaded(payload)
+
+    partial = {'title': 'Other', 'address': {'city': 'Paris'}}
+
+    document.update(partial)
+
+    # caller reuses payloads it gave to the schema
+    payload['title'] = None
+    payload['address']['street'] = None
+    payload['tags'].append('b')
+    partial['address']['city'] = None
+
+    document.update({'id': 2})
+
+    assert document.as_python() == {
+        'id': 2,
+        'title': 'Other',
+        'address': {'street': 'Baker st.', 'city': 'Paris'},
+        'tags': ['a'],
+    }
+
+
+def test_update_runs_validators_of_schema():
+    document = loaded()
+
+    document.update({'subtitle': 'Sub'})
+    document.update({'title': None})
+
+    with pytest.raises(exception.ValidationError):
+        document.update({'subtitle': None})
+
+    assert document.errors == ['Title or subtitle is required']
+    assert not document.is_set
+
+
+def test_update_fails_the_same_way_loads_does():
+    for partial, error in [
+        ({'unknown': 1}, exception.UnknownFieldError),
+        ({'id': 'abc'}, exception.NormalisationError),
+        ({'address': {'unknown': 1}}, exception.UnknownFieldError),
+    ]:
+        document = loaded()
+
+        with pytest.raises(error) as info:
+            document.update(partial)
+
+        expected = Document()
+
+        with pytest.raises(error) as expected_info:
+            expected.loads(Document()._merge(PAYLOAD, partial))
+
+        assert str(info.value) == str(expected_info.value)
+        assert document.errors == expected.errors
+        assert not document.is_set
+
+
+def test_update_of_lazy_and_unloaded_schema():
+    document = loaded(lazy=True)
+    document.update({'address': {'city': 'Paris'}, 'title': 'Other'})
+
+    assert document.as_python() == loaded(dict(
+        PAYLOAD, title='Other',
+        address={'street': 'Baker st.', 'city': 'Paris'})).as_python()
+
+    document = Document()
+    document.update({'id': 1, 'title': 'Title'})
+
+    assert document.as_python() == {'id': 1, 'title': 'Title'}
+
+
+def test_failing_nested_update_is_reported_from_the_schema():
+    for partial in [
+        {'address': {'city': 12, 'unknown': 1}},
+        {'address': {'street': 'Main st.', 'other': None}},
+    ]:
+        document = loaded()
+
+        with pytest.raises(exception.PayloadError) as info:
+            document.update(partial)
+
+        expected = Document()
+
+        with pytest.raises(exception.PayloadError) as expected_info:
+            expected.loads(Document()._merge(PAYLOAD, partial))
+
+        assert exception.describe(info.value) == \
+            exception.describe(expected_info.value)
+        assert exception.describe(info.value)[0]['path'][0] == \
+            'address'
+
+
+def test_payload_is_kept_only_when_configured():
+    document = Document(keep_payload=False)
+    document.loads(PAYLOAD)
+
+    with pytest.raises(exception.SchemaConfigurationError):
+        document.update({'title': 'Other'})
+
+    # configuration is passed down to nested schemas
+    document = loaded()
+
+    assert document['address'].keep_payload is True
+
+    # pending fields of lazy schema are not copied until they are loaded
+    payload = dict(PAYLOAD, address={'street': 'Baker st.', 'city': 'London'})
+
+    document = loaded(payload, lazy=True)
+
+    payload['address']['city'] = 'Paris'
+
+    assert document.as_python()['address'] == {
+        'street': 'Baker st.', 'city': 'Paris'}
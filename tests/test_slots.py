@@ -0,0 +1,150 @@
+"""Checks if builtin fields are compact and subclasses still work as usual.
+"""
+
+import pickle
+
+from python_schema import field
+
+
+class User(field.SchemaField):
+    exception_on_unknown = False
+
+    fields = [
+        field.StrField('name', allow_none=False),
+        field.CollectionField('tags', field.StrField),
+    ]
+
+
+class Nickname(field.StrField):
+    description = 'Nickname of the user'
+    allow_none = False
+
+
+def test_builtin_fields_have_no_dict():
+    for instance in [
+        field.BaseField('base'),
+        field.IntField('age'),
+        field.StrField('name'),
+        field.CollectionField('tags', field.StrField),
+        field.SchemaField('row', fields=[field.IntField('id')]),
+    ]:
+        assert not hasattr(instance, '__dict__')
+
+        instance.materialise()
+
+        assert not hasattr(instance.make_new(), '__dict__')
+
+
+def test_defaults_are_taken_from_class():
+    instance = field.CollectionField('tags', field.StrField)
+
+    assert instance.lazy is False
+    assert instance.chunk_size == 1000
+    assert instance.description == ''
+
+    nickname = Nickname('nickname')
+
+    assert nickname.description == 'Nickname of the user'
+    assert nickname.allow_none is False
+
+
+class Age(field.IntField):
+    __slots__ = ()
+
+    allow_none = False
+
+
+class Percent(field.IntField):
+    __slots__ = ('upper',)
+
+    def __init__(self, *args, upper=100, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.upper = upper
+
+    def normalise(self, value):
+        return min(super().normalise(value), self.upper)
+
+
+def test_slots_of_subclass_are_copied_with_configuration():
+    progress = field.SchemaField('progress', fields=[
+        Percent('done', upper=50),
+        field.CollectionField('steps', Percent('step', upper=10)),
+    ])
+
+    progress.loads({'done': '70', 'steps': [5, 20]})
+
+    assert progress.as_python() == {'done': 50, 'steps': [5, 10]}
+    assert not hasattr(progress['done'], '__dict__')
+
+    clone = progress['steps'][1].make_new(name='other')
+
+    assert clone.upper == 10
+    assert clone.name == 'other'
+
+
+def test_defaults_can_be_read_from_class():
+    assert field.BaseField.allow_none is True
+    assert field.BaseField.validators is None
+    assert field.CollectionField.chunk_size == 1000
+    assert field.SchemaField.exception_on_unknown is True
+    assert field.SchemaField.fields is None
+
+    assert Nickname.allow_none is False
+    assert User.exception_on_unknown is False
+    assert User.lazy is False
+
+
+def test_slotted_subclass_configured_with_class_attributes():
+    assert Age.allow_none is False
+
+    age = Age('age')
+
+    assert not hasattr(age, '__dict__')
+    assert age.allow_none is False
+    assert Age('age', allow_none=True).allow_none is True
+
+
+def test_fields_of_parent_can_be_extended():
+    class Admin(User):
+        fields = User.fields + [
+            field.StrField('role'),
+        ]
+
+    admin = Admin()
+    admin.loads({'name': 'Frank', 'role': 'admin'})
+
+    assert admin.as_python() == {'name': 'Frank', 'role': 'admin'}
+
+
+def test_subclass_configured_with_class_attributes():
+    user = User()
+
+    assert user.exception_on_unknown is False
+
+    user.loads({'name': 'Frank', 'tags': ['a'], 'unknown': True})
+
+    clone = user.make_new()
+
+    assert clone.exception_on_unknown is False
+    assert clone.fields is User.fields
+
+    clone.loads({'name': 'John'})
+
+    assert clone.as_python() == {'name': 'John'}
+    assert user.as_python() == {'name': 'Frank', 'tags': ['a']}
+
+
+def test_slotted_fields_can_be_pickled():
+    instance = field.CollectionField('tags', field.IntField, chunk_size=5)
+    instance.loads(['1', 2])
+
+    loaded = pickle.loads(pickle.dumps(instance))
+
+    assert loaded.chunk_size == 5
+    assert loaded.as_python() == [1, 2]
+
+    user = User()
+    user.loads({'name': 'Frank'})
+
+    assert pickle.loads(pickle.dumps(user)).as_python() == {'name': 'Frank'}
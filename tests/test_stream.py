@@ -0,0 +1,137 @@
+"""Checks if newline-delimited JSON can be validated as a stream.
+"""
+
+import io
+import json
+import tracemalloc
+
+from python_schema import field, stream
+
+
+class User(field.SchemaField):
+    fields = [
+        field.StrField('name'),
+        field.IntField('age'),
+    ]
+
+
+LINES = [
+    '{"name": "Frank", "age": "35"}',
+    '',
+    '{"name": "John", "age": "old"}',
+    '{"name": "Jane", "nickname": "jj"}',
+    '{"name": "Jim"',
+    '{"name": "Joe", "age": 12}',
+]
+
+
+def test_stream_yields_results_and_errors_per_line(tmpdir):
+    path = tmpdir.join('users.ndjson')
+    path.write('\n'.join(LINES) + '\n')
+
+    stats = stream.Stats()
+
+    results = list(stream.ndjson(str(path), User, stats=stats))
+
+    assert [line_no for line_no, _ in results] == [1, 3, 4, 5, 6]
+
+    assert results[0][1] == {'name': 'Frank', 'age': 35}
+    assert results[1][1] == ['IntField cannot be populated with value: old']
+    assert results[2][1] == ['Unexpected payload with key(s): nickname']
+    assert results[3][1][0].startswith('Invalid JSON: ')
+    assert results[4][1].as_python() == {'name': 'Joe', 'age': 12}
+
+    report = stats.as_dict()
+
+    assert report['lines'] == 6
+    assert report['valid'] == 2
+    assert report['invalid'] == 3
+    assert report['bytes'] == len('\n'.join(LINES)) + 1
+    assert report['elapsed'] > 0
+
+
+def test_lines_that_are_not_objects_are_reported():
+    fp = io.StringIO('[1]\n3\n{"name": "Żaneta", "age": 1}\nnull\n')
+
+    stats = stream.Stats()
+
+    results = list(stream.ndjson(fp, User, stats=stats))
+
+    assert [line_no for line_no, _ in results] == [1, 2, 3, 4]
+    assert results[0][1] == [
+        'Invalid payload: expected JSON object, got list']
+    assert results[1][1] == [
+        'Invalid payload: expected JSON object, got int']
+    assert results[2][1] == {'name': 'Żaneta', 'age': 1}
+    assert results[3][1].value is None
+
+    assert stats.valid == 2
+    assert stats.invalid == 2
+    # text is counted in bytes as well
+    assert stats.bytes == len(fp.getvalue().encode())
+
+
+class Team(field.SchemaField):
+    fields = [
+        field.StrField('name'),
+        User('captain'),
+        field.CollectionField('members', User),
+    ]
+
+
+def test_nested_values_that_are_not_objects_are_reported():
+    fp = io.StringIO(
+        '{"captain": "Frank"}\n'
+        '{"members": [{"name": "Jane"}, ["John"]]}\n'
+        '{"name": "Team", "captain": {"name": "Frank"}}\n')
+
+    stats = stream.Stats()
+
+    results = list(stream.ndjson(fp, Team, stats=stats))
+
+    assert [line_no for line_no, _ in results] == [1, 2, 3]
+    assert results[0][1][0].code == 'not_mapping'
+    assert results[0][1][0].path == ('captain',)
+    assert results[1][1][0].code == 'invalid_items'
+    assert results[2][1]['captain']['name'] == 'Frank'
+
+    assert stats.valid == 1
+    assert stats.invalid == 2
+
+
+def test_stream_is_lazy():
+    fp = io.StringIO('\n'.join(LINES))
+
+    results = stream.ndjson(fp, User(), chunk_size=1)
+
+    line_no, user = next(results)
+
+    assert line_no == 1
+    assert user['name'] == 'Frank'
+    # only what was needed was read
+    assert fp.tell() == len(LINES[0]) + 1
+
+
+def make_file(lines):
+    payload = json.dumps({'name': 'Frank', 'age': 35}).encode() + b'\n'
+
+    return io.BytesIO(payload * lines)
+
+
+def peak_memory(fp):
+    tracemalloc.start()
+
+    try:
+        for _ in stream.ndjson(fp, User, chunk_size=16 * 1024):
+            pass
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_use_does_not_depend_on_size_of_file():
+    small = peak_memory(make_file(2000))
+    big = peak_memory(make_file(20000))
+
+    assert big < small * 2